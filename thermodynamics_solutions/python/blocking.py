@@ -0,0 +1,226 @@
+"""
+Blocked Evaluation with Output Buffers
+Cache-sized row blocks, out= arguments and fused workspaces - Python Computational Solutions
+"""
+
+import functools
+import inspect
+
+import numpy as np
+
+# Elements per operand block: 16384 float64 = 128 kB, so the inputs,
+# output and a few temporaries of one block stay in L2 between the
+# ufunc passes of a formula instead of streaming through memory each time.
+BLOCK = 16384
+
+#=============================================================================
+# Row Blocks over a Broadcast Shape
+#=============================================================================
+def _row_blocks(shape, block):
+    """(lo, hi) ranges over axis 0 of shape with about block elements each."""
+    if not shape:
+        return [(0, 1)]
+    row = int(np.prod(shape[1:], dtype=np.int64))
+    rows = max(block // max(row, 1), 1)
+    return [(lo, min(lo + rows, shape[0])) for lo in range(0, shape[0], rows)] or [(0, 0)]
+
+def _slicer(values, shape):
+    """Slice a value along axis 0 of the broadcast shape if it spans that axis."""
+    spans = [isinstance(v, np.ndarray) and v.ndim == len(shape) and v.ndim > 0
+             and v.shape[0] == shape[0] and shape[0] > 1 for v in values]
+
+    def take(lo, hi):
+        return [v[lo:hi] if s else v for v, s in zip(values, spans)]
+    return take
+
+#=============================================================================
+# Generic Blocked Evaluation
+#=============================================================================
+def _allocate(part, shape, m):
+    """
+    Output buffers for the leaves of part that run along the blocked axis:
+    those with the full rank of the broadcast shape, m rows and trailing
+    axes that broadcast against it. Other leaves (e.g. depending only on
+    an argument of lower rank) get no buffer and pass through.
+    """
+    if isinstance(part, dict):
+        return {k: _allocate(v, shape, m) for k, v in part.items()}
+    if isinstance(part, tuple):
+        return tuple(_allocate(v, shape, m) for v in part)
+    if (isinstance(part, np.ndarray) and part.ndim == len(shape) and part.ndim
+            and part.shape[0] == m
+            and all(d in (1, s) for d, s in zip(part.shape[1:], shape[1:]))):
+        return np.empty((shape[0],) + part.shape[1:], part.dtype)
+    return None
+
+def _fill(out, part, lo, hi):
+    """Copy one block into out; leaves without a buffer are taken as computed."""
+    if isinstance(part, dict):
+        return {k: _fill(None if out is None else out.get(k), v, lo, hi) for k, v in part.items()}
+    if isinstance(part, tuple):
+        return tuple(_fill(None if out is None else o, v, lo, hi)
+                     for o, v in zip(out or (None,) * len(part), part))
+    if out is None:
+        return part
+    out[lo:hi] = part
+    return out
+
+def blockwise(func, block=BLOCK):
+    """
+    Give an array function an out= keyword and evaluate it in row blocks.
+
+    Array arguments are broadcast together and every argument spanning
+    the leading axis is sliced into blocks of about `block` elements, so
+    the temporaries of the formula are block-sized. Results running
+    along that axis are written to out (allocated if None): an array,
+    tuple or dict mirroring the function's result, with None for leaves
+    that do not depend on the blocked axis. Inputs small enough for one
+    block without an out are evaluated directly, as before.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, out=None, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        names = [k for k, v in bound.arguments.items() if isinstance(v, np.ndarray) and v.ndim]
+        if not names:
+            return _fill(out, func(*args, **kwargs), 0, 1) if out is not None else func(*args, **kwargs)
+        shape = np.broadcast_shapes(*(bound.arguments[k].shape for k in names))
+        blocks = _row_blocks(shape, block)
+        if out is None and len(blocks) == 1:
+            return func(*args, **kwargs)
+        take = _slicer([bound.arguments[k] for k in names], shape)
+        result = None
+        for lo, hi in blocks:
+            bound.arguments.update(zip(names, take(lo, hi)))
+            part = func(*bound.args, **bound.kwargs)
+            if out is None:
+                out = _allocate(part, shape, hi - lo)
+            result = _fill(out, part, lo, hi)
+        return result
+
+    params = list(signature.parameters.values())
+    wrapper.__signature__ = signature.replace(
+        parameters=params + [inspect.Parameter('out', inspect.Parameter.KEYWORD_ONLY, default=None)])
+    return wrapper
+
+#=============================================================================
+# Fused Kernels with Workspaces
+#=============================================================================
+def _block_size(shape, block):
+    """Elements in the largest row block: whole rows, at least one."""
+    lo, hi = _row_blocks(shape, block)[0]
+    return (hi - lo) * int(np.prod(shape[1:], dtype=np.int64))
+
+def workspace(shape, n_work=1, dtype=np.float64, block=BLOCK):
+    """
+    Scratch buffer for fused_blocks over arguments broadcasting to shape.
+
+    A block is made of whole rows: as many as fit in `block` elements,
+    or a single row when rows are longer. The buffer holds n_work such
+    blocks, i.e. at most n_work * max(block, row length) elements.
+    """
+    return np.empty(n_work * _block_size(tuple(shape), block), dtype)
+
+def fused_blocks(kernel, args, n_out=1, n_work=0, out=None, work=None, block=BLOCK):
+    """
+    Run an in-place kernel over row blocks of the broadcast arguments.
+
+    kernel(*args_block, *out_block, *work_block) writes every result
+    through ufunc out= arguments, so apart from the outputs the only
+    memory touched is n_work block-sized scratch arrays.
+
+    Parameters:
+        kernel: function of the argument, output and workspace blocks
+        args: arguments (arrays and scalars; Python scalars stay weak)
+        n_out: number of outputs
+        n_work: scratch arrays the kernel needs
+        out: output array, or tuple of n_out arrays (allocated if None)
+        work: 1-D scratch buffer from workspace(shape, n_work, dtype)
+              or larger (reused across calls; allocated if None)
+        block: elements per block
+
+    Returns:
+        the output array (0-d results as scalars), or a tuple of them
+    """
+    arrays = [a for a in args if isinstance(a, np.ndarray)]
+    shape = np.broadcast_shapes(*(a.shape for a in arrays))
+    dtype = np.result_type(*args, 1.0)
+    if out is None:
+        out = tuple(np.empty(shape, dtype) for _ in range(n_out))
+    elif n_out == 1 and isinstance(out, np.ndarray):
+        out = (out,)
+    blocks = _row_blocks(shape, block)
+    row = int(np.prod(shape[1:], dtype=np.int64))
+    size = _block_size(shape, block)
+    if work is None:
+        work = np.empty(n_work * size, dtype)
+    elif work.size < n_work * size or work.dtype != dtype:
+        raise ValueError(f"work must hold {n_work * size} elements of {dtype}")
+
+    take = _slicer(args, shape)
+    take_out = _slicer(out, shape)
+    for lo, hi in blocks:
+        block_shape = (hi - lo,) + shape[1:] if shape else ()
+        m = (hi - lo) * row
+        scratch = [work[i*size:i*size + m].reshape(block_shape) for i in range(n_work)]
+        kernel(*take(lo, hi), *take_out(lo, hi), *scratch)
+
+    out = tuple(o[()] if o.ndim == 0 else o for o in out)
+    return out[0] if n_out == 1 else out
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+
+    from chapter2_entropy import problem_1039
+    from chapter3_functions import adiabatic_atmosphere, scale_height
+
+    def unfused_1039(T0, W, alpha):
+        term = 1 + 4*alpha*T0/W
+        return T0 + (W/(2*alpha)) * (1 + np.sqrt(term))
+
+    print("=" * 60)
+    print("Blocked Evaluation: out= Buffers and Fused Workspaces")
+    print("=" * 60)
+    n = 50_000_000
+    T0 = np.random.default_rng(2).uniform(230.0, 300.0, n)
+    out = np.zeros(n)
+    work = np.empty(2 * BLOCK)
+    problem_1039(T0[:10], 1000.0, 50.0)
+    for label, run in [('unfused formula', lambda: unfused_1039(T0, 1000.0, 50.0)),
+                       ('fused, out= + work=', lambda: problem_1039(T0, 1000.0, 50.0,
+                                                                    out=out, work=work))]:
+        start = time.perf_counter()
+        Te = run()
+        elapsed = time.perf_counter() - start
+        del Te
+        tracemalloc.start()
+        Te = run()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del Te
+        print(f"  problem_1039, {n:.0e} points, {label}: {elapsed:.2f} s, "
+              f"{peak/1e6:.0f} MB allocated beyond the inputs")
+    print(f"    identical results: {np.array_equal(out, unfused_1039(T0, 1000.0, 50.0))}")
+    del T0
+
+    z = np.linspace(0.0, 15e3, 1000)
+    T_sea = np.linspace(250.0, 320.0, 20_000)[:, None]
+    tracemalloc.start()
+    start = time.perf_counter()
+    p, T, dTdz = adiabatic_atmosphere(z, 101325.0, T_sea, 0.029, 1.4)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"  adiabatic_atmosphere, 2e4 × 1000 grid: {elapsed:.2f} s, "
+          f"peak {peak/1e6:.0f} MB for {(p.nbytes + T.nbytes)/1e6:.0f} MB of output")
+
+    H = np.empty(T_sea.size)
+    scale_height(T_sea.ravel(), 0.029, out=H)
+    print(f"  scale_height into a preallocated buffer: H(288 K) = "
+          f"{np.interp(288.0, T_sea.ravel(), H)/1e3:.2f} km")
+    print()
@@ -6,6 +6,9 @@ Problems 1031-1072 - Python Computational Solutions
 import numpy as np
 import matplotlib.pyplot as plt
 
+from blocking import blockwise, fused_blocks
+from precision import narrow, precision_policy, wide
+
 # Physical Constants
 R = 8.314  # J/(mol·K) - Universal gas constant
 R_cal = 1.987  # cal/(mol·K)
@@ -14,6 +17,8 @@ sigma = 5.67e-8  # W/(m^2·K^4) - Stefan-Boltzmann constant
 #=============================================================================
 # Problem 1031: Steam Turbine Maximum Work
 #=============================================================================
+@precision_policy
+@blockwise
 def problem_1031(T_intake_C, T_exhaust_C, Q):
     """
     Calculate maximum work from steam turbine.
@@ -30,28 +35,19 @@ def problem_1031(T_intake_C, T_exhaust_C, Q):
     T1 = T_intake_C + 273.15  # K
     T2 = T_exhaust_C + 273.15  # K
     
-    efficiency = 1 - T2/T1
+    efficiency = (T_intake_C - T_exhaust_C) / T1  # 1 - T2/T1
     W_max = efficiency * Q
     
     return W_max, efficiency
 
-print("=" * 60)
-print("Problem 1031: Steam Turbine Maximum Work")
-print("=" * 60)
-Q = 1000  # arbitrary heat input
-W_max, eta = problem_1031(400, 150, Q)
-print(f"Intake temperature: 400°C = 673 K")
-print(f"Exhaust temperature: 150°C = 423 K")
-print(f"Carnot efficiency: η = {eta:.3f} = {eta*100:.1f}%")
-print(f"Maximum work: W_max = {eta:.3f} × Q")
-print()
-
 #=============================================================================
 # Problem 1032: Carnot Cycle Efficiency
 #=============================================================================
+@precision_policy
+@blockwise
 def carnot_efficiency(T_hot, T_cold):
     """Calculate Carnot efficiency."""
-    return 1 - T_cold / T_hot
+    return (T_hot - T_cold) / T_hot  # 1 - T_cold/T_hot
 
 def plot_carnot_cycle():
     """Plot Carnot cycle on pV and TS diagrams."""
@@ -104,20 +100,11 @@ def plot_carnot_cycle():
     plt.close()
     print("Saved: carnot_cycle.png")
 
-print("=" * 60)
-print("Problem 1032: Carnot Cycle")
-print("=" * 60)
-T_hot, T_cold = 600, 300
-eta = carnot_efficiency(T_hot, T_cold)
-print(f"Hot reservoir: T₁ = {T_hot} K")
-print(f"Cold reservoir: T₂ = {T_cold} K")
-print(f"Carnot efficiency: η = 1 - T₂/T₁ = {eta:.3f} = {eta*100:.1f}%")
-plot_carnot_cycle()
-print()
-
 #=============================================================================
 # Problem 1035: Two Bodies with Carnot Engine
 #=============================================================================
+@precision_policy
+@blockwise
 def problem_1035(T1, T2, N, C):
     """
     Calculate final temperature and work from two bodies.
@@ -132,24 +119,31 @@ def problem_1035(T1, T2, N, C):
         W: work delivered
     """
     Tf = np.sqrt(T1 * T2)
-    W = N * C * (T1 + T2 - 2*Tf)
+    # T1 + T2 - 2Tf = (√T1 - √T2)² = (T1 - T2)²/(√T1 + √T2)², free of cancellation
+    W = N * C * ((T1 - T2) / (np.sqrt(T1) + np.sqrt(T2)))**2
     return Tf, W
 
-print("=" * 60)
-print("Problem 1035: Two Bodies with Carnot Engine")
-print("=" * 60)
-T1, T2 = 400, 300  # K
-N, C = 1, R  # 1 mole, heat capacity = R
-Tf, W = problem_1035(T1, T2, N, C)
-print(f"Initial temperatures: T₁ = {T1} K, T₂ = {T2} K")
-print(f"Final temperature: Tf = √(T₁T₂) = {Tf:.1f} K")
-print(f"Work delivered: W = NC(T₁ + T₂ - 2Tf) = {W:.1f} J")
-print()
-
 #=============================================================================
 # Problem 1039: Heat Pump Building Temperature
 #=============================================================================
-def problem_1039(T0, W, alpha):
+def _heat_pump_kernel(T0, W, alpha, Te, w):
+    """Te = T0 + (W/2α)[1 + √(1 + 4αT0/W)] in place, in the formula's operation order."""
+    # factors of scalar parameters stay scalars; array ones go through the workspace
+    four_alpha = np.multiply(4, alpha, out=w) if np.ndim(alpha) else 4*alpha
+    np.multiply(four_alpha, T0, out=Te)
+    np.divide(Te, W, out=Te)
+    np.add(1, Te, out=Te)
+    np.sqrt(Te, out=Te)
+    np.add(1, Te, out=Te)
+    if np.ndim(W) or np.ndim(alpha):
+        half = np.divide(W, np.multiply(2, alpha, out=w), out=w)
+    else:
+        half = W/(2*alpha)
+    np.multiply(half, Te, out=Te)
+    np.add(T0, Te, out=Te)
+
+@precision_policy
+def problem_1039(T0, W, alpha, out=None, work=None):
     """
     Calculate equilibrium temperature of building with heat pump.
     
@@ -157,37 +151,20 @@ def problem_1039(T0, W, alpha):
         T0: outside temperature (K)
         W: power consumed by heat pump (W)
         alpha: heat loss coefficient (W/K)
+        out: array for Te (allocated if None)
+        work: scratch buffer from blocking.workspace(shape of Te), reused
+              across calls; it holds max(BLOCK, row length) elements
     
     Returns:
         Te: equilibrium temperature (K)
     """
-    # Te = T0 + (W/2α)[1 + √(1 + 4αT0/W)]
-    term = 1 + 4*alpha*T0/W
-    Te = T0 + (W/(2*alpha)) * (1 + np.sqrt(term))
-    return Te
-
-print("=" * 60)
-print("Problem 1039: Heat Pump Building Temperature")
-print("=" * 60)
-T0 = 273  # K (0°C outside)
-W = 1000  # W
-alpha = 50  # W/K
-
-Te_pump = problem_1039(T0, W, alpha)
-Te_heater = T0 + W/alpha
-
-print(f"Outside temperature: T₀ = {T0} K = {T0-273}°C")
-print(f"Power: W = {W} W")
-print(f"Heat loss coefficient: α = {alpha} W/K")
-print()
-print(f"With heat pump: Te = {Te_pump:.1f} K = {Te_pump-273:.1f}°C")
-print(f"With simple heater: Te' = {Te_heater:.1f} K = {Te_heater-273:.1f}°C")
-print(f"Heat pump advantage: ΔT = {Te_pump - Te_heater:.1f} K")
-print()
+    return fused_blocks(_heat_pump_kernel, (T0, W, alpha), n_work=1, out=out, work=work)
 
 #=============================================================================
 # Problem 1040: Heat Pump COP
 #=============================================================================
+@precision_policy
+@blockwise
 def problem_1040(T1_C, T2_C):
     """
     Calculate heat pump coefficient of performance.
@@ -201,23 +178,14 @@ def problem_1040(T1_C, T2_C):
     """
     T1 = T1_C + 273.15
     T2 = T2_C + 273.15
-    COP = T2 / (T2 - T1)
+    COP = T2 / (T2_C - T1_C)  # T2 - T1 without rounding the 273.15 offset
     return COP
 
-print("=" * 60)
-print("Problem 1040: Heat Pump Coefficient of Performance")
-print("=" * 60)
-T1_C, T2_C = 2, 27  # °C
-COP = problem_1040(T1_C, T2_C)
-print(f"Outside temperature: {T1_C}°C = {T1_C + 273.15} K")
-print(f"Inside temperature: {T2_C}°C = {T2_C + 273.15} K")
-print(f"COP = T₂/(T₂-T₁) = {COP:.1f}")
-print(f"For every 1 J of work, {COP:.1f} J of heat is delivered")
-print()
-
 #=============================================================================
 # Problem 1044: Entropy Change on Heating Silver
 #=============================================================================
+@precision_policy
+@blockwise
 def problem_1044(T1_C, T2_C, Cv_cal):
     """
     Calculate entropy change when heating at constant volume.
@@ -230,23 +198,15 @@ def problem_1044(T1_C, T2_C, Cv_cal):
         delta_S: entropy change (cal/K)
     """
     T1 = T1_C + 273.15
-    T2 = T2_C + 273.15
     n = 1  # gram-atomic weight = 1 mole
-    delta_S = n * Cv_cal * np.log(T2/T1)
+    delta_S = n * Cv_cal * np.log1p((T2_C - T1_C) / T1)  # ln(T2/T1)
     return delta_S
 
-print("=" * 60)
-print("Problem 1044: Entropy Change Heating Silver")
-print("=" * 60)
-delta_S = problem_1044(0, 30, 5.85)
-print(f"Heating from 0°C to 30°C at constant volume")
-print(f"Cv = 5.85 cal/mol·K")
-print(f"ΔS = Cv ln(T₂/T₁) = {delta_S:.2f} cal/K")
-print()
-
 #=============================================================================
 # Problem 1046: Entropy Change - Water Heating
 #=============================================================================
+@precision_policy
+@blockwise
 def problem_1046(m_kg, T1_C, T2_C, C_water=4.18):
     """
     Calculate entropy changes when water is heated by reservoir.
@@ -263,17 +223,20 @@ def problem_1046(m_kg, T1_C, T2_C, C_water=4.18):
     T1 = T1_C + 273.15
     T2 = T2_C + 273.15
     
-    # Entropy change of water
-    delta_S_water = m_g * C_water * np.log(T2/T1)
+    # Entropy change of water, ln(T2/T1) = ln(1 + u)
+    u = (T2_C - T1_C) / T1
+    delta_S_water = m_g * C_water * np.log1p(u)
     
     # Heat absorbed by water
-    Q = m_g * C_water * (T2 - T1)
+    Q = m_g * C_water * (T2_C - T1_C)
     
     # Entropy change of reservoir (at T2)
     delta_S_reservoir = -Q / T2
     
-    # Total entropy change
-    delta_S_total = delta_S_water + delta_S_reservoir
+    # Total entropy change: mC[ln(1 + u) - u/(1 + u)], the two terms
+    # nearly cancel for small ΔT, so this step runs widened
+    u = wide(u)
+    delta_S_total = narrow(m_g * C_water * (np.log1p(u) - u / (1 + u)))
     
     return {
         'delta_S_water': delta_S_water,
@@ -282,21 +245,10 @@ def problem_1046(m_kg, T1_C, T2_C, C_water=4.18):
         'Q': Q
     }
 
-print("=" * 60)
-print("Problem 1046: Entropy Change - Water Heating")
-print("=" * 60)
-results = problem_1046(1, 0, 100)
-print(f"1 kg water: 0°C → 100°C (reservoir at 100°C)")
-print(f"Heat transferred: Q = {results['Q']/1000:.1f} kJ")
-print(f"(a) ΔS_water = {results['delta_S_water']:.1f} J/K")
-print(f"(b) ΔS_reservoir = {results['delta_S_reservoir']:.1f} J/K")
-print(f"    ΔS_universe = {results['delta_S_total']:.1f} J/K > 0 (irreversible)")
-print(f"(c) Reversible heating: use infinite heat sources → ΔS = 0")
-print()
-
 #=============================================================================
 # Problem 1047: Entropy of Nitrogen Gas vs Liquid
 #=============================================================================
+@precision_policy
 def problem_1047():
     """Calculate entropy difference between gas and liquid nitrogen."""
     M = 28  # g/mol
@@ -321,20 +273,11 @@ def problem_1047():
         'total': total
     }
 
-print("=" * 60)
-print("Problem 1047: Nitrogen Gas vs Liquid Entropy")
-print("=" * 60)
-r = problem_1047()
-print(f"1 gram N₂: gas at 20°C → liquid at -196°C")
-print(f"Moles: n = {r['n']:.4f} mol")
-print(f"ΔS (cooling gas): {r['delta_S_cool']:.3f} cal/K")
-print(f"ΔS (condensation): {r['delta_S_condense']:.3f} cal/K")
-print(f"Total ΔS: {r['total']:.3f} cal/K")
-print()
-
 #=============================================================================
 # Problem 1048: Refrigerator Work to Freeze Water
 #=============================================================================
+@precision_policy
+@blockwise
 def problem_1048(m_kg, T1_C, T2_C):
     """
     Calculate work to freeze water using Carnot refrigerator.
@@ -352,25 +295,15 @@ def problem_1048(m_kg, T1_C, T2_C):
     L = 3.35e5  # J/kg (latent heat of fusion)
     
     Q2 = m_kg * L  # heat removed from water
-    COP = T2 / (T1 - T2)  # coefficient of performance
+    COP = T2 / (T1_C - T2_C)  # coefficient of performance
     W = Q2 / COP
     
     return W, Q2, COP
 
-print("=" * 60)
-print("Problem 1048: Refrigerator Work to Freeze Water")
-print("=" * 60)
-W, Q2, COP = problem_1048(3, 20, 0)
-print(f"Freezing 3 kg water at 0°C")
-print(f"Hot reservoir: 20°C, Cold reservoir: 0°C")
-print(f"COP = T₂/(T₁-T₂) = {COP:.2f}")
-print(f"Heat removed: Q₂ = {Q2/1000:.1f} kJ")
-print(f"Minimum work: W = Q₂/COP = {W/1000:.1f} kJ")
-print()
-
 #=============================================================================
 # Problem 1050: Entropy of Isothermal vs Free Expansion
 #=============================================================================
+@precision_policy
 def problem_1050():
     """Compare entropy changes for isothermal and free expansion."""
     # For expansion from V to 2V
@@ -390,26 +323,11 @@ def problem_1050():
     }
     return results
 
-print("=" * 60)
-print("Problem 1050: Isothermal vs Free Expansion")
-print("=" * 60)
-r = problem_1050()
-print(f"Expansion: V₁ → 2V₁")
-print()
-print("Reversible Isothermal Expansion:")
-print(f"  ΔS_gas = R ln(2) = {r['isothermal']['gas']:.2f} J/(mol·K)")
-print(f"  ΔS_reservoir = {r['isothermal']['reservoir']:.2f} J/(mol·K)")
-print(f"  ΔS_universe = {r['isothermal']['universe']:.2f} J/(mol·K)")
-print()
-print("Free Expansion:")
-print(f"  ΔS_gas = R ln(2) = {r['free']['gas']:.2f} J/(mol·K)")
-print(f"  ΔS_reservoir = {r['free']['reservoir']:.2f} J/(mol·K)")
-print(f"  ΔS_universe = {r['free']['universe']:.2f} J/(mol·K) (irreversible!)")
-print()
-
 #=============================================================================
 # Problem 1059: Resistor Entropy
 #=============================================================================
+@precision_policy
+@blockwise
 def problem_1059(R_ohm, V, t, T_C):
     """
     Calculate entropy changes for resistor in heat bath.
@@ -433,20 +351,11 @@ def problem_1059(R_ohm, V, t, T_C):
         'delta_S_total': Q / T
     }
 
-print("=" * 60)
-print("Problem 1059: Resistor Entropy Change")
-print("=" * 60)
-r = problem_1059(1000, 100, 10, 27)
-print(f"1000Ω resistor, 100V for 10s at 27°C")
-print(f"Heat generated: Q = {r['Q']:.0f} J")
-print(f"(a) ΔS_resistor = {r['delta_S_resistor']} (constant T)")
-print(f"(b) ΔS_bath = Q/T = {r['delta_S_bath']:.3f} J/K")
-print(f"(c) ΔS_total = {r['delta_S_total']:.3f} J/K")
-print()
-
 #=============================================================================
 # Problem 1060: Two Gas Samples Mixing
 #=============================================================================
+@precision_policy
+@blockwise
 def problem_1060(T1, T2, n, Cv):
     """
     Calculate entropy change when two gas samples reach thermal equilibrium.
@@ -460,27 +369,178 @@ def problem_1060(T1, T2, n, Cv):
         delta_S: total entropy change
     """
     Tf = (T1 + T2) / 2
-    delta_S = n * Cv * np.log(Tf**2 / (T1 * T2))
+    # Tf²/(T1 T2) = 1 + (T1 - T2)²/(4 T1 T2), so ΔS ≥ 0 holds in any precision
+    delta_S = n * Cv * np.log1p((T1 - T2)**2 / (4 * T1 * T2))
     return delta_S, Tf
 
-print("=" * 60)
-print("Problem 1060: Two Gas Samples Thermal Equilibration")
-print("=" * 60)
-T1, T2 = 400, 300  # K
-n = 1  # mole each
-Cv = 1.5 * R  # monatomic gas
-
-delta_S, Tf = problem_1060(T1, T2, n, Cv)
-print(f"Gas 1: T₁ = {T1} K, Gas 2: T₂ = {T2} K")
-print(f"Final temperature: Tf = {Tf:.1f} K")
-print(f"ΔS = nCv ln[(T₁+T₂)²/(4T₁T₂)] = {delta_S:.3f} J/K")
-print(f"ΔS > 0 confirms irreversibility")
-print()
-
 #=============================================================================
 # Main Execution
 #=============================================================================
-if __name__ == "__main__":
+def main():
+    """Run the worked examples for Chapter 2."""
+    # Problem 1031: Steam Turbine Maximum Work
+    print("=" * 60)
+    print("Problem 1031: Steam Turbine Maximum Work")
+    print("=" * 60)
+    Q = 1000  # arbitrary heat input
+    W_max, eta = problem_1031(400, 150, Q)
+    print(f"Intake temperature: 400°C = 673 K")
+    print(f"Exhaust temperature: 150°C = 423 K")
+    print(f"Carnot efficiency: η = {eta:.3f} = {eta*100:.1f}%")
+    print(f"Maximum work: W_max = {eta:.3f} × Q")
+    print()
+
+    # Problem 1032: Carnot Cycle Efficiency
+    print("=" * 60)
+    print("Problem 1032: Carnot Cycle")
+    print("=" * 60)
+    T_hot, T_cold = 600, 300
+    eta = carnot_efficiency(T_hot, T_cold)
+    print(f"Hot reservoir: T₁ = {T_hot} K")
+    print(f"Cold reservoir: T₂ = {T_cold} K")
+    print(f"Carnot efficiency: η = 1 - T₂/T₁ = {eta:.3f} = {eta*100:.1f}%")
+    plot_carnot_cycle()
+    print()
+
+    # Problem 1035: Two Bodies with Carnot Engine
+    print("=" * 60)
+    print("Problem 1035: Two Bodies with Carnot Engine")
+    print("=" * 60)
+    T1, T2 = 400, 300  # K
+    N, C = 1, R  # 1 mole, heat capacity = R
+    Tf, W = problem_1035(T1, T2, N, C)
+    print(f"Initial temperatures: T₁ = {T1} K, T₂ = {T2} K")
+    print(f"Final temperature: Tf = √(T₁T₂) = {Tf:.1f} K")
+    print(f"Work delivered: W = NC(T₁ + T₂ - 2Tf) = {W:.1f} J")
+    print()
+
+    # Problem 1039: Heat Pump Building Temperature
+    print("=" * 60)
+    print("Problem 1039: Heat Pump Building Temperature")
+    print("=" * 60)
+    T0 = 273  # K (0°C outside)
+    W = 1000  # W
+    alpha = 50  # W/K
+
+    Te_pump = problem_1039(T0, W, alpha)
+    Te_heater = T0 + W/alpha
+
+    print(f"Outside temperature: T₀ = {T0} K = {T0-273}°C")
+    print(f"Power: W = {W} W")
+    print(f"Heat loss coefficient: α = {alpha} W/K")
+    print()
+    print(f"With heat pump: Te = {Te_pump:.1f} K = {Te_pump-273:.1f}°C")
+    print(f"With simple heater: Te' = {Te_heater:.1f} K = {Te_heater-273:.1f}°C")
+    print(f"Heat pump advantage: ΔT = {Te_pump - Te_heater:.1f} K")
+    print()
+
+    # Problem 1040: Heat Pump COP
+    print("=" * 60)
+    print("Problem 1040: Heat Pump Coefficient of Performance")
+    print("=" * 60)
+    T1_C, T2_C = 2, 27  # °C
+    COP = problem_1040(T1_C, T2_C)
+    print(f"Outside temperature: {T1_C}°C = {T1_C + 273.15} K")
+    print(f"Inside temperature: {T2_C}°C = {T2_C + 273.15} K")
+    print(f"COP = T₂/(T₂-T₁) = {COP:.1f}")
+    print(f"For every 1 J of work, {COP:.1f} J of heat is delivered")
+    print()
+
+    # Problem 1044: Entropy Change on Heating Silver
+    print("=" * 60)
+    print("Problem 1044: Entropy Change Heating Silver")
+    print("=" * 60)
+    delta_S = problem_1044(0, 30, 5.85)
+    print(f"Heating from 0°C to 30°C at constant volume")
+    print(f"Cv = 5.85 cal/mol·K")
+    print(f"ΔS = Cv ln(T₂/T₁) = {delta_S:.2f} cal/K")
+    print()
+
+    # Problem 1046: Entropy Change - Water Heating
+    print("=" * 60)
+    print("Problem 1046: Entropy Change - Water Heating")
+    print("=" * 60)
+    results = problem_1046(1, 0, 100)
+    print(f"1 kg water: 0°C → 100°C (reservoir at 100°C)")
+    print(f"Heat transferred: Q = {results['Q']/1000:.1f} kJ")
+    print(f"(a) ΔS_water = {results['delta_S_water']:.1f} J/K")
+    print(f"(b) ΔS_reservoir = {results['delta_S_reservoir']:.1f} J/K")
+    print(f"    ΔS_universe = {results['delta_S_total']:.1f} J/K > 0 (irreversible)")
+    print(f"(c) Reversible heating: use infinite heat sources → ΔS = 0")
+    print()
+
+    # Problem 1047: Entropy of Nitrogen Gas vs Liquid
+    print("=" * 60)
+    print("Problem 1047: Nitrogen Gas vs Liquid Entropy")
+    print("=" * 60)
+    r = problem_1047()
+    print(f"1 gram N₂: gas at 20°C → liquid at -196°C")
+    print(f"Moles: n = {r['n']:.4f} mol")
+    print(f"ΔS (cooling gas): {r['delta_S_cool']:.3f} cal/K")
+    print(f"ΔS (condensation): {r['delta_S_condense']:.3f} cal/K")
+    print(f"Total ΔS: {r['total']:.3f} cal/K")
+    print()
+
+    # Problem 1048: Refrigerator Work to Freeze Water
+    print("=" * 60)
+    print("Problem 1048: Refrigerator Work to Freeze Water")
+    print("=" * 60)
+    W, Q2, COP = problem_1048(3, 20, 0)
+    print(f"Freezing 3 kg water at 0°C")
+    print(f"Hot reservoir: 20°C, Cold reservoir: 0°C")
+    print(f"COP = T₂/(T₁-T₂) = {COP:.2f}")
+    print(f"Heat removed: Q₂ = {Q2/1000:.1f} kJ")
+    print(f"Minimum work: W = Q₂/COP = {W/1000:.1f} kJ")
+    print()
+
+    # Problem 1050: Entropy of Isothermal vs Free Expansion
+    print("=" * 60)
+    print("Problem 1050: Isothermal vs Free Expansion")
+    print("=" * 60)
+    r = problem_1050()
+    print(f"Expansion: V₁ → 2V₁")
+    print()
+    print("Reversible Isothermal Expansion:")
+    print(f"  ΔS_gas = R ln(2) = {r['isothermal']['gas']:.2f} J/(mol·K)")
+    print(f"  ΔS_reservoir = {r['isothermal']['reservoir']:.2f} J/(mol·K)")
+    print(f"  ΔS_universe = {r['isothermal']['universe']:.2f} J/(mol·K)")
+    print()
+    print("Free Expansion:")
+    print(f"  ΔS_gas = R ln(2) = {r['free']['gas']:.2f} J/(mol·K)")
+    print(f"  ΔS_reservoir = {r['free']['reservoir']:.2f} J/(mol·K)")
+    print(f"  ΔS_universe = {r['free']['universe']:.2f} J/(mol·K) (irreversible!)")
+    print()
+
+    # Problem 1059: Resistor Entropy
+    print("=" * 60)
+    print("Problem 1059: Resistor Entropy Change")
+    print("=" * 60)
+    r = problem_1059(1000, 100, 10, 27)
+    print(f"1000Ω resistor, 100V for 10s at 27°C")
+    print(f"Heat generated: Q = {r['Q']:.0f} J")
+    print(f"(a) ΔS_resistor = {r['delta_S_resistor']} (constant T)")
+    print(f"(b) ΔS_bath = Q/T = {r['delta_S_bath']:.3f} J/K")
+    print(f"(c) ΔS_total = {r['delta_S_total']:.3f} J/K")
+    print()
+
+    # Problem 1060: Two Gas Samples Mixing
+    print("=" * 60)
+    print("Problem 1060: Two Gas Samples Thermal Equilibration")
+    print("=" * 60)
+    T1, T2 = 400, 300  # K
+    n = 1  # mole each
+    Cv = 1.5 * R  # monatomic gas
+
+    delta_S, Tf = problem_1060(T1, T2, n, Cv)
+    print(f"Gas 1: T₁ = {T1} K, Gas 2: T₂ = {T2} K")
+    print(f"Final temperature: Tf = {Tf:.1f} K")
+    print(f"ΔS = nCv ln[(T₁+T₂)²/(4T₁T₂)] = {delta_S:.3f} J/K")
+    print(f"ΔS > 0 confirms irreversibility")
+    print()
     print("\n" + "=" * 60)
     print("All Chapter 2 calculations completed!")
     print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""
+Ideal-Gas Chemical Equilibrium by Gibbs Minimization
+Batched element-potential solver built on chemical_potential_ideal_gas - Python Computational Solutions
+"""
+
+import numpy as np
+
+from chapter3_functions import R, chemical_potential_ideal_gas
+
+#=============================================================================
+# Species Data
+#=============================================================================
+def species_mu0(H, S):
+    """
+    Standard chemical potentials mu0(T) = H - T S for a species table.
+
+    Enthalpies are formation enthalpies (elements zero); any per-element
+    offset in mu0 is absorbed by the element potentials and leaves the
+    equilibrium unchanged.
+
+    Parameters:
+        H: standard enthalpies (J/mol), shape (n_species,)
+        S: standard entropies (J/(mol·K)), shape (n_species,)
+
+    Returns:
+        mu0: function of T returning shape T.shape + (n_species,)
+    """
+    H = np.asarray(H, dtype=np.float64)
+    S = np.asarray(S, dtype=np.float64)
+
+    def mu0(T):
+        return H - np.asarray(T, dtype=np.float64)[..., None] * S
+    return mu0
+
+# Water dissociation: H2O, H2, O2, OH, H, O (constant H, S at 298 K)
+water_species = ['H2O', 'H2', 'O2', 'OH', 'H', 'O']
+water_elements = ['H', 'O']
+water_A = np.array([[2, 2, 0, 1, 1, 0],
+                    [1, 0, 2, 1, 0, 1]], dtype=np.float64)
+water_mu0 = species_mu0(H=[-241.826e3, 0.0, 0.0, 38.99e3, 218.0e3, 249.18e3],
+                        S=[188.835, 130.68, 205.15, 183.74, 114.72, 161.06])
+
+#=============================================================================
+# Element Matrix Preparation
+#=============================================================================
+def element_basis(A, tol=1e-12):
+    """
+    Factor the element matrix once for every state point.
+
+    An SVD removes linearly dependent element rows (e.g. a charge balance
+    that duplicates an element), and the per-species outer products
+    a_j a_jᵀ are precomputed so the Newton matrix A diag(x) Aᵀ for a whole
+    batch is a single matrix product.
+
+    Parameters:
+        A: element matrix, shape (n_elements, n_species)
+        tol: relative singular-value cutoff
+
+    Returns:
+        dict with reduced matrix A_r (r × n_species), projector U_r
+        (n_elements × r) for abundances, and outer products M
+    """
+    A = np.asarray(A, dtype=np.float64)
+    U, s, Vt = np.linalg.svd(A, full_matrices=False)
+    r = int(np.sum(s > tol * s[0]))
+    A_r = s[:r, None] * Vt[:r]
+    M = np.einsum('ij,kj->jik', A_r, A_r).reshape(A.shape[1], r * r)
+    return {'A': A, 'A_r': A_r, 'U_r': U[:, :r], 'M': M, 'rank': r}
+
+#=============================================================================
+# Batched Element-Potential Newton Solver
+#=============================================================================
+def _cold_start(basis, g, b_r):
+    """Initial element potentials giving roughly uniform mole fractions."""
+    A_r = basis['A_r']
+    n_s = A_r.shape[1]
+    lam, *_ = np.linalg.lstsq(A_r.T, (g - np.log(n_s)).T, rcond=None)
+    atoms_per_species = np.abs(A_r).sum(axis=0).mean()
+    ln_N = np.log(np.abs(b_r).sum(axis=-1) / atoms_per_species)
+    return lam.T, np.broadcast_to(ln_N, g.shape[:-1]).copy()
+
+def _newton(basis, g, b_r, lam, ln_N, tol, max_iter, max_step):
+    """
+    Solve g_j + ln x_j = a_j·λ, Σ x_j = 1, N A x = b for a batch.
+
+    Each iteration assembles and solves one bordered (r+1)×(r+1) system
+    per state point with a stacked np.linalg.solve. Steps are damped so
+    no ln x_j changes by more than max_step.
+    """
+    A_r, M, r = basis['A_r'], basis['M'], basis['rank']
+    P = g.shape[0]
+    K = np.zeros((P, r + 1, r + 1))
+    rhs = np.empty((P, r + 1))
+    converged = np.zeros(P, dtype=bool)
+
+    for iteration in range(1, max_iter + 1):
+        x = np.exp(np.minimum(lam @ A_r - g, 700.0))
+        Ax = x @ A_r.T
+        N = np.exp(ln_N)
+        res_el = Ax - b_r / N[:, None]
+        res_sum = x.sum(axis=1) - 1.0
+        converged = ((np.abs(res_el).max(axis=1)
+                      <= tol * np.abs(b_r / N[:, None]).max(axis=1))
+                     & (np.abs(res_sum) <= tol))
+        if converged.all():
+            break
+
+        K[:, :r, :r] = (x @ M).reshape(P, r, r)
+        K[:, :r, r] = Ax
+        K[:, r, :r] = Ax
+        K[:, r, r] = 0.0
+        rhs[:, :r] = -res_el
+        rhs[:, r] = -res_sum
+        step = np.linalg.solve(K, rhs[..., None])[..., 0]
+
+        d_lam, d_ln_N = step[:, :r], step[:, r]
+        change = np.maximum(np.abs(d_lam @ A_r).max(axis=1), np.abs(d_ln_N))
+        damp = np.minimum(1.0, max_step / np.maximum(change, 1e-300))
+        damp[converged] = 0.0
+        lam = lam + damp[:, None] * d_lam
+        ln_N = ln_N + damp * d_ln_N
+
+    return lam, ln_N, converged, iteration
+
+def gibbs_equilibrium(T, p, A, b, mu0, p0=101325, guess=None,
+                      tol=1e-10, max_iter=100, max_step=2.0):
+    """
+    Equilibrium composition of an ideal-gas mixture at a batch of (T, p).
+
+    Minimizes G = Σ n_j μ_j with μ_j = chemical_potential_ideal_gas(mu0_j,
+    T, x_j p) subject to element conservation A n = b, solving for the
+    element potentials λ (Lagrange multipliers, in units of RT) and the
+    total moles N with Newton's method for all points in lockstep.
+
+    Parameters:
+        T: temperatures (K), shape (P,) or scalar
+        p: pressures (Pa), broadcastable with T
+        A: element matrix (n_elements × n_species) or result of element_basis
+        b: element abundances (mol), shape (n_elements,) or (P, n_elements)
+        mu0: function of T returning standard chemical potentials (J/mol)
+        p0: standard pressure (Pa)
+        guess: optional dict with 'lambda' and 'ln_N' from a previous
+            solve of nearby states (warm start)
+        tol: relative tolerance on the element and mole-fraction balances
+        max_iter: Newton iteration cap
+        max_step: largest allowed change of any ln x_j per iteration
+
+    Returns:
+        dict with moles n and mole fractions x (P × n_species), total
+        moles N, chemical potentials mu (J/mol), element potentials
+        'lambda', 'ln_N', a 'converged' mask and the iteration count
+    """
+    basis = A if isinstance(A, dict) else element_basis(A)
+    T, p = np.broadcast_arrays(np.atleast_1d(np.asarray(T, dtype=np.float64)),
+                               np.atleast_1d(np.asarray(p, dtype=np.float64)))
+    RT = R * T[:, None]
+    # Dimensionless potentials of the pure species at the total pressure
+    g = chemical_potential_ideal_gas(mu0(T), T[:, None], p[:, None], p0) / RT
+    b = np.broadcast_to(np.asarray(b, dtype=np.float64), (T.size, basis['A'].shape[0]))
+    b_r = b @ basis['U_r']
+
+    if guess is None:
+        lam, ln_N = _cold_start(basis, g, b_r)
+    else:
+        lam = np.broadcast_to(guess['lambda'], (T.size, basis['rank'])).copy()
+        ln_N = np.broadcast_to(guess['ln_N'], (T.size,)).copy()
+
+    lam, ln_N, converged, iterations = _newton(basis, g, b_r, lam, ln_N,
+                                               tol, max_iter, max_step)
+    x = np.exp(lam @ basis['A_r'] - g)
+    x /= x.sum(axis=1, keepdims=True)
+    N = np.exp(ln_N)
+    return {
+        'x': x, 'n': N[:, None] * x, 'N': N,
+        'mu': chemical_potential_ideal_gas(mu0(T), T[:, None], x * p[:, None], p0),
+        'lambda': lam, 'ln_N': ln_N,
+        'converged': converged, 'iterations': iterations
+    }
+
+def equilibrium_grid(T, p, A, b, mu0, p0=101325, **kwargs):
+    """
+    Equilibrium compositions over a (T, p) grid.
+
+    All pressures of one temperature row are solved together; each row
+    is warm-started from the converged neighbouring row, so after the
+    first row Newton typically needs only a few iterations.
+
+    Parameters:
+        T: temperatures (K), shape (n_T,), ideally monotone
+        p: pressures (Pa), shape (n_p,)
+        A, b, mu0, p0: as in gibbs_equilibrium
+        kwargs: solver options passed to gibbs_equilibrium
+
+    Returns:
+        dict with x and n of shape (n_T, n_p, n_species), N and converged
+        of shape (n_T, n_p), and the Newton iterations used per row
+    """
+    T = np.asarray(T, dtype=np.float64)
+    p = np.asarray(p, dtype=np.float64)
+    basis = A if isinstance(A, dict) else element_basis(A)
+    n_s = basis['A'].shape[1]
+    x = np.empty((T.size, p.size, n_s))
+    N = np.empty((T.size, p.size))
+    converged = np.empty((T.size, p.size), dtype=bool)
+    iterations = np.empty(T.size, dtype=int)
+
+    guess = None
+    for i, T_i in enumerate(T):
+        row = gibbs_equilibrium(np.full(p.size, T_i), p, basis, b, mu0, p0,
+                                guess=guess, **kwargs)
+        x[i], N[i], converged[i] = row['x'], row['N'], row['converged']
+        iterations[i] = row['iterations']
+        guess = {'lambda': row['lambda'], 'ln_N': row['ln_N']}
+
+    return {'x': x, 'n': N[..., None] * x, 'N': N,
+            'converged': converged, 'iterations': iterations}
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    import time
+
+    print("=" * 60)
+    print("Chemical Equilibrium: Dissociation of Water Vapour")
+    print("=" * 60)
+    b_water = water_A @ np.array([1.0, 0, 0, 0, 0, 0])  # 1 mol H2O
+    r = gibbs_equilibrium([2000, 3000, 4000], 101325, water_A, b_water, water_mu0)
+    for k, T_k in enumerate([2000, 3000, 4000]):
+        fractions = ", ".join(f"{s}: {x:.3g}" for s, x in zip(water_species, r['x'][k]))
+        print(f"  T = {T_k} K, 1 atm → {fractions}")
+
+    T_grid = np.linspace(1500, 4500, 300)
+    p_grid = np.geomspace(1e3, 1e7, 300)
+    start = time.perf_counter()
+    grid = equilibrium_grid(T_grid, p_grid, water_A, b_water, water_mu0)
+    elapsed = time.perf_counter() - start
+    print(f"  {T_grid.size * p_grid.size:,} grid points in {elapsed:.2f} s, "
+          f"all converged: {grid['converged'].all()}, "
+          f"iterations/row after warm start: {grid['iterations'][1:].mean():.1f}")
+    print()
@@ -0,0 +1,441 @@
+"""
+Distributed Parameter Sweeps over a Shared Filesystem
+Coordinator/worker chunk queue with work stealing, retries and leases - Python Computational Solutions
+"""
+
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+import numpy as np
+
+from result_store import (create_store, open_store, param_grid, read_manifest,
+                          result_columns, write_chunk)
+
+# The queue lives next to a result_store directory that every node mounts:
+#   queue/job.json                  function, fixed arguments, retry policy
+#   queue/todo/<shard>/<k>.<try>    chunks waiting, one shard per worker
+#   queue/running/<k>.<try>.<who>   claimed chunks; the mtime is the lease
+#   queue/parts/<k>/<column>.npy    finished chunks awaiting the merge
+#   queue/failed/<k>                traceback of a chunk out of attempts
+#   queue/stop                      tells the workers to exit
+# job.json exists only while a coordinator is running.
+# Claiming is a rename, which is atomic on POSIX filesystems, so no broker
+# or lock server is needed. Only the coordinator writes the store itself.
+_POLL = 0.2   # s between queue scans when idle
+
+#=============================================================================
+# Queue Files
+#=============================================================================
+def _queue(path, *parts):
+    return os.path.join(path, 'queue', *parts)
+
+def _write_json(file, obj):
+    tmp = f"{file}.{os.getpid()}.tmp"
+    with open(tmp, 'w') as f:
+        json.dump(obj, f, indent=1)
+    os.replace(tmp, file)
+
+def _listdir(directory):
+    try:
+        return sorted(n for n in os.listdir(directory) if not n.startswith('.'))
+    except FileNotFoundError:
+        return []
+
+def _chunk_of(name):
+    return int(name.split('.')[0])
+
+def _shard_of(k, n_chunks, n_shards):
+    """Contiguous home shards keep each worker on neighbouring grid points."""
+    return k * n_shards // n_chunks
+
+def _requeue(path, running_file, job, error=None):
+    """Return a claimed chunk to its home shard, or retire it after max_attempts."""
+    name = os.path.basename(running_file)
+    k, attempt = _chunk_of(name), int(name.split('.')[1]) + 1
+    if attempt >= job['max_attempts']:
+        with open(_queue(path, 'failed', f"{k:06d}"), 'w') as f:
+            f.write(error or 'lease expired\n')
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(running_file)
+        return
+    shard = _shard_of(k, job['n_chunks'], job['n_shards'])
+    with contextlib.suppress(FileNotFoundError):
+        os.rename(running_file, _queue(path, 'todo', str(shard), f"{k:06d}.{attempt}"))
+
+def _enqueue(path, manifest, job):
+    """Queue every chunk that is neither stored, queued, claimed nor parked as a part."""
+    known = set(manifest['done'])
+    for shard in _listdir(_queue(path, 'todo')):
+        known.update(_chunk_of(n) for n in _listdir(_queue(path, 'todo', shard)))
+    for sub in ('running', 'parts'):
+        known.update(_chunk_of(n) for n in _listdir(_queue(path, sub)))
+    for shard in range(job['n_shards']):
+        os.makedirs(_queue(path, 'todo', str(shard)), exist_ok=True)
+    for k in range(manifest['n_chunks']):
+        if k not in known:
+            shard = _shard_of(k, manifest['n_chunks'], job['n_shards'])
+            open(_queue(path, 'todo', str(shard), f"{k:06d}.0"), 'w').close()
+
+#=============================================================================
+# Coordinator
+#=============================================================================
+def coordinate(path, func, params, fixed=None, outputs=None, chunk_size=4096,
+               n_shards=4, max_attempts=3, lease=60.0, timeout=None, overwrite=False):
+    """
+    Shard a sweep into chunks, serve them to workers and merge the results.
+
+    Workers (run_worker, on any machine that mounts path) may start
+    before or after the coordinator. A chunk whose worker raises is
+    retried up to max_attempts times; a chunk whose lease is not renewed
+    (worker killed, node lost) is handed out again. Restarting the
+    coordinator resumes the sweep and retries chunks that had failed.
+
+    Parameters:
+        path: store directory on a filesystem shared by all workers
+        func: 'module.function' importable by the workers, vectorized
+              over the parameters
+        params: dict of equal-length 1-D parameter arrays (see param_grid)
+        fixed: dict of JSON-serializable keyword arguments held constant
+        outputs: column names for tuple results
+        chunk_size: grid points per task
+        n_shards: home queues (normally the number of workers)
+        max_attempts: evaluations allowed per chunk
+        lease: seconds without a heartbeat before a claimed chunk is requeued
+        timeout: give up after this many seconds (None: wait)
+        overwrite: replace a store holding a different sweep (grid,
+                   chunk size, func, fixed or outputs) and its queue
+
+    Returns:
+        dict with done, n_chunks, complete, failed ({chunk: traceback})
+        and by_worker ({worker: {'chunks', 'stolen'}})
+    """
+    path = os.path.abspath(path)
+    sweep = {'func': func, 'fixed': fixed or {}, 'outputs': outputs}
+    previous = None
+    with contextlib.suppress(FileNotFoundError):
+        previous = read_manifest(path)
+    manifest = create_store(path, params, chunk_size, overwrite, job=sweep)
+    if previous is not None and manifest != previous:
+        # the store was replaced: chunks queued for the old sweep are stale
+        shutil.rmtree(_queue(path), ignore_errors=True)
+    for sub in ('running', 'parts', 'failed', 'todo'):
+        os.makedirs(_queue(path, sub), exist_ok=True)
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(_queue(path, 'stop'))
+    for name in _listdir(_queue(path, 'failed')):
+        os.remove(_queue(path, 'failed', name))
+    job = {**manifest['job'], 'grid_hash': manifest['grid_hash'], 'n_chunks': manifest['n_chunks'],
+           'n_shards': n_shards, 'max_attempts': max_attempts, 'lease': lease}
+    _write_json(_queue(path, 'job.json'), job)
+    _enqueue(path, manifest, job)
+
+    start = time.monotonic()
+    maps = None
+    by_worker = {}
+    while True:
+        for name in _listdir(_queue(path, 'parts')):
+            part = _queue(path, 'parts', name)
+            with open(os.path.join(part, '_meta.json')) as f:
+                meta = json.load(f)
+            columns = {c[:-4]: np.load(os.path.join(part, c)) for c in _listdir(part)
+                       if c.endswith('.npy')}
+            maps = write_chunk(path, manifest, _chunk_of(name), columns, maps)
+            stats = by_worker.setdefault(meta['worker'], {'chunks': 0, 'stolen': 0})
+            stats['chunks'] += 1
+            stats['stolen'] += meta['stolen']
+            shutil.rmtree(part)
+
+        now = time.time()
+        for name in _listdir(_queue(path, 'running')):
+            running = _queue(path, 'running', name)
+            with contextlib.suppress(FileNotFoundError):
+                if now - os.stat(running).st_mtime > lease:
+                    _requeue(path, running, job)
+
+        failed = {_chunk_of(n) for n in _listdir(_queue(path, 'failed'))}
+        if len(manifest['done']) + len(failed) >= manifest['n_chunks']:
+            break
+        if timeout is not None and time.monotonic() - start > timeout:
+            break
+        time.sleep(_POLL)
+
+    # workers that start after this wait for the next job.json
+    os.remove(_queue(path, 'job.json'))
+    open(_queue(path, 'stop'), 'w').close()
+    failed = {}
+    for name in _listdir(_queue(path, 'failed')):
+        with open(_queue(path, 'failed', name)) as f:
+            failed[_chunk_of(name)] = f.read()
+    return {'done': len(manifest['done']), 'n_chunks': manifest['n_chunks'],
+            'complete': len(manifest['done']) == manifest['n_chunks'],
+            'failed': failed, 'by_worker': by_worker}
+
+#=============================================================================
+# Worker
+#=============================================================================
+def _load_function(spec):
+    """Import 'module.function'."""
+    module_name, function_name = spec.rsplit('.', 1)
+    return getattr(importlib.import_module(module_name), function_name)
+
+def _claim(path, shard, worker):
+    """
+    Take the next chunk: the head of the home shard, otherwise the tail
+    of the fullest other shard (work stealing).
+
+    Returns:
+        (chunk, running file, stolen) or None when nothing is queued
+    """
+    shards = _listdir(_queue(path, 'todo'))
+    queues = {s: _listdir(_queue(path, 'todo', s)) for s in shards}
+    order = [shard] if shard in queues else []
+    order += sorted((s for s in shards if s != shard), key=lambda s: -len(queues[s]))
+    for s in order:
+        names = queues[s] if s == shard else queues[s][::-1]
+        for name in names:
+            task = _queue(path, 'todo', s, name)
+            running = _queue(path, 'running', f"{name}.{worker}")
+            try:
+                os.utime(task)   # the rename keeps the mtime, which is the lease
+                os.rename(task, running)
+            except FileNotFoundError:
+                continue         # another worker got there first
+            return _chunk_of(name), running, s != shard
+    return None
+
+@contextlib.contextmanager
+def _heartbeat(running, interval):
+    """Renew the lease on a claimed chunk while it is being evaluated."""
+    stop = threading.Event()
+
+    def beat():
+        while not stop.wait(interval):
+            with contextlib.suppress(FileNotFoundError):
+                os.utime(running)
+    thread = threading.Thread(target=beat, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+def run_worker(path, worker=None, shard=None, idle_exit=None, crash_after=None):
+    """
+    Evaluate chunks from the queue at path until the coordinator stops.
+
+    Parameters:
+        path: store directory shared with the coordinator
+        worker: name used in the queue (default host-pid)
+        shard: home shard (default derived from the name)
+        idle_exit: exit after this many seconds with nothing to do
+        crash_after: fault injection for tests: exit abruptly while
+                     holding the next claimed chunk after this many
+
+    Returns:
+        number of chunks evaluated
+    """
+    path = os.path.abspath(path)
+    worker = (worker or f"{socket.gethostname()}-{os.getpid()}").replace('.', '-')
+    while not os.path.exists(_queue(path, 'job.json')):
+        time.sleep(_POLL)
+    with open(_queue(path, 'job.json')) as f:
+        job = json.load(f)
+    if shard is None:
+        shard = sum(worker.encode()) % job['n_shards']
+    shard = str(shard)
+    func = _load_function(job['func'])
+    manifest = read_manifest(path)
+    store = open_store(path, partial=True)
+    params = {k: store[k] for k in manifest['params']}
+    chunk_size = manifest['chunk_size']
+
+    evaluated = 0
+    idle_since = time.monotonic()
+    while not os.path.exists(_queue(path, 'stop')):
+        claim = _claim(path, shard, worker)
+        if claim is None:
+            if idle_exit is not None and time.monotonic() - idle_since > idle_exit:
+                break
+            time.sleep(_POLL)
+            continue
+        k, running, stolen = claim
+        if crash_after is not None and evaluated >= crash_after:
+            os._exit(1)
+        lo, hi = k * chunk_size, min((k + 1) * chunk_size, manifest['n_rows'])
+        with _heartbeat(running, job['lease'] / 4):
+            try:
+                result = func(**{n: np.asarray(v[lo:hi]) for n, v in params.items()},
+                              **job['fixed'])
+                columns = result_columns(result, job['outputs'])
+            except Exception:
+                _requeue(path, running, job, traceback.format_exc())
+                continue
+            tmp = _queue(path, 'parts', f".{k:06d}.{worker}")
+            os.makedirs(tmp, exist_ok=True)
+            for name, values in columns.items():
+                np.save(os.path.join(tmp, name + '.npy'), np.asarray(values))
+            _write_json(os.path.join(tmp, '_meta.json'), {'worker': worker, 'stolen': stolen})
+            try:
+                os.rename(tmp, _queue(path, 'parts', f"{k:06d}"))
+            except OSError:
+                shutil.rmtree(tmp)   # a requeued copy of this chunk finished first
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(running)
+        evaluated += 1
+        idle_since = time.monotonic()
+    return evaluated
+
+def start_local_workers(path, n, crash_after=None):
+    """
+    Launch n worker processes on this machine (stand-ins for nodes).
+
+    Parameters:
+        path: store directory
+        n: number of workers; worker i gets home shard i
+        crash_after: {worker index: chunks} fault injection, see run_worker
+
+    Returns:
+        list of subprocess.Popen
+    """
+    procs = []
+    for i in range(n):
+        cmd = [sys.executable, os.path.abspath(__file__), 'worker', os.path.abspath(path),
+               '--name', f"local{i}", '--shard', str(i)]
+        if crash_after and i in crash_after:
+            cmd += ['--crash-after', str(crash_after[i])]
+        procs.append(subprocess.Popen(cmd, stdout=subprocess.DEVNULL))
+    return procs
+
+def _parse_axis(text):
+    """'name=start:stop:num' (linspace) or 'name=v1,v2,...'."""
+    name, values = text.split('=', 1)
+    if ':' in values:
+        lo, hi, num = values.split(':')
+        return name, np.linspace(float(lo), float(hi), int(num))
+    return name, np.array([float(v) for v in values.split(',')])
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest='mode')
+    c = sub.add_parser('coordinator', help='shard a sweep and merge the results')
+    c.add_argument('store', help='store directory on the shared filesystem')
+    c.add_argument('--func', required=True, help="e.g. chapter2_entropy.problem_1039")
+    c.add_argument('--grid', action='append', required=True,
+                   help="axis 'name=start:stop:num' or 'name=v1,v2,...'")
+    c.add_argument('--fixed', default='{}', help='JSON keyword arguments held constant')
+    c.add_argument('--outputs', default=None, help='comma-separated names for tuple results')
+    c.add_argument('--chunk', type=int, default=4096, help='grid points per chunk')
+    c.add_argument('--shards', type=int, default=4, help='home queues (number of workers)')
+    c.add_argument('--attempts', type=int, default=3, help='evaluations allowed per chunk')
+    c.add_argument('--lease', type=float, default=60.0, help='seconds before a silent claim expires')
+    c.add_argument('--local', type=int, default=0, help='also start this many local workers')
+    w = sub.add_parser('worker', help='evaluate chunks until the coordinator stops')
+    w.add_argument('store', help='store directory on the shared filesystem')
+    w.add_argument('--name', default=None, help='worker name (default host-pid)')
+    w.add_argument('--shard', type=int, default=None, help='home shard')
+    w.add_argument('--idle-exit', type=float, default=None, help='exit after idle seconds')
+    w.add_argument('--crash-after', type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode == 'worker':
+        n = run_worker(args.store, args.name, args.shard, args.idle_exit, args.crash_after)
+        print(f"worker {args.name or os.getpid()}: {n} chunks")
+        sys.exit(0)
+
+    if args.mode == 'coordinator':
+        grid = param_grid(**dict(_parse_axis(a) for a in args.grid))
+        procs = start_local_workers(args.store, args.local)
+        report = coordinate(args.store, args.func, grid, json.loads(args.fixed),
+                            args.outputs.split(',') if args.outputs else None,
+                            args.chunk, args.shards, args.attempts, args.lease)
+        for p in procs:
+            p.wait()
+        print(f"{report['done']}/{report['n_chunks']} chunks stored, "
+              f"{len(report['failed'])} failed: {report['by_worker']}")
+        for k, error in sorted(report['failed'].items()):
+            print(f"chunk {k}:\n{error}")
+        sys.exit(0 if report['complete'] else 1)
+
+    print("=" * 60)
+    print("Distributed Sweeps: Local Coordinator and Workers")
+    print("=" * 60)
+    from chapter1_first_law import problem_1024
+    from chapter2_entropy import problem_1039
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Problem 1039 over outside temperature, pump power and building loss;
+        # worker 2 dies holding a chunk, whose lease then expires
+        grid = param_grid(T0=np.linspace(230.0, 300.0, 141), W=np.linspace(100.0, 5000.0, 99),
+                          alpha=np.linspace(10.0, 200.0, 39))
+        path = os.path.join(tmp, 'heat_pump')
+        procs = start_local_workers(path, 3, crash_after={2: 3})
+        start = time.perf_counter()
+        report = coordinate(path, 'chapter2_entropy.problem_1039', grid, outputs=['Te'],
+                            chunk_size=8192, n_shards=3, lease=2.0)
+        elapsed = time.perf_counter() - start
+        for p in procs:
+            p.wait()
+        store = open_store(path)
+        exact = np.array_equal(store['Te'], problem_1039(grid['T0'], grid['W'], grid['alpha']))
+        print(f"  Problem 1039: {report['done']}/{report['n_chunks']} chunks "
+              f"({grid['T0'].size} points) in {elapsed:.2f} s, one worker killed; "
+              f"merged result identical to a single call: {exact}")
+        print(f"    per worker: {report['by_worker']}")
+        del store
+
+        # Problem 1024 shields: work stealing between uneven workers
+        grid = param_grid(T1=np.linspace(4.0, 77.0, 74), T2=np.linspace(200.0, 400.0, 201),
+                          R_reflectivity=np.linspace(0.0, 0.99, 100))
+        path = os.path.join(tmp, 'shields')
+        procs = start_local_workers(path, 4)
+        report = coordinate(path, 'chapter1_first_law.problem_1024', grid,
+                            chunk_size=16384, n_shards=8)
+        for p in procs:
+            p.wait()
+        store = open_store(path)
+        ref = problem_1024(grid['T1'], grid['T2'], grid['R_reflectivity'])
+        exact = all(np.array_equal(store[k], ref[k]) for k in ref)
+        print(f"  Problem 1024: {report['done']}/{report['n_chunks']} chunks over 8 shards "
+              f"and 4 workers; identical: {exact}")
+        print(f"    per worker: {report['by_worker']}")
+        del store
+
+        # Adiabatic atmosphere: failing chunks are retried, reported, then rerun
+        grid = param_grid(z=np.linspace(0.0, 15e3, 151), T0=np.linspace(250.0, 320.0, 71),
+                          gamma=np.linspace(1.1, 1.67, 20))
+        path = os.path.join(tmp, 'atmosphere')
+        procs = start_local_workers(path, 2)
+        report = coordinate(path, 'chapter3_functions.adiabatic_atmosphere', grid,
+                            fixed={'p0': 101325.0, 'mu': 0.029, 'species': 'no-such-gas'},
+                            outputs=['p', 'T', 'dTdz'], chunk_size=65536, n_shards=2,
+                            max_attempts=2)
+        for p in procs:
+            p.wait()
+        error = next(iter(report['failed'].values()), '').strip().splitlines()[-1:]
+        print(f"  Atmosphere with an unknown species: {len(report['failed'])}/"
+              f"{report['n_chunks']} chunks failed after 2 attempts ({error[0] if error else ''})")
+        procs = start_local_workers(path, 2)
+        report = coordinate(path, 'chapter3_functions.adiabatic_atmosphere', grid,
+                            fixed={'p0': 101325.0, 'mu': 0.029},
+                            outputs=['p', 'T', 'dTdz'], chunk_size=65536, n_shards=2,
+                            overwrite=True)
+        for p in procs:
+            p.wait()
+        print(f"  Rerun with the species dropped (overwrite=True): "
+              f"complete = {report['complete']}")
+    print()
@@ -0,0 +1,336 @@
+"""
+Entropy Ledger for Networks of Bodies, Reservoirs and Processes
+Batched entropy accounting generalizing Problems 1046, 1047, 1050, 1059, 1060 - Python Computational Solutions
+"""
+
+import numpy as np
+
+from chapter2_entropy import (R, R_cal, problem_1046, problem_1047, problem_1050,
+                              problem_1059, problem_1060)
+from solid_heat_capacity import entropy_change, heat_absorbed
+
+#=============================================================================
+# Network Elements
+#=============================================================================
+# Every numeric argument may be an array over a batch of scenarios; all
+# quantities broadcast together through the ledger.
+def body(T, C=None, model=None, n=1.0):
+    """
+    A body with finite heat capacity.
+
+    Parameters:
+        T: initial temperature (K)
+        C: constant total heat capacity (J/K), or
+        model: heat-capacity model from solid_heat_capacity (per mole)
+        n: moles (amount for model, and for gas expansion steps)
+
+    Returns:
+        dict describing the body
+    """
+    if (C is None) == (model is None):
+        raise ValueError("give exactly one of C or model")
+    return {'T': np.asarray(T, dtype=np.float64), 'C': C, 'model': model, 'n': n}
+
+def heating(name, T_final, reservoir=None):
+    """Bring a body to T_final by contact with a reservoir (None: reversibly)."""
+    return {'kind': 'heating', 'bodies': (name,), 'T_final': T_final,
+            'reservoir': reservoir}
+
+def phase_change(name, latent_heat, reservoir=None):
+    """
+    Phase change at the body's current temperature, absorbing
+    latent_heat (J, negative for condensation or freezing).
+    """
+    return {'kind': 'phase_change', 'bodies': (name,), 'latent_heat': latent_heat,
+            'reservoir': reservoir}
+
+def isothermal_expansion(name, V_ratio, reservoir=None):
+    """Reversible isothermal expansion of an ideal-gas body by V_ratio."""
+    return {'kind': 'isothermal_expansion', 'bodies': (name,), 'V_ratio': V_ratio,
+            'reservoir': reservoir}
+
+def free_expansion(name, V_ratio):
+    """Joule free expansion of an ideal-gas body into vacuum."""
+    return {'kind': 'free_expansion', 'bodies': (name,), 'V_ratio': V_ratio}
+
+def joule_heating(name, power, time, reservoir=None):
+    """
+    Dissipate electrical work P·t in a body; with a reservoir the body
+    stays at constant temperature and the heat flows on to the reservoir,
+    without one the body heats up adiabatically.
+    """
+    return {'kind': 'joule_heating', 'bodies': (name,), 'power': power,
+            'time': time, 'reservoir': reservoir}
+
+def thermal_contact(name_a, name_b):
+    """Let two bodies equilibrate with each other, isolated from the rest."""
+    return {'kind': 'thermal_contact', 'bodies': (name_a, name_b)}
+
+#=============================================================================
+# Body Thermodynamics
+#=============================================================================
+def _heat_and_entropy(b, T1, T2):
+    """Heat absorbed (J) and entropy change (J/K) of a body from T1 to T2."""
+    if b['model'] is None:
+        return b['C'] * (T2 - T1), b['C'] * np.log(T2 / T1)
+    return (heat_absorbed(b['model'], T1, T2, b['n']),
+            entropy_change(b['model'], T1, T2, b['n']))
+
+def _bisect(f, lo, hi, iterations=60):
+    """Batched bisection for an increasing function f with f(lo) ≤ 0 ≤ f(hi)."""
+    for _ in range(iterations):
+        mid = 0.5 * (lo + hi)
+        below = f(mid) < 0
+        lo = np.where(below, mid, lo)
+        hi = np.where(below, hi, mid)
+    return 0.5 * (lo + hi)
+
+def _temperature_after(b, T1, Q):
+    """Temperature of a body after absorbing heat Q from T1."""
+    if b['model'] is None:
+        return T1 + Q / b['C']
+    T1, Q = np.broadcast_arrays(T1, Q)
+    # Cv ≥ small positive bound, so the temperature stays in a finite bracket
+    hi = np.maximum(T1, 1.0) * 2.0
+    while np.any(heat_absorbed(b['model'], T1, hi, b['n']) < Q):
+        hi = np.where(heat_absorbed(b['model'], T1, hi, b['n']) < Q, 2 * hi, hi)
+    lo = np.where(Q >= 0, T1, 1e-3)
+    return _bisect(lambda T: heat_absorbed(b['model'], T1, T, b['n']) - Q, lo, hi)
+
+def _contact_temperature(ba, bb, Ta, Tb):
+    """Common final temperature of two bodies exchanging heat."""
+    if ba['model'] is None and bb['model'] is None:
+        return (ba['C'] * Ta + bb['C'] * Tb) / (ba['C'] + bb['C'])
+    lo, hi = np.minimum(Ta, Tb), np.maximum(Ta, Tb)
+    return _bisect(lambda T: _heat_and_entropy(ba, Ta, T)[0]
+                   + _heat_and_entropy(bb, Tb, T)[0], lo, hi)
+
+#=============================================================================
+# Step Rules: (step, bodies, reservoirs, input temperatures) ->
+#             (output temperatures, {entity: ΔS}, {reservoir: heat given})
+#=============================================================================
+def _reservoir_terms(step, reservoirs, Q_body, dS_body):
+    """Entropy of the reservoir supplying heat Q_body to the body."""
+    name = step['reservoir']
+    if name is None:
+        # Reversible supply through a continuum of reservoirs
+        return {'surroundings': -dS_body}, {}
+    return {name: -Q_body / reservoirs[name]}, {name: Q_body}
+
+def _rule_heating(step, bodies, reservoirs, T):
+    (name,) = step['bodies']
+    T2 = np.asarray(step['T_final'], dtype=np.float64)
+    Q, dS = _heat_and_entropy(bodies[name], T[0], T2)
+    terms, heat = _reservoir_terms(step, reservoirs, Q, dS)
+    return (T2,), {name: dS, **terms}, heat
+
+def _rule_phase_change(step, bodies, reservoirs, T):
+    (name,) = step['bodies']
+    Q = np.asarray(step['latent_heat'], dtype=np.float64)
+    dS = Q / T[0]
+    terms, heat = _reservoir_terms(step, reservoirs, Q, dS)
+    return T, {name: dS, **terms}, heat
+
+def _rule_isothermal_expansion(step, bodies, reservoirs, T):
+    (name,) = step['bodies']
+    dS = bodies[name]['n'] * R * np.log(step['V_ratio'])
+    Q = T[0] * dS
+    terms, heat = _reservoir_terms(step, reservoirs, Q, dS)
+    return T, {name: dS + 0 * T[0], **terms}, heat
+
+def _rule_free_expansion(step, bodies, reservoirs, T):
+    (name,) = step['bodies']
+    return T, {name: bodies[name]['n'] * R * np.log(step['V_ratio']) + 0 * T[0]}, {}
+
+def _rule_joule_heating(step, bodies, reservoirs, T):
+    (name,) = step['bodies']
+    W = np.asarray(step['power'], dtype=np.float64) * step['time']
+    reservoir = step['reservoir']
+    if reservoir is None:
+        T2 = _temperature_after(bodies[name], T[0], W)
+        return (T2,), {name: _heat_and_entropy(bodies[name], T[0], T2)[1]}, {}
+    return T, {name: 0 * T[0], reservoir: W / reservoirs[reservoir]}, {reservoir: -W}
+
+def _rule_thermal_contact(step, bodies, reservoirs, T):
+    a, b = step['bodies']
+    Tf = _contact_temperature(bodies[a], bodies[b], T[0], T[1])
+    return (Tf, Tf), {a: _heat_and_entropy(bodies[a], T[0], Tf)[1],
+                      b: _heat_and_entropy(bodies[b], T[1], Tf)[1]}, {}
+
+_STEP_RULES = {
+    'heating': _rule_heating,
+    'phase_change': _rule_phase_change,
+    'isothermal_expansion': _rule_isothermal_expansion,
+    'free_expansion': _rule_free_expansion,
+    'joule_heating': _rule_joule_heating,
+    'thermal_contact': _rule_thermal_contact,
+}
+
+#=============================================================================
+# Ledger Evaluation and Incremental Updates
+#=============================================================================
+def _evaluate(ledger, start):
+    """
+    (Re)evaluate steps from index start on. A later step is reused when
+    the body temperatures it reads are the very arrays it saw last time,
+    so a change only propagates to steps downstream on the same bodies.
+    """
+    bodies, reservoirs = ledger['bodies'], ledger['reservoirs']
+    T = {name: b['T'] for name, b in bodies.items()}
+    for cached in ledger['results'][:start]:
+        T.update(cached['T_out'])
+
+    recomputed = []
+    results = ledger['results'][:start]
+    for k, step in enumerate(ledger['steps'][start:], start):
+        T_in = tuple(T[name] for name in step['bodies'])
+        old = ledger['results'][k] if k < len(ledger['results']) else None
+        if (k > start and old is not None and old['step'] is step
+                and all(a is b for a, b in zip(old['T_in'], T_in))):
+            result = old
+        else:
+            T_out, terms, heat = _STEP_RULES[step['kind']](step, bodies, reservoirs, T_in)
+            result = {'step': step, 'T_in': T_in,
+                      'T_out': dict(zip(step['bodies'], T_out)),
+                      'terms': terms, 'heat': heat,
+                      'generation': sum(terms.values())}
+            recomputed.append(k)
+        results.append(result)
+        T.update(result['T_out'])
+
+    ledger['results'] = results
+    ledger['recomputed'] = recomputed
+    ledger['T_final'] = T
+    _totals(ledger)
+    return ledger
+
+def _totals(ledger):
+    """Sum per-step terms into per-entity totals and universe generation."""
+    totals = {}
+    heat = {}
+    for result in ledger['results']:
+        for entity, dS in result['terms'].items():
+            totals[entity] = totals.get(entity, 0.0) + dS
+        for name, Q in result['heat'].items():
+            heat[name] = heat.get(name, 0.0) + Q
+    ledger['delta_S'] = totals
+    ledger['heat_from_reservoir'] = heat
+    ledger['generation'] = sum(totals.values()) if totals else 0.0
+
+def entropy_ledger(bodies, reservoirs, steps):
+    """
+    Entropy accounting for a sequence of process steps on a network.
+
+    Parameters:
+        bodies: dict of name -> body(...)
+        reservoirs: dict of name -> temperature (K, scalar or batch array)
+        steps: list of step dicts (heating, phase_change,
+            isothermal_expansion, free_expansion, joule_heating,
+            thermal_contact)
+
+    Returns:
+        ledger dict with, among others:
+            delta_S: entity name -> total ΔS (J/K, batch-shaped)
+            generation: total entropy generation = ΔS_universe (J/K)
+            results: per-step T_in/T_out, terms, heat and generation
+            T_final: final body temperatures
+            heat_from_reservoir: reservoir name -> net heat supplied (J)
+    """
+    for step in steps:
+        if step['kind'] not in _STEP_RULES:
+            raise ValueError(f"unknown step kind '{step['kind']}'")
+        for name in step['bodies']:
+            if name not in bodies:
+                raise KeyError(f"step refers to unknown body '{name}'")
+        if step.get('reservoir') is not None and step['reservoir'] not in reservoirs:
+            raise KeyError(f"step refers to unknown reservoir '{step['reservoir']}'")
+    ledger = {'bodies': dict(bodies),
+              'reservoirs': {k: np.asarray(v, dtype=np.float64)
+                             for k, v in reservoirs.items()},
+              'steps': list(steps), 'results': []}
+    return _evaluate(ledger, 0)
+
+def update_step(ledger, index, step):
+    """
+    Replace one step and recompute incrementally.
+
+    Steps before index are untouched; after it only steps whose input
+    body temperatures changed are recomputed (listed in
+    ledger['recomputed']).
+
+    Returns:
+        the updated ledger (modified in place)
+    """
+    if step['kind'] not in _STEP_RULES:
+        raise ValueError(f"unknown step kind '{step['kind']}'")
+    ledger['steps'][index] = step
+    return _evaluate(ledger, index)
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    import time
+
+    cal = R / R_cal  # J per cal, consistent with the chapter constants
+
+    print("=" * 60)
+    print("Entropy Ledger: Problems 1046-1060 as Process Networks")
+    print("=" * 60)
+    led = entropy_ledger({'water': body(273.15, C=4180.0)}, {'bath': 373.15},
+                         [heating('water', 373.15, 'bath')])
+    r = problem_1046(1, 0, 100)
+    print(f"1046 water: ΔS_universe {led['generation']:.1f} J/K "
+          f"(problem_1046: {r['delta_S_total']:.1f})")
+
+    n_N2 = 1 / 28
+    led = entropy_ledger({'N2': body(293.15, C=n_N2 * 7.0 * cal)}, {},
+                         [heating('N2', 77.15), phase_change('N2', -47.6 * cal)])
+    print(f"1047 nitrogen: ΔS_N2 {led['delta_S']['N2']/cal:.3f} cal/K "
+          f"(problem_1047: -{problem_1047()['total']:.3f})")
+
+    r = problem_1050()
+    for kind, step in (('isothermal', isothermal_expansion('gas', 2.0, 'res')),
+                       ('free', free_expansion('gas', 2.0))):
+        led = entropy_ledger({'gas': body(300.0, C=1.5 * R)}, {'res': 300.0}, [step])
+        print(f"1050 {kind}: ΔS_universe {led['generation']:.2f} J/K "
+              f"(problem_1050: {r[kind]['universe']:.2f})")
+
+    led = entropy_ledger({'resistor': body(300.15, C=10.0)}, {'bath': 300.15},
+                         [joule_heating('resistor', 100**2 / 1000, 10, 'bath')])
+    print(f"1059 resistor: ΔS_total {led['generation']:.3f} J/K "
+          f"(problem_1059: {problem_1059(1000, 100, 10, 27)['delta_S_total']:.3f})")
+
+    led = entropy_ledger({'a': body(400.0, C=1.5 * R), 'b': body(300.0, C=1.5 * R)}, {},
+                         [thermal_contact('a', 'b')])
+    print(f"1060 gases: ΔS {led['generation']:.3f} J/K "
+          f"(problem_1060: {problem_1060(400, 300, 1, 1.5 * R)[0]:.3f})")
+
+    # Plant-level audit over a batch of operating scenarios
+    rng = np.random.default_rng(4)
+    S = 200_000
+    bodies = {'feed': body(rng.uniform(280, 300, S), C=4180.0 * rng.uniform(0.5, 2, S)),
+              'coil': body(300.0, C=500.0),
+              'gas': body(300.0, C=1.5 * R, n=1.0)}
+    reservoirs = {'boiler': rng.uniform(380, 450, S), 'cooling': 290.0}
+    steps = [heating('feed', 370.0, 'boiler'),
+             phase_change('feed', 2.26e6 * 0.1, 'boiler'),
+             joule_heating('coil', rng.uniform(1e3, 5e3, S), 60.0, 'cooling'),
+             free_expansion('gas', rng.uniform(1, 3, S)),
+             heating('feed', 300.0, 'cooling'),
+             thermal_contact('coil', 'gas')]
+    start = time.perf_counter()
+    led = entropy_ledger(bodies, reservoirs, steps)
+    full = time.perf_counter() - start
+    print(f"{S:,} scenarios × {len(steps)} steps in {full*1000:.0f} ms; "
+          f"min generation {led['generation'].min():.2f} J/K ≥ 0")
+    for index, step in ((3, free_expansion('gas', 4.0)),
+                        (2, joule_heating('coil', 2e3, 60.0))):
+        start = time.perf_counter()
+        update_step(led, index, step)
+        elapsed = time.perf_counter() - start
+        print(f"  Changing step {index} ({step['kind']}) recomputed steps "
+              f"{led['recomputed']} in {elapsed*1000:.0f} ms")
+    for entity, dS in led['delta_S'].items():
+        print(f"  ΔS[{entity:11s}] mean = {np.mean(dS):10.2f} J/K")
+    print()
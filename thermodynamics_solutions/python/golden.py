@@ -0,0 +1,484 @@
+"""
+Golden-Value Regression Suite for the Chapter Functions
+Scalar, batched and blocked evaluation with physical invariants, cached by source hash - Python Computational Solutions
+"""
+
+import argparse
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import sys
+import types
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import scipy
+
+from blocking import BLOCK
+
+_HERE = Path(__file__).resolve().parent
+GOLDEN = _HERE / 'tests' / 'golden_values.json'
+CACHE = _HERE / '.golden_cache.json'
+
+# Any change to this file (cases, invariants, tolerances) reruns every case
+HARNESS_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+RTOL_GOLDEN = 1e-10    # stored values vs now (room for another platform's libm)
+RTOL_MODES = 1e-12     # batched rows vs scalar calls, blocked vs unblocked
+N_BATCH = 32           # rows of the stored batched case
+N_PROPERTY = 4096      # random samples per invariant
+BLOCKED_ROWS = 2 * BLOCK + 5   # spans three evaluation blocks
+
+#=============================================================================
+# Cases
+#=============================================================================
+# Every function of the chapter modules, bar main() and the plots, has a
+# case. scalar holds the arguments of the module's own demo; batch maps
+# the arguments that are swept to (low, high), the rest keep their scalar
+# values; fixed arguments (species, flags) apply in every mode.
+_C1, _C2, _C3 = 'chapter1_first_law', 'chapter2_entropy', 'chapter3_functions'
+
+def _case(module, function, scalar=None, batch=None, fixed=None):
+    return {'module': module, 'function': function, 'scalar': scalar or {},
+            'batch': batch or {}, 'fixed': fixed or {}}
+
+_R = 8.314
+CASES = {
+    'problem_1003': _case(_C1, 'problem_1003', dict(x=0.002, alpha1=12e-6, alpha2=24e-6, delta_T=50),
+                          dict(x=(1e-3, 5e-3), alpha1=(1.1e-5, 1.3e-5), alpha2=(1.8e-5, 2.5e-5),
+                               delta_T=(10, 100))),
+    'problem_1006': _case(_C1, 'problem_1006', dict(mass_g=32, atomic_mass=64),
+                          dict(mass_g=(1, 100), atomic_mass=(20, 200))),
+    'problem_1008': _case(_C1, 'problem_1008', dict(h_i=10, h_f=10 * (1 - 1/1.4)),
+                          dict(h_i=(5, 15), h_f=(1, 4))),
+    'problem_1012': _case(_C1, 'problem_1012', dict(T0=300),
+                          dict(T0=(200, 400), V0_factor=(1.5, 3))),
+    'problem_1015': _case(_C1, 'problem_1015', dict(T_initial=300, p_ratio=10, gamma=1.4),
+                          dict(T_initial=(250, 350), p_ratio=(1, 20), gamma=(1.1, 1.67))),
+    'problem_1015[air]': _case(_C1, 'problem_1015', dict(T_initial=300, p_ratio=10, gamma=1.4),
+                               dict(T_initial=(250, 350), p_ratio=(1, 20)), dict(species='air')),
+    'problem_1016': _case(_C1, 'problem_1016', dict(T_i_celsius=0, V_ratio=10),
+                          dict(T_i_celsius=(-50, 50), V_ratio=(1, 20), gamma=(1.1, 1.67))),
+    'problem_1016[air]': _case(_C1, 'problem_1016', dict(T_i_celsius=0, V_ratio=10),
+                               dict(T_i_celsius=(-50, 50), V_ratio=(1, 20)), dict(species='air')),
+    'problem_1017': _case(_C1, 'problem_1017', dict(mass_g=1000, T1_C=-20, T2_C=100),
+                          dict(mass_g=(100, 2000), T1_C=(-50, 50), T2_C=(-50, 150))),
+    'problem_1018': _case(_C1, 'problem_1018'),
+    'problem_1019': _case(_C1, 'problem_1019', dict(V0=0.01, A=0.001, M=0.1, p0=101325, gamma=1.4),
+                          dict(V0=(1e-3, 2e-2), A=(1e-4, 1e-3), M=(0.01, 0.2), p0=(9e4, 1.1e5),
+                               gamma=(1.1, 1.67))),
+    'problem_1020': _case(_C1, 'problem_1020', dict(T=293, M=0.029, gamma=1.4),
+                          dict(T=(200, 400), M=(0.002, 0.044), gamma=(1.1, 1.67))),
+    'problem_1020[isothermal]': _case(_C1, 'problem_1020', dict(T=293, M=0.029),
+                                      dict(T=(200, 400), M=(0.002, 0.044)), dict(isothermal=True)),
+    'problem_1020[air]': _case(_C1, 'problem_1020', dict(T=293, M=0.029),
+                               dict(T=(200, 1500)), dict(species='air')),
+    'problem_1022': _case(_C1, 'problem_1022'),
+    'problem_1024': _case(_C1, 'problem_1024', dict(T1=4.2, T2=300, R_reflectivity=0.95),
+                          dict(T1=(4, 77), T2=(200, 400), R_reflectivity=(0, 0.99))),
+    'problem_1027': _case(_C1, 'problem_1027', {},
+                          dict(J_earth=(1e3, 1.5e3), r_sun=(6e8, 8e8), r_SE=(1e11, 2e11))),
+    'problem_1030': _case(_C1, 'problem_1030'),
+    'problem_1031': _case(_C2, 'problem_1031', dict(T_intake_C=400, T_exhaust_C=150, Q=1000),
+                          dict(T_intake_C=(100, 600), T_exhaust_C=(20, 90), Q=(1, 1e4))),
+    'carnot_efficiency': _case(_C2, 'carnot_efficiency', dict(T_hot=600, T_cold=300),
+                               dict(T_hot=(400, 1000), T_cold=(250, 350))),
+    'problem_1035': _case(_C2, 'problem_1035', dict(T1=400, T2=300, N=1, C=_R),
+                          dict(T1=(300, 500), T2=(100, 500), N=(1, 10), C=(5, 30))),
+    'problem_1039': _case(_C2, 'problem_1039', dict(T0=273, W=1000, alpha=50),
+                          dict(T0=(230, 300), W=(100, 5000), alpha=(10, 200))),
+    'problem_1040': _case(_C2, 'problem_1040', dict(T1_C=2, T2_C=27),
+                          dict(T1_C=(-20, 10), T2_C=(15, 25))),
+    'problem_1044': _case(_C2, 'problem_1044', dict(T1_C=0, T2_C=30, Cv_cal=5.85),
+                          dict(T1_C=(-20, 100), T2_C=(-20, 100), Cv_cal=(5, 7))),
+    'problem_1046': _case(_C2, 'problem_1046', dict(m_kg=1, T1_C=0, T2_C=100),
+                          dict(m_kg=(0.1, 10), T1_C=(0, 100), T2_C=(0, 100))),
+    'problem_1047': _case(_C2, 'problem_1047'),
+    'problem_1048': _case(_C2, 'problem_1048', dict(m_kg=3, T1_C=20, T2_C=0),
+                          dict(m_kg=(0.1, 10), T1_C=(10, 40), T2_C=(-20, -1))),
+    'problem_1050': _case(_C2, 'problem_1050'),
+    'problem_1059': _case(_C2, 'problem_1059', dict(R_ohm=1000, V=100, t=10, T_C=27),
+                          dict(R_ohm=(10, 1e4), V=(1, 500), t=(1, 100), T_C=(0, 100))),
+    'problem_1060': _case(_C2, 'problem_1060', dict(T1=400, T2=300, n=1, Cv=1.5 * _R),
+                          dict(T1=(100, 500), T2=(100, 500), n=(0.5, 5), Cv=(10, 30))),
+    'isothermal_atmosphere': _case(_C3, 'isothermal_atmosphere', dict(z=1000, p0=101325, T0=288, mu=0.029),
+                                   dict(z=(0, 3e4), p0=(9e4, 1.1e5), T0=(200, 320), mu=(0.002, 0.044))),
+    'adiabatic_atmosphere': _case(_C3, 'adiabatic_atmosphere',
+                                  dict(z=1000, p0=101325, T0=288, mu=0.029, gamma=1.4),
+                                  dict(z=(0, 5e3), p0=(9e4, 1.1e5), T0=(250, 320), mu=(0.002, 0.03),
+                                       gamma=(1.1, 1.67))),
+    'adiabatic_atmosphere[air]': _case(_C3, 'adiabatic_atmosphere',
+                                       dict(z=1000, p0=101325, T0=288, mu=0.029, gamma=1.4),
+                                       dict(z=(0, 1e4)), dict(species='air')),
+    'scale_height': _case(_C3, 'scale_height', dict(T=288, mu=0.029),
+                          dict(T=(150, 400), mu=(0.002, 0.044))),
+    'clausius_clapeyron': _case(_C3, 'clausius_clapeyron',
+                                dict(L=40.7e3, T=373.15, delta_V=_R * 373.15 / 101325 - 18e-6),
+                                dict(L=(1e4, 5e4), T=(250, 400), delta_V=(1e-3, 5e-2))),
+    'joule_thomson_ideal': _case(_C3, 'joule_thomson_ideal'),
+    'joule_thomson_vdw': _case(_C3, 'joule_thomson_vdw', dict(a=0.1408, b=3.913e-5, Cp=29.1, T=300, V=None),
+                               dict(a=(0.1, 0.2), b=(3e-5, 4e-5), Cp=(20, 40), T=(150, 1000))),
+    'chemical_potential_ideal_gas': _case(_C3, 'chemical_potential_ideal_gas',
+                                          dict(mu0=0.0, T=298.15, p=2e5),
+                                          dict(mu0=(-2e5, -1e5), T=(250, 400), p=(1e3, 1e7))),
+    'adiabatic_demagnetization': _case(_C3, 'adiabatic_demagnetization', dict(Ti=1.0, Hi=5.0, Hf=0.01),
+                                       dict(Ti=(0.1, 2), Hi=(1, 10), Hf=(0.001, 0.5))),
+}
+
+#=============================================================================
+# Invariants
+#=============================================================================
+# (claim, check(arguments, result) → boolean array), tested on N_PROPERTY
+# random points of the batch domain. These are the claims the demos print.
+def _close(a, b, rtol=1e-12):
+    return np.isclose(a, b, rtol=rtol, atol=0)
+
+INVARIANTS = {
+    'problem_1003': [('alpha2 > alpha1 bends the strip: R > 0', lambda s, r: r > 0)],
+    'problem_1006': [('Dulong-Petit: 3R per mole',
+                      lambda s, r: _close(r * s['atomic_mass'] / s['mass_g'], 3 * _R))],
+    'problem_1008': [('gamma > 1', lambda s, r: r > 1)],
+    'problem_1012': [('isothermal: Q = W, ΔU = 0',
+                      lambda s, r: (r['isothermal']['Q'] == r['isothermal']['W'])
+                      & (r['isothermal']['ΔU'] == 0)),
+                     ('isobaric: Q = ΔU + W',
+                      lambda s, r: _close(r['isobaric']['Q'], r['isobaric']['ΔU'] + r['isobaric']['W']))],
+    'problem_1015': [('adiabatic compression heats the gas', lambda s, r: r >= s['T_initial'])],
+    'problem_1015[air]': [('adiabatic compression heats the gas', lambda s, r: r >= s['T_initial'])],
+    'problem_1016': [('expansion: W ≥ 0 and the gas cools',
+                      lambda s, r: (r[0] >= 0) & (r[1] <= s['T_i_celsius'] + 273.15))],
+    'problem_1016[air]': [('expansion: W ≥ 0 and the gas cools',
+                           lambda s, r: (r[0] >= 0) & (r[1] <= s['T_i_celsius'] + 273.15 + 1e-9))],
+    'problem_1017': [('Q_p = ΔU + W', lambda s, r: _close(r['Q_p'], r['ΔU'] + r['W'])),
+                     ('Q_v = ΔU', lambda s, r: r['Q_v'] == r['ΔU'])],
+    'problem_1019': [('f > 0', lambda s, r: r > 0)],
+    'problem_1020': [('c > 0', lambda s, r: r > 0)],
+    'problem_1020[isothermal]': [('Newton: c² = RT/M', lambda s, r: _close(r**2 * s['M'] / s['T'], _R))],
+    'problem_1020[air]': [('air: √(RT/M) < c < √(1.41 RT/M)',
+                           lambda s, r: (r**2 * s['M'] / (_R * s['T']) > 1)
+                           & (r**2 * s['M'] / (_R * s['T']) < 1.41))],
+    'problem_1024': [('T1 ≤ T3 ≤ T2', lambda s, r: (r['T3'] >= s['T1']) & (r['T3'] <= s['T2'])),
+                     ('shield passes at most half the flux', lambda s, r: (r['ratio'] >= 0) & (r['ratio'] <= 0.5)),
+                     ('J > 0 for T2 > T1', lambda s, r: r['J'] > 0)],
+    'problem_1027': [('flux balance J = σT⁴(r_sun/r_SE)²',
+                      lambda s, r: _close(5.67e-8 * r**4 * (s['r_sun'] / s['r_SE'])**2, s['J_earth']))],
+    'problem_1031': [('efficiency is the Carnot bound 1 - T2/T1',
+                      lambda s, r: _close(r[1], 1 - (s['T_exhaust_C'] + 273.15) / (s['T_intake_C'] + 273.15), 1e-10)),
+                     ('W_max ≤ Q', lambda s, r: r[0] <= s['Q'])],
+    'carnot_efficiency': [('0 ≤ η < 1', lambda s, r: (r >= 0) & (r < 1))],
+    'problem_1035': [('W ≥ 0', lambda s, r: r[1] >= 0),
+                     ('Tf between the initial temperatures',
+                      lambda s, r: (r[0] >= np.minimum(s['T1'], s['T2'])) & (r[0] <= np.maximum(s['T1'], s['T2'])))],
+    'problem_1039': [('heat pump beats a heater: Te ≥ T0 + W/α',
+                      lambda s, r: r >= s['T0'] + s['W'] / s['alpha'])],
+    'problem_1040': [('COP ≥ 1', lambda s, r: r >= 1)],
+    'problem_1044': [('ΔS has the sign of T2 - T1', lambda s, r: np.sign(r) == np.sign(s['T2_C'] - s['T1_C']))],
+    'problem_1046': [('ΔS_universe ≥ 0', lambda s, r: r['delta_S_total'] >= 0),
+                     ('ΔS_universe = ΔS_water + ΔS_reservoir',
+                      lambda s, r: np.abs(r['delta_S_water'] + r['delta_S_reservoir'] - r['delta_S_total'])
+                      <= 1e-12 * np.abs(r['delta_S_water']) + 1e-12)],
+    'problem_1048': [('W ≥ 0', lambda s, r: r[0] >= 0),
+                     ('COP is the Carnot limit T2/(T1 - T2)',
+                      lambda s, r: _close(r[2], (s['T2_C'] + 273.15) / (s['T1_C'] - s['T2_C']), 1e-10))],
+    'problem_1059': [('ΔS_universe ≥ 0', lambda s, r: r['delta_S_total'] >= 0)],
+    'problem_1060': [('ΔS_universe ≥ 0', lambda s, r: r[0] >= 0),
+                     ('Tf between the initial temperatures',
+                      lambda s, r: (r[1] >= np.minimum(s['T1'], s['T2'])) & (r[1] <= np.maximum(s['T1'], s['T2'])))],
+    'isothermal_atmosphere': [('0 < p ≤ p0', lambda s, r: (r > 0) & (r <= s['p0']))],
+    'adiabatic_atmosphere': [('T and p fall with height',
+                              lambda s, r: (r[1] <= s['T0']) & (r[0] <= s['p0']) & (r[0] > 0))],
+    'adiabatic_atmosphere[air]': [('T and p fall with height',
+                                   lambda s, r: (r[1] <= s['T0']) & (r[0] <= s['p0']) & (r[0] > 0))],
+    'scale_height': [('H > 0', lambda s, r: r > 0)],
+    'clausius_clapeyron': [('dp/dT > 0 for L, ΔV > 0', lambda s, r: r > 0)],
+    'joule_thomson_vdw': [('cools below the inversion temperature 2a/(Rb)',
+                           lambda s, r: np.sign(r) == np.sign(2 * s['a'] / (_R * s['b']) - s['T']))],
+    'chemical_potential_ideal_gas': [('μ - μ° has the sign of p - p°',
+                                      lambda s, r: np.sign(r - s['mu0']) == np.sign(s['p'] - 101325))],
+    'adiabatic_demagnetization': [('Curie law: Tf/Ti = Hf/Hi', lambda s, r: _close(r / s['Ti'], s['Hf'] / s['Hi'])),
+                                  ('demagnetizing cools', lambda s, r: r <= s['Ti'])],
+}
+
+#=============================================================================
+# Results as Named Leaves
+#=============================================================================
+def _leaves(result, path=''):
+    """(path, value) for every leaf of an array, tuple or nested dict result."""
+    if isinstance(result, dict):
+        for k, v in result.items():
+            yield from _leaves(v, f'{path}.{k}' if path else str(k))
+    elif isinstance(result, (tuple, list)):
+        for i, v in enumerate(result):
+            yield from _leaves(v, f'{path}.{i}' if path else str(i))
+    else:
+        yield path or 'result', result
+
+def _plain(value):
+    """JSON form of a leaf."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def _compare(got, want, rtol):
+    """Messages for leaves of got that differ from want (both path → value)."""
+    if set(got) != set(want):
+        return [f"result leaves {sorted(got)} != {sorted(want)}"]
+    failures = []
+    for path, w in want.items():
+        g = got[path]
+        if w is None or g is None:
+            if g is not w:
+                failures.append(f"{path}: {g!r} != {w!r}")
+            continue
+        g, w = np.asarray(g, dtype=np.float64), np.asarray(w, dtype=np.float64)
+        if g.shape != w.shape:
+            failures.append(f"{path}: shape {g.shape} != {w.shape}")
+        elif not np.allclose(g, w, rtol=rtol, atol=0, equal_nan=True):
+            i = np.argmax(np.abs(g - w) - rtol * np.abs(w)) if g.ndim else ()
+            failures.append(f"{path}: {float(g[i])!r} != {float(w[i])!r}" + (f" (row {i})" if g.ndim else ''))
+    return failures
+
+def _sample(case_id, domains, n, salt=''):
+    """Reproducible uniform samples of the batch domain."""
+    rng = np.random.default_rng(zlib.crc32((case_id + salt).encode()))
+    return {k: rng.uniform(lo, hi, n) for k, (lo, hi) in domains.items()}
+
+def _mirror(result, n):
+    """Uninitialized out= buffers shaped like the full-length leaves of result."""
+    if isinstance(result, dict):
+        return {k: _mirror(v, n) for k, v in result.items()}
+    if isinstance(result, tuple):
+        return tuple(_mirror(v, n) for v in result)
+    if isinstance(result, np.ndarray) and result.ndim and result.shape[0] == n:
+        return np.empty_like(result)
+    return None
+
+#=============================================================================
+# Source Hashes
+#=============================================================================
+def _is_local(obj):
+    try:
+        return Path(inspect.getsourcefile(obj)).resolve().parent == _HERE
+    except TypeError:
+        return False
+
+def _code_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _code_names(const)
+    return names
+
+def source_hash(func):
+    """
+    Hash of everything a function's values depend on in this directory.
+
+    Covers the decorator modules it is wrapped by (precision, blocking),
+    its own source, and recursively the local functions (also behind
+    lru_cache or other wrappers), whole local modules, data and
+    constants it refers to by name.
+    """
+    parts, seen = [], set()
+
+    def visit(f):
+        while hasattr(f, '__wrapped__'):
+            if inspect.isfunction(f):   # a local decorator; lru_cache has no source
+                parts.append(Path(inspect.getsourcefile(f)).read_text(encoding='utf-8'))
+            f = f.__wrapped__
+        if id(f) in seen:
+            return
+        seen.add(id(f))
+        parts.append(inspect.getsource(f))
+        for name in sorted(_code_names(f.__code__)):
+            obj = f.__globals__.get(name)
+            if callable(obj) and inspect.isfunction(inspect.unwrap(obj)) \
+                    and _is_local(inspect.unwrap(obj)):
+                visit(obj)
+            elif inspect.ismodule(obj) and _is_local(obj) and id(obj) not in seen:
+                seen.add(id(obj))
+                parts.append(inspect.getsource(obj))
+            elif isinstance(obj, np.ndarray):
+                parts.append(f"{name}={hashlib.sha256(obj.tobytes()).hexdigest()}")
+            elif isinstance(obj, (int, float, complex, str, tuple, list, dict)):
+                parts.append(f"{name}={obj!r}")
+
+    visit(func)
+    return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+#=============================================================================
+# Checking One Case
+#=============================================================================
+def _function(case):
+    return getattr(importlib.import_module(case['module']), case['function'])
+
+def _batched_checks(case_id, case, func, inputs, batched):
+    """Rows against scalar calls, blocked inputs and out= buffers against the batch."""
+    failures = []
+    call = lambda **kw: func(**{**case['scalar'], **kw}, **case['fixed'])
+    for i in range(N_BATCH):
+        row = dict(_leaves(call(**{k: float(v[i]) for k, v in inputs.items()})))
+        want = {p: (v[i] if isinstance(v, np.ndarray) and v.ndim else v) for p, v in batched.items()}
+        failures += [f"row {i} vs scalar call: {m}" for m in _compare(row, want, RTOL_MODES)]
+        if failures:
+            break
+
+    big = {k: np.resize(v, BLOCKED_ROWS) for k, v in inputs.items()}
+    expect = {p: (np.resize(v, BLOCKED_ROWS) if isinstance(v, np.ndarray) and v.ndim else v)
+              for p, v in batched.items()}
+    result = call(**big)
+    failures += [f"blocked: {m}" for m in _compare(dict(_leaves(result)), expect, RTOL_MODES)]
+    out = _mirror(result, BLOCKED_ROWS)
+    buffers = [a for _, a in _leaves(out) if a is not None]
+    with_out = call(**big, out=out)
+    failures += [f"out=: {m}" for m in _compare(dict(_leaves(with_out)), expect, RTOL_MODES)]
+    if not any(np.shares_memory(a, b) for _, a in _leaves(with_out) if isinstance(a, np.ndarray)
+               for b in buffers):
+        failures.append("out=: no result was written to the buffers")
+    return failures
+
+def _check(job):
+    """Worker: run every mode of one case; returns its values and failures."""
+    case_id, case, golden = job['case_id'], job['case'], job['golden']
+    failures, values = [], {}
+    try:
+        func = _function(case)
+        values['scalar'] = {p: _plain(v) for p, v in
+                            _leaves(func(**case['scalar'], **case['fixed']))}
+        if case['batch']:
+            inputs = ({k: np.array(v) for k, v in golden['batch_inputs'].items()}
+                      if golden and 'batch_inputs' in golden else
+                      _sample(case_id, case['batch'], N_BATCH))
+            batched = dict(_leaves(func(**{**case['scalar'], **inputs}, **case['fixed'])))
+            values['batch_inputs'] = {k: v.tolist() for k, v in inputs.items()}
+            values['batched'] = {p: _plain(v) for p, v in batched.items()}
+            failures += _batched_checks(case_id, case, func, inputs, batched)
+            sample = _sample(case_id, case['batch'], N_PROPERTY, salt='property')
+            result = func(**{**case['scalar'], **sample}, **case['fixed'])
+            args = {**case['scalar'], **sample}
+            for claim, holds in INVARIANTS.get(case_id, []):
+                ok = np.broadcast_to(holds(args, result), (N_PROPERTY,))
+                if not ok.all():
+                    i = int(np.argmin(ok))
+                    failures.append(f"invariant '{claim}' fails at "
+                                    f"{ {k: float(v[i]) for k, v in sample.items()} }")
+        if not job['update']:
+            if golden is None:
+                failures.append("no golden values (run golden.py --update)")
+            else:
+                for mode in ('scalar', 'batched'):
+                    failures += [f"{mode} golden: {m}" for m in
+                                 _compare(values.get(mode, {}), golden.get(mode, {}), RTOL_GOLDEN)]
+    except Exception as error:   # report, do not abort the whole run
+        failures.append(f"{type(error).__name__}: {error}")
+    return {'case': case_id, 'key': job['key'], 'ok': not failures,
+            'failures': failures, 'values': values}
+
+#=============================================================================
+# Cached, Parallel Suite
+#=============================================================================
+def run_golden(cases=None, golden_path=GOLDEN, cache_path=CACHE, jobs=None, update=False):
+    """
+    Check every case against its golden values, modes and invariants.
+
+    A case is keyed by the source hash of its function, its stored golden
+    values, this harness and the numpy and scipy versions. Cases whose key passed
+    before are skipped; the rest run in a process pool.
+
+    Parameters:
+        cases: case ids to run (default all of CASES)
+        golden_path: JSON file of golden values
+        cache_path: JSON file of passing keys (None disables caching)
+        jobs: worker processes (default os.cpu_count())
+        update: store the current values as the goldens instead of
+                comparing with them (the other checks still apply)
+
+    Returns:
+        dict with results (case → ok, failures, cached), failed (case
+        ids) and evaluated (count run this time)
+    """
+    selected = sorted(CASES) if cases is None else list(cases)
+    goldens = {}
+    if Path(golden_path).exists():
+        goldens = json.loads(Path(golden_path).read_text(encoding='utf-8'))
+    cache = {}
+    if cache_path is not None and Path(cache_path).exists():
+        cache = json.loads(Path(cache_path).read_text(encoding='utf-8'))
+        if cache.get('version') != HARNESS_VERSION:
+            cache = {}
+    passed = cache.get('passed', {})
+
+    results, pending = {}, []
+    for case_id in selected:
+        golden = goldens.get(case_id)
+        key = hashlib.sha256(json.dumps([HARNESS_VERSION, np.__version__, scipy.__version__,
+                                         source_hash(_function(CASES[case_id])),
+                                         CASES[case_id], golden], sort_keys=True,
+                                        default=str).encode()).hexdigest()
+        if not update and passed.get(case_id) == key:
+            results[case_id] = {'case': case_id, 'key': key, 'ok': True,
+                                'failures': [], 'cached': True}
+        else:
+            pending.append({'case_id': case_id, 'case': CASES[case_id], 'golden': golden,
+                            'key': key, 'update': update})
+
+    if pending:
+        workers = min(jobs or os.cpu_count() or 1, len(pending))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for r in pool.map(_check, pending):
+                results[r['case']] = {**r, 'cached': False}
+
+    if update and pending:
+        for job in pending:
+            goldens[job['case_id']] = results[job['case_id']].pop('values')
+        Path(golden_path).write_text(json.dumps(goldens, indent=1, sort_keys=True, ensure_ascii=False)
+                                     + '\n', encoding='utf-8')
+    if cache_path is not None and not update:
+        new_passed = {**passed, **{c: r['key'] for c, r in results.items() if r['ok']}}
+        for c, r in results.items():
+            if not r['ok']:
+                new_passed.pop(c, None)
+        new_cache = {'version': HARNESS_VERSION, 'passed': new_passed}
+        if new_cache != cache:
+            Path(cache_path).write_text(json.dumps(new_cache, indent=1, sort_keys=True) + '\n',
+                                        encoding='utf-8')
+    for r in results.values():
+        r.pop('values', None)
+    return {'results': results, 'failed': sorted(c for c, r in results.items() if not r['ok']),
+            'evaluated': len(pending)}
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    import time
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('cases', nargs='*', help='case ids (default all)')
+    parser.add_argument('--update', action='store_true', help='store current values as goldens')
+    parser.add_argument('--no-cache', action='store_true', help='rerun unchanged cases too')
+    parser.add_argument('--jobs', type=int, default=None, help='worker processes')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Golden-Value Regression Suite")
+    print("=" * 60)
+    start = time.perf_counter()
+    report = run_golden(args.cases or None, cache_path=None if args.no_cache else CACHE,
+                        jobs=args.jobs, update=args.update)
+    elapsed = time.perf_counter() - start
+    for case_id, r in sorted(report['results'].items()):
+        status = 'cached' if r['cached'] else 'ok    ' if r['ok'] else 'FAILED'
+        print(f"  {status} {case_id}")
+        for message in r['failures']:
+            print(f"           {message}")
+    print(f"  {len(report['results'])} cases, {len(report['failed'])} failed, "
+          f"{report['evaluated']} evaluated this run in {elapsed:.2f} s"
+          + (f"; goldens written to {GOLDEN.relative_to(_HERE)}" if args.update else ''))
+    print()
+    sys.exit(1 if report['failed'] else 0)
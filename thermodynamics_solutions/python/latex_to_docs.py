@@ -0,0 +1,331 @@
+"""
+LaTeX Solutions to Docusaurus Markdown
+Incremental, content-hashed conversion of latex/chapter*/problems_*.tex - Python Computational Solutions
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+_HERE = Path(__file__).resolve().parent
+LATEX_DIR = _HERE.parent / 'latex'
+DOCS_DIR = _HERE.parents[1] / 'docs-site' / 'docs' / 'solutions' / 'latex'
+MANIFEST = _HERE.parents[1] / 'docs-site' / '.latex-manifest.json'
+
+# Any change to this file changes the converter version and forces a rebuild
+CONVERTER_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+#=============================================================================
+# Inline Text Conversion
+#=============================================================================
+_INLINE_MATH = re.compile(r'(\$[^$]+\$)')
+_TEXT_COMMANDS = [
+    (re.compile(r'\\textbf\{([^{}]*)\}'), r'**\1**'),
+    (re.compile(r'\\(?:textit|emph)\{([^{}]*)\}'), r'*\1*'),
+    (re.compile(r'\\texttt\{([^{}]*)\}'), r'`\1`'),
+]
+_TEXT_REPLACEMENTS = [
+    ('``', '"'), ("''", '"'), ('\\%', '%'), ('\\&', '&'), ('\\_', '_'),
+    ('~', ' '), ('\\ldots', '...'), ('\\dots', '...'),
+]
+
+def _convert_text(segment):
+    """Text-mode LaTeX (no math) to MDX-safe markdown."""
+    for old, new in _TEXT_REPLACEMENTS:
+        segment = segment.replace(old, new)
+    for pattern, repl in _TEXT_COMMANDS:
+        segment = pattern.sub(repl, segment)
+    # braces and angle brackets are JSX syntax in MDX
+    return segment.replace('{', '\\{').replace('}', '\\}').replace('<', '&lt;')
+
+def convert_inline(line):
+    """Convert a line of running text, leaving $...$ math untouched."""
+    parts = _INLINE_MATH.split(line)
+    return ''.join(p if i % 2 else _convert_text(p) for i, p in enumerate(parts))
+
+def _strip_comment(line):
+    """Drop an unescaped % comment."""
+    match = re.search(r'(?<!\\)%', line)
+    return line if match is None else line[:match.start()].rstrip()
+
+#=============================================================================
+# Block Conversion
+#=============================================================================
+_DISPLAY_ENVS = {'equation': None, 'equation*': None, 'align': 'aligned',
+                 'align*': 'aligned', 'gather': 'gathered', 'gather*': 'gathered'}
+_BEGIN = re.compile(r'\\begin\{([a-z]+\*?)\}(\{[^}]*\})?')
+_SECTION = re.compile(r'\\section\*?\{(.*)\}')
+_SUBSECTION = re.compile(r'\\(sub)?subsection\*?\{(.*)\}')
+_SOURCE_NOTE = re.compile(r'\\textbf\{(\([^)]*\))\}\s*$')
+
+def _table(rows):
+    """tabular rows (already split on \\\\) to a markdown table."""
+    cells = [[convert_inline(c.strip()) for c in row.split('&')] for row in rows]
+    width = max(len(r) for r in cells)
+    cells = [r + [''] * (width - len(r)) for r in cells]
+    out = ['| ' + ' | '.join(cells[0]) + ' |', '|' + '---|' * width]
+    out += ['| ' + ' | '.join(r) + ' |' for r in cells[1:]]
+    return out
+
+def convert_body(tex):
+    """
+    Convert the body of a problems_*.tex file to markdown lines.
+
+    Handles the constructs the solution files use: \\section (problem
+    headers, with the following \\textbf{(School)} line folded in),
+    \\subsection*, equation/align display math, itemize/enumerate,
+    center+tabular, and inline \\textbf/\\textit/\\emph/\\texttt.
+    """
+    lines = [_strip_comment(l) for l in tex.splitlines()
+             if not l.lstrip().startswith('%')]
+    out = []
+    n_sections = 0
+    i = 0
+    while i < len(lines):
+        line = lines[i].strip()
+        i += 1
+        section = _SECTION.fullmatch(line)
+        if section:
+            title = convert_inline(section.group(1))
+            while i < len(lines) and not lines[i].strip():
+                i += 1
+            note = _SOURCE_NOTE.match(lines[i].strip()) if i < len(lines) else None
+            if note:
+                title += f' {note.group(1)}'
+                i += 1
+            if n_sections:
+                out += ['', '---', '']
+            out += [f'## {title}', '']
+            n_sections += 1
+            continue
+        sub = _SUBSECTION.fullmatch(line)
+        if sub:
+            out += ['#' * (4 if sub.group(1) else 3) + ' ' + convert_inline(sub.group(2)), '']
+            continue
+        begin = _BEGIN.match(line)
+        if begin:
+            env = begin.group(1)
+            body = []
+            while i < len(lines) and not lines[i].strip().startswith(f'\\end{{{env}}}'):
+                body.append(lines[i].strip())
+                i += 1
+            i += 1
+            out += _convert_env(env, body)
+            continue
+        out.append(convert_inline(line))
+    # collapse runs of blank lines
+    text = re.sub(r'\n{3,}', '\n\n', '\n'.join(out).strip('\n'))
+    return text.split('\n')
+
+def _convert_env(env, body):
+    """Markdown lines for one \\begin{env} ... \\end{env} block."""
+    if env in _DISPLAY_ENVS:
+        math = [re.sub(r'\\(label\{[^}]*\}|nonumber|notag)', '', l).rstrip() for l in body]
+        math = [l for l in math if l]
+        inner = _DISPLAY_ENVS[env]
+        if inner:
+            math = [f'\\begin{{{inner}}}'] + math + [f'\\end{{{inner}}}']
+        return ['', '$$'] + math + ['$$', '']
+    if env in ('itemize', 'enumerate'):
+        marker = '-' if env == 'itemize' else '1.'
+        items = []
+        for l in body:
+            if l.startswith('\\item'):
+                items.append(l[len('\\item'):].strip())
+            elif l and items:
+                items[-1] += ' ' + l
+        return [''] + [f'{marker} {convert_inline(t)}' for t in items] + ['']
+    if env == 'tabular':
+        rows = ' '.join(l for l in body if l != '\\hline').split('\\\\')
+        rows = [r.replace('\\hline', '').strip() for r in rows]
+        return [''] + _table([r for r in rows if r]) + ['']
+    if env == 'center':
+        # only tables are centred in the solution files; recurse on the body
+        return [''] + convert_body('\n'.join(body)) + ['']
+    return [''] + [convert_inline(l) for l in body] + ['']
+
+#=============================================================================
+# Documents, Jobs and the Manifest
+#=============================================================================
+def output_path(tex_path, latex_dir=LATEX_DIR, docs_dir=DOCS_DIR):
+    """chapter1_first_law/problems_1001_1010.tex → chapter1/problems-1001-1010.md"""
+    rel = Path(tex_path).relative_to(latex_dir)
+    chapter = re.match(r'chapter\d+', rel.parts[0]).group(0)
+    return Path(docs_dir) / chapter / (rel.stem.replace('_', '-') + '.md')
+
+def chapter_titles(latex_dir=LATEX_DIR):
+    """Map each \\input file of main.tex to its \\chapter title."""
+    main = Path(latex_dir) / 'main.tex'
+    titles, current = {}, None
+    if not main.exists():
+        return titles
+    for line in main.read_text(encoding='utf-8').splitlines():
+        chapter = re.match(r'\\chapter\{(.*?)(\s*\(\d+-\d+\))?\}', line.strip())
+        if chapter:
+            current = chapter.group(1)
+        source = re.match(r'\\input\{(.*)\}', line.strip())
+        if source and current:
+            titles[source.group(1)] = current
+    return titles
+
+def render(tex, first, last, subtitle, position):
+    """Full markdown document for one problems file."""
+    title = f'Problems {first}-{last}' + (f': {subtitle}' if subtitle else '')
+    header = ['---', f'sidebar_position: {position}', '---', '', f'# {title}', '']
+    return '\n'.join(header + convert_body(tex)) + '\n'
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+def _convert_job(job):
+    """Worker: convert one file and write it only if the bytes changed."""
+    tex = Path(job['source']).read_text(encoding='utf-8')
+    text = render(tex, job['first'], job['last'], job['subtitle'], job['position'])
+    data = text.encode('utf-8')
+    out = Path(job['output'])
+    if not (out.exists() and out.read_bytes() == data):
+        out.parent.mkdir(parents=True, exist_ok=True)
+        tmp = out.with_suffix('.md.tmp')
+        tmp.write_bytes(data)
+        os.replace(tmp, out)
+        job['written'] = True
+    else:
+        job['written'] = False
+    job['output_sha256'] = _sha256(data)
+    return job
+
+def _source_hash(path, previous):
+    """Content hash, reusing the manifest's when size and mtime are unchanged."""
+    stat = path.stat()
+    if previous and previous.get('size') == stat.st_size and \
+            previous.get('mtime_ns') == stat.st_mtime_ns:
+        return previous['source_sha256'], stat
+    return _sha256(path.read_bytes()), stat
+
+def build_docs(latex_dir=LATEX_DIR, docs_dir=DOCS_DIR, manifest_path=MANIFEST,
+               jobs=None, force=False):
+    """
+    Convert every changed problems_*.tex into Docusaurus markdown.
+
+    A file is reconverted only when its build key changes: the source
+    hash, its sidebar position, chapter title and the converter version.
+    Outputs whose bytes would not change are never rewritten, so their
+    mtimes (and the docs build cache) stay warm. Outputs that exist but
+    were not produced by this tool (hand-written pages), or were edited
+    after generation, are left alone unless force=True.
+
+    Parameters:
+        latex_dir: directory holding chapter*/problems_*.tex
+        docs_dir: output directory (solutions/latex of the docs site)
+        manifest_path: JSON manifest of hashes from the previous build
+        jobs: worker processes (default: os.cpu_count())
+        force: reconvert and overwrite everything
+
+    Returns:
+        dict with lists converted, written, unchanged, skipped_manual, removed
+    """
+    latex_dir, docs_dir, manifest_path = Path(latex_dir), Path(docs_dir), Path(manifest_path)
+    manifest = {}
+    if manifest_path.exists() and not force:
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    previous = manifest.get('files', {}) if manifest.get('version') == CONVERTER_VERSION else {}
+    old_files = manifest.get('files', {})
+    titles = chapter_titles(latex_dir)
+
+    sources = sorted(latex_dir.glob('chapter*/problems_*.tex'))
+    by_chapter = {}
+    for path in sources:
+        by_chapter.setdefault(path.parent, []).append(path)
+
+    report = {'converted': [], 'written': [], 'unchanged': [], 'skipped_manual': [],
+              'removed': []}
+    files, pending = {}, []
+    for chapter_dir, paths in by_chapter.items():
+        paths.sort(key=lambda p: [int(n) for n in re.findall(r'\d+', p.stem)])
+        for position, path in enumerate(paths, start=1):
+            rel = path.relative_to(latex_dir).as_posix()
+            out = output_path(path, latex_dir, docs_dir)
+            first, last = (re.findall(r'\d+', path.stem) + ['', ''])[:2]
+            source_sha, stat = _source_hash(path, old_files.get(rel))
+            entry = {'source_sha256': source_sha, 'size': stat.st_size,
+                     'mtime_ns': stat.st_mtime_ns, 'output': out.relative_to(docs_dir).as_posix()}
+            key = _sha256(json.dumps([CONVERTER_VERSION, source_sha, position,
+                                      titles.get(rel[:-4], '')]).encode())
+            entry['key'] = key
+            prior = old_files.get(rel, {})
+            out_exists = out.exists()
+            current_out = _sha256(out.read_bytes()) if out_exists else None
+            if out_exists and not force and current_out != prior.get('output_sha256'):
+                report['skipped_manual'].append(rel)
+                continue
+            if previous.get(rel, {}).get('key') == key and out_exists:
+                entry['output_sha256'] = current_out
+                files[rel] = entry
+                report['unchanged'].append(rel)
+                continue
+            pending.append({**entry, 'rel': rel, 'source': str(path), 'output': str(out),
+                            'first': first, 'last': last, 'position': position,
+                            'subtitle': titles.get(rel[:-4], '')})
+
+    if pending:
+        workers = min(jobs or os.cpu_count() or 1, len(pending))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                done = list(pool.map(_convert_job, pending))
+        else:
+            done = [_convert_job(job) for job in pending]
+        for job in done:
+            rel = job.pop('rel')
+            report['converted'].append(rel)
+            if job.pop('written'):
+                report['written'].append(rel)
+            files[rel] = {k: job[k] for k in ('source_sha256', 'size', 'mtime_ns', 'key',
+                                              'output_sha256')}
+            files[rel]['output'] = Path(job['output']).relative_to(docs_dir).as_posix()
+
+    # sources that disappeared: delete their outputs if still as generated
+    for rel, entry in old_files.items():
+        if rel in files or rel in report['skipped_manual']:
+            continue
+        out = docs_dir / entry['output']
+        if out.exists() and _sha256(out.read_bytes()) == entry.get('output_sha256'):
+            out.unlink()
+            report['removed'].append(rel)
+
+    new_manifest = {'version': CONVERTER_VERSION, 'files': dict(sorted(files.items()))}
+    if new_manifest != manifest:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(json.dumps(new_manifest, indent=1) + '\n', encoding='utf-8')
+    return report
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    import time
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--latex', default=LATEX_DIR, help='LaTeX source directory')
+    parser.add_argument('--out', default=DOCS_DIR, help='markdown output directory')
+    parser.add_argument('--manifest', default=MANIFEST, help='hash manifest path')
+    parser.add_argument('--jobs', type=int, default=None, help='worker processes')
+    parser.add_argument('--force', action='store_true',
+                        help='reconvert everything, overwriting hand-written pages')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("LaTeX → Docusaurus: Incremental Solution Pages")
+    print("=" * 60)
+    start = time.perf_counter()
+    report = build_docs(args.latex, args.out, args.manifest, args.jobs, args.force)
+    elapsed = time.perf_counter() - start
+    print(f"  converted {len(report['converted'])} (rewritten {len(report['written'])}), "
+          f"unchanged {len(report['unchanged'])}, removed {len(report['removed'])} "
+          f"in {elapsed*1000:.0f} ms")
+    for rel in report['skipped_manual']:
+        print(f"  kept hand-edited output for {rel} (use --force to regenerate)")
+    print()
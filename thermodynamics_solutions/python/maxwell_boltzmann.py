@@ -0,0 +1,221 @@
+"""
+Maxwell-Boltzmann Velocity Sampling and Kinetic-Theory Kernels
+Chunked samplers, characteristic speeds, effusion and collision rates - Python Computational Solutions
+"""
+
+import numpy as np
+from scipy.special import erf, erfc
+
+from chapter1_first_law import k_B
+from chapter3_functions import R
+
+# Physical Constants
+N_A = R / k_B      # 1/mol - Avogadro constant, consistent with R and k_B
+M_air = 0.029      # kg/mol - molar mass of air
+d_air = 3.7e-10    # m - effective molecular diameter of air (N2-like)
+
+#=============================================================================
+# Characteristic Speeds and Speed Distribution
+#=============================================================================
+def molecular_mass(M=M_air):
+    """Mass of one molecule (kg) from the molar mass M (kg/mol)."""
+    return M / N_A
+
+def characteristic_speeds(T, M=M_air):
+    """
+    Closed-form characteristic speeds of the Maxwell distribution.
+
+    Parameters:
+        T: temperature (K), array
+        M: molar mass (kg/mol), broadcastable with T
+
+    Returns:
+        dict with most probable v_p = √(2kT/m), mean √(8kT/πm) and
+        rms √(3kT/m) speeds (m/s)
+    """
+    kT_m = k_B * np.asarray(T, dtype=np.float64) / molecular_mass(M)
+    return {'v_p': np.sqrt(2 * kT_m), 'v_mean': np.sqrt(8 * kT_m / np.pi),
+            'v_rms': np.sqrt(3 * kT_m)}
+
+def speed_pdf(v, T, M=M_air):
+    """Maxwell speed density f(v) = 4π (m/2πkT)^{3/2} v² e^{-mv²/2kT} (s/m)."""
+    v_p = characteristic_speeds(T, M)['v_p']
+    x = np.asarray(v, dtype=np.float64) / v_p
+    return 4 / np.sqrt(np.pi) * x**2 * np.exp(-x**2) / v_p
+
+def fraction_faster(v0, T, M=M_air):
+    """
+    Fraction of molecules with speed above v0,
+    erfc(x) + (2x/√π) e^{-x²} with x = v0/v_p (accurate deep in the tail).
+    """
+    x = np.asarray(v0, dtype=np.float64) / characteristic_speeds(T, M)['v_p']
+    return erfc(x) + 2 * x / np.sqrt(np.pi) * np.exp(-x**2)
+
+def speed_cdf(v, T, M=M_air):
+    """Fraction of molecules with speed below v."""
+    x = np.asarray(v, dtype=np.float64) / characteristic_speeds(T, M)['v_p']
+    return erf(x) - 2 * x / np.sqrt(np.pi) * np.exp(-x**2)
+
+#=============================================================================
+# Chunked Velocity Samplers
+#=============================================================================
+def iter_velocities(n, T, M=M_air, chunk=10_000_000, drift=(0.0, 0.0, 0.0),
+                    rng=None, dtype=np.float32):
+    """
+    Generate n Maxwellian velocity vectors in chunks.
+
+    Each Cartesian component is normal with standard deviation √(kT/m);
+    chunks bound peak memory, so 10⁸ velocities never need to exist at
+    once unless the caller keeps them.
+
+    Parameters:
+        n: total number of velocities
+        T: temperature (K)
+        M: molar mass (kg/mol)
+        chunk: velocities per yielded block
+        drift: bulk velocity added to every sample (m/s)
+        rng: numpy Generator (default: fresh default_rng())
+        dtype: float32 or float64
+
+    Yields:
+        arrays of shape (k, 3), k ≤ chunk, in m/s
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    scale = np.sqrt(k_B * T / molecular_mass(M))
+    drift = np.asarray(drift, dtype=dtype)
+    for start in range(0, n, chunk):
+        block = rng.standard_normal((min(chunk, n - start), 3), dtype=dtype)
+        block *= scale
+        if drift.any():
+            block += drift
+        yield block
+
+def fill_velocities(out, T, M=M_air, chunk=10_000_000, drift=(0.0, 0.0, 0.0), rng=None):
+    """
+    Fill a preallocated (n, 3) array, e.g. an np.memmap particle store,
+    with Maxwellian velocities chunk by chunk.
+
+    Returns:
+        out
+    """
+    start = 0
+    for block in iter_velocities(out.shape[0], T, M, chunk, drift, rng, out.dtype.type):
+        out[start:start + block.shape[0]] = block
+        start += block.shape[0]
+    return out
+
+def iter_speeds(n, T, M=M_air, chunk=10_000_000, rng=None, dtype=np.float32):
+    """Generate n Maxwellian speeds |v| in chunks (m/s)."""
+    for block in iter_velocities(n, T, M, chunk, rng=rng, dtype=dtype):
+        yield np.sqrt(np.einsum('ij,ij->i', block, block))
+
+def speed_moments(n, T, M=M_air, chunk=10_000_000, rng=None):
+    """
+    Stream n sampled speeds and accumulate ⟨v⟩, ⟨v²⟩ and the largest speed
+    in float64, without storing the samples.
+
+    Returns:
+        dict with v_mean, v_rms and v_max (m/s)
+    """
+    total = total_sq = 0.0
+    v_max = 0.0
+    for v in iter_speeds(n, T, M, chunk, rng):
+        total += v.sum(dtype=np.float64)
+        total_sq += np.dot(v.astype(np.float64), v)
+        v_max = max(v_max, float(v.max()))
+    return {'v_mean': total / n, 'v_rms': np.sqrt(total_sq / n), 'v_max': v_max}
+
+#=============================================================================
+# Effusion and Collision Kernels
+#=============================================================================
+def number_density(p, T):
+    """Ideal-gas number density n = p/(kT) (1/m³)."""
+    return np.asarray(p, dtype=np.float64) / (k_B * np.asarray(T, dtype=np.float64))
+
+def kinetic_rates(T, n, d=d_air, M=M_air):
+    """
+    Hard-sphere kinetic-theory quantities, broadcast over (T, n, d).
+
+    Parameters:
+        T: temperature (K)
+        n: number density (1/m³)
+        d: molecular diameter (m)
+        M: molar mass (kg/mol)
+
+    Returns:
+        dict with cross_section σ = πd², mean_free_path 1/(√2 nσ),
+        collision_rate √2 nσ⟨v⟩ per molecule (1/s), collision_density
+        nZ/2 (collisions per m³ per s), effusion_flux n⟨v⟩/4 (1/(m²·s))
+        and v_mean (m/s)
+    """
+    T, n, d = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (T, n, d)))
+    v_mean = characteristic_speeds(T, M)['v_mean']
+    cross_section = np.pi * d**2
+    n_sigma = np.sqrt(2) * n * cross_section
+    with np.errstate(divide='ignore'):
+        mean_free_path = 1 / n_sigma
+    Z = n_sigma * v_mean
+    return {'cross_section': cross_section, 'mean_free_path': mean_free_path,
+            'collision_rate': Z, 'collision_density': 0.5 * n * Z,
+            'effusion_flux': 0.25 * n * v_mean, 'v_mean': v_mean}
+
+def kinetic_grid(T, n, d=d_air, M=M_air):
+    """kinetic_rates on the outer-product grid of 1-D T, n and d axes (shape (nT, nn, nd))."""
+    T = np.asarray(T, dtype=np.float64)[:, None, None]
+    n = np.asarray(n, dtype=np.float64)[None, :, None]
+    d = np.atleast_1d(np.asarray(d, dtype=np.float64))[None, None, :]
+    return kinetic_rates(T, n, d, M)
+
+def effusion_rate(p, T, area, M=M_air):
+    """
+    Molecules per second through a small hole, Φ A = p A/√(2π m kT).
+
+    Parameters:
+        p: pressure (Pa)
+        T: temperature (K)
+        area: hole area (m²)
+        M: molar mass (kg/mol)
+
+    Returns:
+        rate (1/s)
+    """
+    T = np.asarray(T, dtype=np.float64)
+    return np.asarray(p) * area / np.sqrt(2 * np.pi * molecular_mass(M) * k_B * T)
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    import time
+
+    print("=" * 60)
+    print("Maxwell-Boltzmann Distribution: Sampling and Kinetic Theory")
+    print("=" * 60)
+    for name, M in (('air', M_air), ('N2', 0.028)):
+        s = characteristic_speeds(300.0, M)
+        print(f"  {name} at 300 K: v_p = {s['v_p']:.0f}, ⟨v⟩ = {s['v_mean']:.0f}, "
+              f"v_rms = {s['v_rms']:.0f} m/s")
+    print(f"  Fraction of air molecules faster than 1500 m/s: "
+          f"{fraction_faster(1500.0, 300.0):.2e}")
+
+    N = 100_000_000
+    start = time.perf_counter()
+    moments = speed_moments(N, 300.0, rng=np.random.default_rng(0))
+    elapsed = time.perf_counter() - start
+    s = characteristic_speeds(300.0)
+    print(f"  Sampled {N:.0e} air velocities in {elapsed:.1f} s: "
+          f"⟨v⟩ = {moments['v_mean']:.2f} (exact {s['v_mean']:.2f}), "
+          f"v_rms = {moments['v_rms']:.2f} (exact {s['v_rms']:.2f})")
+
+    rates = kinetic_rates(300.0, number_density(101325, 300.0))
+    print(f"  Air at 1 atm, 300 K: λ = {rates['mean_free_path']*1e9:.1f} nm, "
+          f"Z = {rates['collision_rate']:.2e} /s, "
+          f"effusion flux = {rates['effusion_flux']:.2e} /(m²·s)")
+    grid = kinetic_grid(np.linspace(100, 1000, 200),
+                        number_density(np.geomspace(1e-6, 1e5, 500), 300.0),
+                        np.linspace(2.5e-10, 4.5e-10, 50))
+    print(f"  (T, n, d) grid {grid['mean_free_path'].shape}: λ spans "
+          f"{grid['mean_free_path'].min():.1e} to {grid['mean_free_path'].max():.1e} m")
+    print(f"  Effusion through a 1 μm² hole at 1 atm: "
+          f"{effusion_rate(101325, 300.0, 1e-12):.2e} molecules/s")
+    print()
@@ -0,0 +1,260 @@
+"""
+Temperature-Dependent Heat Capacities from NASA 7-Coefficient Polynomials
+Variable-gamma mode for Problems 1015, 1016, 1020 and adiabatic atmospheres - Python Computational Solutions
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+# Physical Constants
+R = 8.314          # J/(mol·K)
+g = 9.81           # m/s²
+
+#=============================================================================
+# Species Table
+#=============================================================================
+# NASA 7-coefficient form, per range:
+#   Cp/R  = a1 + a2 T + a3 T² + a4 T³ + a5 T⁴
+#   H/RT  = a1 + a2 T/2 + a3 T²/3 + a4 T³/4 + a5 T⁴/5 + a6/T
+#   S°/R  = a1 ln T + a2 T + a3 T²/2 + a4 T³/3 + a5 T⁴/4 + a7
+# Coefficients from the GRI-Mech 3.0 thermodynamic database.
+_species_dtype = np.dtype([('name', 'U8'), ('M', 'f8'),
+                           ('T_low', 'f8'), ('T_mid', 'f8'), ('T_high', 'f8'),
+                           ('low', 'f8', 7), ('high', 'f8', 7)])
+
+species_table = np.array([
+    ('N2', 0.0280134, 300.0, 1000.0, 5000.0,
+     [3.298677, 1.4082404e-03, -3.963222e-06, 5.641515e-09, -2.444854e-12,
+      -1020.8999, 3.950372],
+     [2.92664, 1.4879768e-03, -5.68476e-07, 1.0097038e-10, -6.753351e-15,
+      -922.7977, 5.980528]),
+    ('O2', 0.0319988, 200.0, 1000.0, 3500.0,
+     [3.78245636, -2.99673416e-03, 9.84730201e-06, -9.68129509e-09,
+      3.24372837e-12, -1063.94356, 3.65767573],
+     [3.28253784, 1.48308754e-03, -7.57966669e-07, 2.09470555e-10,
+      -2.16717794e-14, -1088.45772, 5.45323129]),
+    ('AR', 0.039948, 300.0, 1000.0, 5000.0,
+     [2.5, 0.0, 0.0, 0.0, 0.0, -745.375, 4.366],
+     [2.5, 0.0, 0.0, 0.0, 0.0, -745.375, 4.366]),
+    ('HE', 0.0040026, 200.0, 1000.0, 3500.0,
+     [2.5, 0.0, 0.0, 0.0, 0.0, -745.375, 0.928723974],
+     [2.5, 0.0, 0.0, 0.0, 0.0, -745.375, 0.928723974]),
+    ('CO2', 0.0440095, 200.0, 1000.0, 3500.0,
+     [2.35677352, 8.98459677e-03, -7.12356269e-06, 2.45919022e-09,
+      -1.43699548e-13, -48371.9697, 9.90105222],
+     [3.85746029, 4.41437026e-03, -2.21481404e-06, 5.23490188e-10,
+      -4.72084164e-14, -48759.166, 2.27163806]),
+    ('H2O', 0.01801528, 200.0, 1000.0, 3500.0,
+     [4.19864056, -2.0364341e-03, 6.52040211e-06, -5.48797062e-09,
+      1.77197817e-12, -30293.7267, -0.849032208],
+     [3.03399249, 2.17691804e-03, -1.64072518e-07, -9.7041987e-11,
+      1.68200992e-14, -30004.2971, 4.9667701]),
+], dtype=_species_dtype)
+
+def add_mixture(name, fractions):
+    """
+    Append a fixed-composition ideal-gas mixture to the species table.
+
+    NASA polynomials are linear in their coefficients, so the mixture is
+    itself a NASA species with mole-fraction-weighted coefficients.
+
+    Parameters:
+        name: mixture name
+        fractions: dict of species name -> mole fraction (normalized here)
+    """
+    global species_table
+    names = list(fractions)
+    x = np.array([fractions[n] for n in names], dtype=np.float64)
+    x /= x.sum()
+    rows = np.array([species(n) for n in names])
+    name = name.upper()
+    mix = np.array([(name, x @ rows['M'],
+                     rows['T_low'].max(), rows['T_mid'][0], rows['T_high'].min(),
+                     x @ rows['low'], x @ rows['high'])], dtype=_species_dtype)
+    species_table = np.concatenate([species_table[species_table['name'] != name], mix])
+    _entropy_table.cache_clear()
+
+def species(name):
+    """Look up one row of the species table by name (case-insensitive)."""
+    match = species_table[species_table['name'] == name.upper()]
+    if match.size == 0:
+        raise KeyError(f"unknown species '{name}'")
+    return match[0]
+
+#=============================================================================
+# Vectorized Cp(T), H(T), S°(T)
+#=============================================================================
+def _coefficients(T, name):
+    """Coefficient set for each temperature, shape T.shape + (7,)."""
+    row = species(name)
+    T = np.asarray(T, dtype=np.float64)
+    return np.where((T < row['T_mid'])[..., None], row['low'], row['high'])
+
+def nasa_cp(T, name):
+    """
+    Molar heat capacity at constant pressure.
+
+    Parameters:
+        T: temperature (K), scalar or array
+        name: species name in species_table
+
+    Returns:
+        Cp: J/(mol·K)
+    """
+    T = np.asarray(T, dtype=np.float64)
+    a = _coefficients(T, name)
+    return R * (a[..., 0] + T * (a[..., 1] + T * (a[..., 2]
+                + T * (a[..., 3] + T * a[..., 4]))))
+
+def nasa_enthalpy(T, name):
+    """Molar enthalpy H(T) in J/mol (formation enthalpy included)."""
+    T = np.asarray(T, dtype=np.float64)
+    a = _coefficients(T, name)
+    return R * (a[..., 5] + T * (a[..., 0] + T * (a[..., 1]/2 + T * (a[..., 2]/3
+                + T * (a[..., 3]/4 + T * a[..., 4]/5)))))
+
+def nasa_entropy(T, name):
+    """Standard molar entropy S°(T) at p0 in J/(mol·K)."""
+    T = np.asarray(T, dtype=np.float64)
+    a = _coefficients(T, name)
+    return R * (a[..., 0] * np.log(T) + a[..., 6] + T * (a[..., 1] + T * (a[..., 2]/2
+                + T * (a[..., 3]/3 + T * a[..., 4]/4))))
+
+def nasa_gamma(T, name):
+    """Ratio of specific heats γ(T) = Cp/(Cp - R) for an ideal gas."""
+    cp = nasa_cp(T, name)
+    return cp / (cp - R)
+
+#=============================================================================
+# Cached Entropy and Enthalpy Tables
+#=============================================================================
+@lru_cache(maxsize=32)
+def _entropy_table(name, T_min=20.0, dT=1.0):
+    """
+    Tabulate S°/R, (S° - R ln T)/R and H/R on a fine grid for inverse
+    lookups along isobaric-reference and isochoric-reference adiabats.
+
+    Below T_low the low-range polynomial is extrapolated, which is exact
+    for monatomic gases and adequate for diatomics down to ~50 K.
+    """
+    row = species(name)
+    T = np.arange(T_min, row['T_high'] + dT, dT)
+    s = nasa_entropy(T, name) / R
+    return {'T': T, 's': s, 's_v': s - np.log(T), 'h': nasa_enthalpy(T, name) / R}
+
+def _table_function(name, key, T):
+    """Exact value and T-derivative of a tabulated column."""
+    cp_R = nasa_cp(T, name) / R
+    if key == 's':
+        return nasa_entropy(T, name) / R, cp_R / T
+    if key == 's_v':
+        return nasa_entropy(T, name) / R - np.log(T), (cp_R - 1) / T
+    return nasa_enthalpy(T, name) / R, cp_R
+
+def _invert(name, key, target, polish=2):
+    """
+    Solve column(T) = target via the cached table, then polish with
+    Newton steps on the exact polynomial. Targets outside the table
+    raise ValueError naming the valid temperature range.
+    """
+    table = _entropy_table(name)
+    target = np.asarray(target, dtype=np.float64)
+    if np.any((target < table[key][0]) | (target > table[key][-1])):
+        raise ValueError(f"{name}: final temperature outside the valid range "
+                         f"[{table['T'][0]:g}, {table['T'][-1]:g}] K")
+    T = np.interp(target, table[key], table['T'])
+    for _ in range(polish):
+        f, df = _table_function(name, key, T)
+        T = T - (f - target) / df
+    return T
+
+#=============================================================================
+# Variable-Gamma Adiabatic Processes
+#=============================================================================
+def isentropic_temperature(T1, p_ratio, name):
+    """
+    Final temperature of a reversible adiabatic compression or expansion,
+    from S°(T2) = S°(T1) + R ln(p2/p1).
+
+    Parameters:
+        T1: initial temperature (K)
+        p_ratio: p_final/p_initial
+        name: species name
+
+    Returns:
+        T2: final temperature (K)
+    """
+    target = nasa_entropy(T1, name) / R + np.log(p_ratio)
+    return _invert(name, 's', target)
+
+def isentropic_temperature_volume(T1, V_ratio, name):
+    """
+    Final temperature of a reversible adiabatic process for a volume
+    ratio, from ∫Cv dT/T = -R ln(V2/V1).
+
+    Parameters:
+        T1: initial temperature (K)
+        V_ratio: V_final/V_initial
+        name: species name
+
+    Returns:
+        T2: final temperature (K)
+    """
+    T1 = np.asarray(T1, dtype=np.float64)
+    target = nasa_entropy(T1, name) / R - np.log(T1) - np.log(V_ratio)
+    return _invert(name, 's_v', target)
+
+def sound_speed(T, M, name):
+    """Adiabatic speed of sound c = √(γ(T) R T / M) (m/s)."""
+    return np.sqrt(nasa_gamma(T, name) * R * np.asarray(T, dtype=np.float64) / M)
+
+def adiabatic_profile(z, p0, T0, mu, name):
+    """
+    Adiabatic atmosphere with temperature-dependent Cp.
+
+    Hydrostatic balance with dH = V dp gives H(T) = H(T0) - μ g z, and
+    the isentrope gives p = p0 exp[(S°(T) - S°(T0))/R].
+
+    Parameters:
+        z: height (m)
+        p0, T0: sea-level pressure (Pa) and temperature (K)
+        mu: molecular weight (kg/mol)
+        name: species name
+
+    Returns:
+        p: pressure (Pa)
+        T: temperature (K)
+        dTdz: local lapse rate -μ g / Cp(T) (K/m)
+    """
+    z = np.asarray(z, dtype=np.float64)
+    T = _invert(name, 'h', nasa_enthalpy(T0, name) / R - mu * g * z / R)
+    p = p0 * np.exp((nasa_entropy(T, name) - nasa_entropy(T0, name)) / R)
+    dTdz = -mu * g / nasa_cp(T, name)
+    return p, T, dTdz
+
+# Dry air (mole fractions)
+add_mixture('AIR', {'N2': 0.7808, 'O2': 0.2095, 'AR': 0.0093, 'CO2': 0.0004})
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    print("=" * 60)
+    print("NASA Polynomials: Variable-Gamma Adiabatic Processes")
+    print("=" * 60)
+    for T in (300, 1000, 2000):
+        print(f"  Air at {T} K: Cp = {nasa_cp(T, 'air'):.2f} J/(mol·K), "
+              f"γ = {nasa_gamma(T, 'air'):.4f}")
+
+    T2_const = 300 * 30 ** (0.4 / 1.4)
+    T2_var = isentropic_temperature(300.0, 30.0, 'air')
+    print(f"  Compressor 300 K, p ratio 30: γ = 1.4 → {T2_const:.1f} K, "
+          f"γ(T) → {T2_var:.1f} K")
+    T2_var = isentropic_temperature(1800.0, 1/30, 'air')
+    print(f"  Turbine 1800 K, p ratio 1/30: γ = 1.4 → {1800 * 30**(-0.4/1.4):.1f} K, "
+          f"γ(T) → {T2_var:.1f} K")
+    print(f"  Sound speed in air at 1500 K: γ = 1.4 → "
+          f"{np.sqrt(1.4 * R * 1500 / 0.029):.0f} m/s, γ(T) → "
+          f"{sound_speed(1500.0, 0.029, 'air'):.0f} m/s")
+    print()
@@ -0,0 +1,276 @@
+"""
+Spin-J Paramagnet and Adiabatic Demagnetization (Problem 1095 extended)
+Brillouin-function magnetization, entropy and isentropes - Python Computational Solutions
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from chapter3_functions import R, k_B, adiabatic_demagnetization
+
+# Physical Constants
+mu_B = 9.274e-24   # J/T - Bohr magneton
+
+#=============================================================================
+# Brillouin Function and Spin Entropy
+#=============================================================================
+def _coth_csch2(u):
+    """coth(u) and csch²(u) for u > 0 without overflow or cancellation."""
+    e = np.exp(-2 * u)
+    d = -np.expm1(-2 * u)
+    return (1 + e) / d, 4 * e / d**2
+
+def brillouin(J, x):
+    """
+    Brillouin function B_J(x) and its derivative.
+
+    Parameters:
+        J: total angular momentum quantum number
+        x: g μ_B J B / (k T), x ≥ 0
+
+    Returns:
+        B: B_J(x)
+        dB: dB_J/dx
+    """
+    x = np.asarray(x, dtype=np.float64)
+    a = (2 * J + 1) / (2 * J)
+    c = 1 / (2 * J)
+    xs = np.maximum(x, 1e-300)
+    coth_a, csch2_a = _coth_csch2(a * xs)
+    coth_c, csch2_c = _coth_csch2(c * xs)
+    B = a * coth_a - c * coth_c
+    dB = -a**2 * csch2_a + c**2 * csch2_c
+    # Series near x = 0, where the two coth terms cancel
+    c1 = (a**2 - c**2) / 3
+    c3 = (a**4 - c**4) / 45
+    small = x < 1e-2
+    B = np.where(small, c1 * x - c3 * x**3, B)
+    dB = np.where(small, c1 - 3 * c3 * x**2, dB)
+    return B, dB
+
+def _log_sinh(u):
+    """ln sinh(u) for u > 0."""
+    return u + np.log(-np.expm1(-2 * u)) - np.log(2)
+
+def spin_entropy(J, x):
+    """
+    Entropy per ion of a spin-J paramagnet, S/k = ln Z - x B_J(x).
+
+    Parameters:
+        J: angular momentum quantum number
+        x: g μ_B J B / (k T)
+
+    Returns:
+        s: S/k per ion (ln(2J+1) at x = 0, → 0 as x → ∞)
+    """
+    x = np.maximum(np.asarray(x, dtype=np.float64), 1e-12)
+    a = (2 * J + 1) / (2 * J)
+    c = 1 / (2 * J)
+    B, _ = brillouin(J, x)
+    return _log_sinh(a * x) - _log_sinh(c * x) - x * B
+
+def _coupling(J, g):
+    """κ = g μ_B J / k_B in K/T, so that x = κ B_eff / T."""
+    return g * mu_B * J / k_B
+
+def _effective_field(B, b_int):
+    """Applied field combined in quadrature with the internal field."""
+    return np.sqrt(np.asarray(B, dtype=np.float64)**2 + b_int**2)
+
+#=============================================================================
+# Thermodynamic Functions S(B, T) and M(B, T)
+#=============================================================================
+def paramagnet_magnetization(B, T, J, g=2.0, b_int=0.0, n=1.0):
+    """
+    Magnetic moment of n moles of a spin-J paramagnet.
+
+    Parameters:
+        B: applied field (T)
+        T: temperature (K)
+        J: angular momentum quantum number
+        g: Landé g-factor
+        b_int: internal (interaction) field (T)
+        n: moles of magnetic ions
+
+    Returns:
+        M: magnetic moment (J/T)
+    """
+    B_eff = _effective_field(B, b_int)
+    x = _coupling(J, g) * B_eff / np.asarray(T, dtype=np.float64)
+    B_J, _ = brillouin(J, x)
+    # Only the component along the applied field is measured
+    along = np.divide(np.asarray(B, dtype=np.float64), B_eff,
+                      out=np.zeros_like(B_eff), where=B_eff > 0)
+    return n * (R / k_B) * g * mu_B * J * B_J * along
+
+def paramagnet_entropy(B, T, J, g=2.0, b_int=0.0, lattice=0.0, n=1.0):
+    """
+    Entropy S(B, T) of n moles of a spin-J paramagnet.
+
+    The internal field b_int adds in quadrature to the applied field, so
+    the spins stay partly ordered as B → 0; an optional lattice term with
+    heat capacity C = lattice·T³ per mole adds lattice·T³/3.
+
+    Parameters:
+        B: applied field (T)
+        T: temperature (K)
+        J, g, b_int, n: as in paramagnet_magnetization
+        lattice: Debye T³ coefficient (J/(mol·K⁴))
+
+    Returns:
+        S: entropy (J/K)
+    """
+    T = np.asarray(T, dtype=np.float64)
+    x = _coupling(J, g) * _effective_field(B, b_int) / T
+    return n * (R * spin_entropy(J, x) + lattice * T**3 / 3)
+
+#=============================================================================
+# Cached Entropy Table and Isentrope Solver
+#=============================================================================
+@lru_cache(maxsize=16)
+def entropy_table(J, n=4096, x_max=80.0):
+    """
+    Tabulate s(x) = S/(Nk) and keep it for inverse lookups x(s).
+
+    Nonuniform spacing in x (dense at small x) keeps linear inverse
+    interpolation accurate to ~1e-6 in x before Newton polishing.
+
+    Parameters:
+        J: angular momentum quantum number
+        n: number of table points
+        x_max: largest tabulated x
+
+    Returns:
+        dict with increasing arrays x and decreasing s (read-only)
+    """
+    x = x_max * np.linspace(0.0, 1.0, n)**2
+    s = spin_entropy(J, x)
+    x.setflags(write=False)
+    s.setflags(write=False)
+    return {'x': x, 's': s, 's_max': float(np.log(2 * J + 1))}
+
+def _invert_spin_entropy(J, s_target):
+    """x such that spin_entropy(J, x) = s_target, from the cached table."""
+    table = entropy_table(J)
+    s = np.clip(s_target, table['s'][-1], table['s_max'])
+    return np.interp(-s, -table['s'], table['x'])
+
+def isentrope_temperature(S_target, B, J, g=2.0, b_int=0.0, lattice=0.0,
+                          n=1.0, T_guess=None, tol=1e-12, max_iter=50):
+    """
+    Temperature at field B on the isentrope S(B, T) = S_target.
+
+    Without a lattice term the entropy depends on B_eff/T only, so the
+    cached table gives T directly and Newton merely polishes it. With
+    one, Newton's method on T runs in lockstep for the batch; S increases
+    monotonically with T, so the safeguarded iteration converges.
+
+    Parameters:
+        S_target: entropy (J/K), array
+        B: applied field (T), broadcastable with S_target
+        J, g, b_int, lattice, n: as in paramagnet_entropy
+        T_guess: optional starting temperatures (K)
+        tol: relative tolerance on T
+        max_iter: Newton iteration cap
+
+    Returns:
+        T: temperature (K)
+    """
+    S_target, B = np.broadcast_arrays(np.asarray(S_target, dtype=np.float64),
+                                      np.asarray(B, dtype=np.float64))
+    kappa_B = _coupling(J, g) * _effective_field(B, b_int)
+    s_target = S_target / (n * R)
+
+    if lattice and T_guess is not None:
+        T = np.broadcast_to(np.asarray(T_guess, dtype=np.float64), B.shape).copy()
+    else:
+        # Exact up to table interpolation when there is no lattice term
+        T = kappa_B / np.maximum(_invert_spin_entropy(J, s_target), 1e-300)
+
+    for _ in range(max_iter):
+        x = kappa_B / T
+        _, dB = brillouin(J, x)
+        F = spin_entropy(J, x) + lattice * T**3 / (3 * R) - s_target
+        dF = x**2 * dB / T + lattice * T**2 / R
+        T_new = np.clip(T - F / dF, 0.25 * T, 4.0 * T)
+        done = np.abs(T_new - T) <= tol * T
+        T = T_new
+        if done.all():
+            break
+    return T
+
+def demagnetization_final_temperature(Ti, Bi, Bf, J, g=2.0, b_int=0.0,
+                                      lattice=0.0, n=1.0):
+    """
+    Final temperature after adiabatic demagnetization from (Ti, Bi) to Bf.
+
+    Reduces to adiabatic_demagnetization (Tf = Ti Bf/Bi) when b_int and
+    the lattice term vanish; the internal field makes cooling saturate
+    at Tf ≈ Ti b_int / √(Bi² + b_int²) as Bf → 0.
+
+    Parameters:
+        Ti: initial temperature (K), array
+        Bi, Bf: initial and final applied fields (T)
+        J, g, b_int, lattice, n: as in paramagnet_entropy
+
+    Returns:
+        Tf: final temperature (K)
+    """
+    Ti, Bi, Bf = np.broadcast_arrays(np.asarray(Ti, dtype=np.float64),
+                                     np.asarray(Bi, dtype=np.float64),
+                                     np.asarray(Bf, dtype=np.float64))
+    S_i = paramagnet_entropy(Bi, Ti, J, g, b_int, lattice, n)
+    return isentrope_temperature(S_i, Bf, J, g, b_int, lattice, n)
+
+def demagnetization_ramp(Ti, Bi, B_path, J, g=2.0, b_int=0.0, lattice=0.0, n=1.0):
+    """
+    Temperature along a quasi-static demagnetization ramp.
+
+    Parameters:
+        Ti: initial temperatures (K), shape (batch,) or scalar
+        Bi: initial fields (T), broadcastable with Ti
+        B_path: applied field at each ramp step (T), shape (steps,)
+        J, g, b_int, lattice, n: as in paramagnet_entropy
+
+    Returns:
+        T: temperatures (K), shape (steps,) + batch shape
+    """
+    Ti, Bi = np.broadcast_arrays(np.asarray(Ti, dtype=np.float64),
+                                 np.asarray(Bi, dtype=np.float64))
+    S_i = paramagnet_entropy(Bi, Ti, J, g, b_int, lattice, n)
+    B_path = np.asarray(B_path, dtype=np.float64)
+    T = np.empty(B_path.shape + Ti.shape)
+    T_prev = Ti
+    for k, B_k in enumerate(B_path):
+        T[k] = isentrope_temperature(S_i, B_k, J, g, b_int, lattice, n,
+                                     T_guess=T_prev)
+        T_prev = T[k]
+    return T
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Problem 1095 (extended): Brillouin Paramagnet Demagnetization")
+    print("=" * 60)
+    Ti, Hi, Hf = 1.0, 5.0, 0.01
+    J_salt, b_salt = 2.5, 0.05  # e.g. an iron-alum-like salt
+    Tf_curie = adiabatic_demagnetization(Ti, Hi, Hf)
+    Tf = demagnetization_final_temperature(Ti, Hi, Hf, J_salt, b_int=b_salt)
+    print(f"Ti = {Ti} K, Hi = {Hi} T → Hf = {Hf} T")
+    print(f"  Curie-law limit: Tf = {Tf_curie*1000:.1f} mK")
+    print(f"  Spin-{J_salt}, internal field {b_salt} T: Tf = {Tf*1000:.1f} mK")
+
+    Tf_lat = demagnetization_final_temperature(Ti, Hi, Hf, J_salt, b_int=b_salt,
+                                               lattice=1e-3)
+    print(f"  With lattice entropy (C = 1e-3 T³ J/mol·K): Tf = {Tf_lat*1000:.1f} mK")
+
+    ramp = np.linspace(Hi, 0.0, 11)
+    T_ramp = demagnetization_ramp(np.array([0.5, 1.0, 1.5]), Hi, ramp, J_salt,
+                                  b_int=b_salt)
+    print("  Ramp (B in T → T in mK for Ti = 0.5, 1.0, 1.5 K):")
+    for B_k, T_k in zip(ramp[::2], T_ramp[::2]):
+        print(f"    B = {B_k:4.1f}: " + ", ".join(f"{t*1000:7.2f}" for t in T_k))
+    print()
@@ -0,0 +1,227 @@
+"""
+Partition-Function Engine for Discrete Energy Levels
+Blocked log-sum-exp ln Z, U, Cv, S, F over large level sets - Python Computational Solutions
+"""
+
+import hashlib
+from functools import lru_cache
+
+import numpy as np
+
+from chapter1_first_law import k_B
+from chapter2_entropy import R, problem_1044
+from planck import c2
+
+# Levels are stored as θ = E/k in kelvin; line lists in cm⁻¹ convert with
+# θ = c2·ν̃, c2 = hc/k (m·K).
+_BLOCK_LEVELS = 4096   # levels per reduction block
+_BLOCK_TEMPS = 256     # temperatures per reduction block
+_CUTOFF = 40.0         # drop terms below e^{-40-ln N} of the ground term
+_LEVEL_CACHE_SIZE = 8
+
+#=============================================================================
+# Level Sets
+#=============================================================================
+_level_cache = {}
+
+def level_set(energies, degeneracies=None, units='K'):
+    """
+    Sorted, ground-shifted level structure used by partition_function.
+
+    Structures are cached by the content of the inputs, so handing the
+    same line list to several calls sorts it only once.
+
+    Parameters:
+        energies: level energies, array
+        degeneracies: g_i (default 1), array broadcastable with energies
+        units: 'K' (E/k), 'J', or 'cm-1' (wavenumber)
+
+    Returns:
+        dict with theta (E - E_0)/k sorted ascending (K), ln_g,
+        theta_0 = E_0/k (K), tail_ln_g (suffix maximum of ln g, used
+        for truncation) and n_levels
+    """
+    energies = np.ascontiguousarray(energies, dtype=np.float64).ravel()
+    g = np.ones_like(energies) if degeneracies is None else \
+        np.ascontiguousarray(np.broadcast_to(degeneracies, energies.shape), dtype=np.float64)
+    key = hashlib.blake2b(energies.tobytes() + g.tobytes() + units.encode(),
+                          digest_size=16).hexdigest()
+    if key in _level_cache:
+        return _level_cache[key]
+
+    scale = {'K': 1.0, 'J': 1 / k_B, 'cm-1': 100 * c2}[units]
+    order = np.argsort(energies, kind='stable')
+    theta = energies[order] * scale
+    ln_g = np.log(g[order])
+    theta_0 = theta[0]
+    theta = theta - theta_0
+    tail_ln_g = np.maximum.accumulate(ln_g[::-1])[::-1]
+    for arr in (theta, ln_g, tail_ln_g):
+        arr.setflags(write=False)
+    levels = {'theta': theta, 'ln_g': ln_g, 'theta_0': theta_0,
+              'tail_ln_g': tail_ln_g, 'n_levels': theta.size}
+    if len(_level_cache) >= _LEVEL_CACHE_SIZE:
+        _level_cache.pop(next(iter(_level_cache)))
+    _level_cache[key] = levels
+    return levels
+
+@lru_cache(maxsize=16)
+def harmonic_levels(theta_v, n_levels=10_000):
+    """Harmonic oscillator ladder θ_n = nΘ_v (zero-point excluded)."""
+    return level_set(theta_v * np.arange(n_levels))
+
+@lru_cache(maxsize=16)
+def rotor_levels(theta_r, J_max=1000):
+    """Rigid rotor θ_J = J(J+1)Θ_r with degeneracy 2J + 1."""
+    J = np.arange(J_max + 1, dtype=np.float64)
+    return level_set(theta_r * J * (J + 1), 2 * J + 1)
+
+@lru_cache(maxsize=16)
+def two_level(theta, g0=1, g1=1):
+    """Two-level system with gap θ = Δ/k (Schottky anomaly)."""
+    return level_set(np.array([0.0, theta]), np.array([g0, g1], dtype=np.float64))
+
+#=============================================================================
+# Blocked Log-Sum-Exp Reduction
+#=============================================================================
+def _truncation(levels, T):
+    """Number of levels needed at temperature T (all lower T need fewer)."""
+    cut = _CUTOFF + np.log(levels['n_levels'])
+    # ln g_i - θ_i/T ≤ tail_ln_g_i - θ_i/T, nonincreasing in i
+    key = levels['theta'] - T * levels['tail_ln_g']
+    return int(np.searchsorted(key, T * (cut - levels['ln_g'][0]), side='right'))
+
+def _reduce(levels, beta, n_keep):
+    """
+    Shifted sums over levels for one block of inverse temperatures:
+    m = max_i(ln g_i - β θ_i) and s_k = Σ θ^k e^{ln g - βθ - m}, k = 0, 1, 2.
+    """
+    theta, ln_g = levels['theta'], levels['ln_g']
+    m = np.full(beta.shape, -np.inf)
+    s0 = np.zeros(beta.shape)
+    s1 = np.zeros(beta.shape)
+    s2 = np.zeros(beta.shape)
+    for start in range(0, n_keep, _BLOCK_LEVELS):
+        th = theta[start:min(start + _BLOCK_LEVELS, n_keep)]
+        a = ln_g[start:start + th.size] - beta[:, None] * th
+        m_new = np.maximum(m, a.max(axis=1))
+        rescale = np.exp(m - m_new)
+        np.subtract(a, m_new[:, None], out=a)
+        np.exp(a, out=a)
+        s0 = s0 * rescale + a.sum(axis=1)
+        a *= th
+        s1 = s1 * rescale + a.sum(axis=1)
+        a *= th
+        s2 = s2 * rescale + a.sum(axis=1)
+        m = m_new
+    return m, s0, s1, s2
+
+def partition_function(levels, T):
+    """
+    Canonical thermodynamics of a discrete level set over a temperature array.
+
+    Temperatures are processed in ascending blocks; each block sums only
+    the levels whose Boltzmann weight can matter at its highest
+    temperature, so low-T blocks touch a small prefix of the sorted list.
+
+    Parameters:
+        levels: dict from level_set (or one of the builders)
+        T: temperatures (K), array
+
+    Returns:
+        dict of molar quantities:
+            ln_Z: ln Z per particle (energy zero at E = 0)
+            U: internal energy (J/mol)
+            Cv: heat capacity (J/(mol·K))
+            S: entropy (J/(mol·K))
+            F: Helmholtz free energy (J/mol)
+            n_levels_used: levels summed for each T
+    """
+    T = np.asarray(T, dtype=np.float64)
+    flat = T.ravel()
+    order = np.argsort(flat)
+    ln_Z = np.empty(flat.shape)
+    mean = np.empty(flat.shape)
+    var = np.empty(flat.shape)
+    used = np.empty(flat.shape, dtype=np.intp)
+    for start in range(0, flat.size, _BLOCK_TEMPS):
+        idx = order[start:start + _BLOCK_TEMPS]
+        T_block = flat[idx]
+        n_keep = max(_truncation(levels, T_block[-1]), 1)
+        m, s0, s1, s2 = _reduce(levels, 1 / T_block, n_keep)
+        ln_Z[idx] = m + np.log(s0)
+        mean[idx] = s1 / s0
+        var[idx] = np.maximum(s2 / s0 - (s1 / s0)**2, 0.0)
+        used[idx] = n_keep
+    shape = T.shape
+    theta_0 = levels['theta_0']
+    ln_Z = ln_Z.reshape(shape) - theta_0 / T
+    U = R * (mean.reshape(shape) + theta_0)
+    Cv = R * var.reshape(shape) / T**2
+    S = R * ln_Z + U / T
+    return {'ln_Z': ln_Z, 'U': U, 'Cv': Cv, 'S': S, 'F': -R * T * ln_Z,
+            'n_levels_used': used.reshape(shape)}
+
+def level_model(*parts):
+    """
+    Heat-capacity model (dict of Cv, U, S callables, as in
+    solid_heat_capacity) from independent level sets.
+
+    Parameters:
+        parts: level sets, or (levels, multiplicity) pairs, e.g.
+               (harmonic_levels(Θ_E), 3) for an Einstein solid
+
+    Returns:
+        dict with functions Cv, U, S of T, usable by entropy_change,
+        heat_absorbed and entropy_ledger bodies
+    """
+    parts = [p if isinstance(p, tuple) else (p, 1) for p in parts]
+
+    def total(key):
+        return lambda T: sum(k * partition_function(lv, T)[key] for lv, k in parts)
+    return {key: total(key) for key in ('Cv', 'U', 'S')}
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    import time
+
+    print("=" * 60)
+    print("Partition-Function Engine: ln Z, U, Cv, S, F from Level Sets")
+    print("=" * 60)
+    T = np.array([10.0, 100.0, 1000.0])
+    osc = partition_function(harmonic_levels(500.0), T)
+    exact = -np.log(-np.expm1(-500.0 / T))
+    print(f"  Oscillator Θ = 500 K: ln Z = {osc['ln_Z']} (exact {exact})")
+    rot = partition_function(rotor_levels(2.88), T)
+    print(f"  Rotor Θ_r = 2.88 K (CO): Cv/R = {rot['Cv']/R} (classical → 1)")
+    sch = partition_function(two_level(50.0, 1, 3), np.array([10.0, 20.0, 50.0]))
+    print(f"  Schottky Δ = 50 K, g = 1:3: Cv/R = {sch['Cv']/R}")
+
+    # Silver as an Einstein solid: Cv for Problem 1044 from the level sums
+    Ag = level_model((harmonic_levels(np.sqrt(0.6) * 225.0), 3))
+    Cv_mid = Ag['Cv'](288.15) / 4.184
+    dS_levels = (Ag['S'](303.15) - Ag['S'](273.15)) / 4.184
+    print(f"  Silver (Problem 1044): Einstein Cv(15°C) = {Cv_mid:.3f} cal/(mol·K) "
+          f"→ ΔS = {problem_1044(0, 30, Cv_mid):.4f} cal/K; "
+          f"S(T2) - S(T1) = {dS_levels:.4f} cal/K")
+
+    # A million-line list: rotor levels with vibrational structure in cm⁻¹
+    J = np.arange(1000, dtype=np.float64)
+    v = np.arange(1000, dtype=np.float64)
+    wavenumber = (2169.8 * v[:, None] + 1.93 * J * (J + 1)).ravel()
+    g = np.broadcast_to(2 * J + 1, (1000, 1000)).ravel()
+    start = time.perf_counter()
+    lines = level_set(wavenumber, g, units='cm-1')
+    t_sort = time.perf_counter() - start
+    T_grid = np.geomspace(5.0, 5000.0, 2000)
+    start = time.perf_counter()
+    r = partition_function(lines, T_grid)
+    elapsed = time.perf_counter() - start
+    print(f"  10⁶-level line list sorted in {t_sort*1000:.0f} ms; 2000 temperatures in "
+          f"{elapsed:.2f} s (levels summed: {r['n_levels_used'].min()} at 5 K, "
+          f"{r['n_levels_used'].max()} at 5000 K)")
+    print(f"  CO at 300 K: Cv/R = {np.interp(300, T_grid, r['Cv'])/R:.4f}, "
+          f"S = {np.interp(300, T_grid, r['S']):.2f} J/(mol·K) (internal)")
+    print()
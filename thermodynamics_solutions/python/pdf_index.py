@@ -0,0 +1,537 @@
+"""
+Full-Text Index of the Split Source PDFs
+Offline text extraction, memory-mapped inverted index, problem → split/page lookup - Python Computational Solutions
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+_HERE = Path(__file__).resolve().parent
+PDF_DIR = _HERE.parents[1]
+INDEX_DIR = _HERE.parents[1] / '.pdf_index'
+PDF_GLOB = '*split_*.pdf'
+
+# Any change to this file invalidates the extracted-text cache
+INDEXER_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+_TERM_WIDTH = 32    # bytes per vocabulary entry (longer terms are truncated)
+
+#=============================================================================
+# Minimal PDF Reader (classic xref tables, Flate streams, WinAnsi text)
+#=============================================================================
+# The split PDFs are scans with an invisible OCR text layer drawn in
+# WinAnsi-encoded TrueType fonts, so page text is the sequence of Tj/TJ
+# strings in each page's content stream.
+_OBJ_HEADER = re.compile(rb'(\d+)\s+(\d+)\s+obj\b')
+_REF = re.compile(rb'(\d+)\s+\d+\s+R')
+_XREF_SECTION = re.compile(rb'\s*(\d+)\s+(\d+)\s*?[\r\n]+')
+
+def _xref_offsets(data):
+    """Object number → byte offset from the xref table(s), following /Prev."""
+    offsets = {}
+    start = int(re.findall(rb'startxref\s+(\d+)', data)[-1])
+    seen = set()
+    while start not in seen:
+        seen.add(start)
+        if not data.startswith(b'xref', start):
+            raise ValueError('cross-reference streams are not supported')
+        pos = start + 4
+        while True:
+            header = _XREF_SECTION.match(data, pos)
+            if header is None:
+                break
+            first, count = int(header.group(1)), int(header.group(2))
+            pos = header.end()
+            for k in range(count):
+                entry = data[pos:pos + 20]
+                if entry[17:18] == b'n':
+                    offsets.setdefault(first + k, int(entry[:10]))
+                pos += 20
+        trailer = data[pos:data.find(b'>>', data.find(b'trailer', pos)) + 2]
+        prev = re.search(rb'/Prev\s+(\d+)', trailer)
+        if prev is None:
+            break
+        start = int(prev.group(1))
+    return offsets
+
+def _read_objects(data):
+    """Object number → (dictionary bytes, raw stream bytes or None)."""
+    try:
+        offsets = _xref_offsets(data)
+    except (ValueError, IndexError):
+        offsets = {int(m.group(1)): m.start() for m in _OBJ_HEADER.finditer(data)}
+    objects = {}
+    for number, offset in offsets.items():
+        header = _OBJ_HEADER.match(data, offset)
+        if header is None:
+            continue
+        body_start = header.end()
+        end = data.find(b'endobj', body_start)
+        stream = data.find(b'stream', body_start, end)
+        if stream == -1:
+            objects[number] = (data[body_start:end], None)
+            continue
+        head = data[body_start:stream]
+        begin = stream + 6
+        begin += 2 if data[begin:begin + 2] == b'\r\n' else 1
+        length = re.search(rb'/Length\s+(\d+)(\s+\d+\s+R)?', head)
+        if length and not length.group(2):
+            raw = data[begin:begin + int(length.group(1))]
+        else:
+            raw = data[begin:data.rfind(b'endstream', begin, end)].rstrip(b'\r\n')
+        objects[number] = (head, raw)
+    return objects
+
+def _stream(obj):
+    head, raw = obj
+    if raw is None:
+        return b''
+    if b'/FlateDecode' in head:
+        return zlib.decompressobj().decompress(raw)
+    return raw
+
+def _page_contents(objects):
+    """Content-stream bytes of every page, in document order."""
+    catalog = next(h for h, _ in objects.values() if re.search(rb'/Type\s*/Catalog', h))
+    pages = []
+
+    def walk(number):
+        head = objects[number][0]
+        if re.search(rb'/Type\s*/Pages', head):
+            kids = re.search(rb'/Kids\s*\[(.*?)\]', head, re.S).group(1)
+            for kid in _REF.findall(kids):
+                walk(int(kid))
+            return
+        contents = re.search(rb'/Contents\s*(\[.*?\]|\d+\s+\d+\s+R)', head, re.S)
+        refs = _REF.findall(contents.group(1)) if contents else []
+        pages.append(b'\n'.join(_stream(objects[int(r)]) for r in refs if int(r) in objects))
+
+    walk(int(re.search(rb'/Pages\s+(\d+)\s+\d+\s+R', catalog).group(1)))
+    return pages
+
+_ESCAPES = {ord('n'): b'\n', ord('r'): b'\r', ord('t'): b'\t', ord('b'): b'\b',
+            ord('f'): b'\f', ord('('): b'(', ord(')'): b')', ord('\\'): b'\\'}
+_CONTENT_TOKEN = re.compile(rb'\s*(?:(\()|<([0-9A-Fa-f\s]*)>|(\[)|(\])|(/[^\s/\[\]()<>]+)'
+                            rb'|([-+]?(?:\d+\.?\d*|\.\d+))|([A-Za-z\'"*]+)|(<<|>>|\{|\}))')
+
+def _literal_string(data, i):
+    """Parse a (...) string starting after the '('; return (bytes, next index)."""
+    out, depth = bytearray(), 1
+    while i < len(data):
+        c = data[i]
+        if c == 0x5C:   # backslash
+            nxt = data[i + 1]
+            if nxt in _ESCAPES:
+                out += _ESCAPES[nxt]
+                i += 2
+            elif 0x30 <= nxt <= 0x37:
+                octal = re.match(rb'[0-7]{1,3}', data[i + 1:i + 4]).group(0)
+                out.append(int(octal, 8) & 0xFF)
+                i += 1 + len(octal)
+            else:
+                i += 2 if nxt in b'\r\n' else 1
+            continue
+        if c == 0x28:
+            depth += 1
+        elif c == 0x29:
+            depth -= 1
+            if depth == 0:
+                return bytes(out), i + 1
+        out.append(c)
+        i += 1
+    return bytes(out), i
+
+def page_lines(content):
+    """
+    Text lines of one content stream: strings from Tj, TJ, ' and ",
+    split into lines whenever the text matrix moves vertically.
+    """
+    lines, current, operands = [], [], []
+    y = None
+    i = 0
+    while i < len(content):
+        match = _CONTENT_TOKEN.match(content, i)
+        if match is None:
+            i += 1
+            continue
+        i = match.end()
+        if match.group(1):
+            text, i = _literal_string(content, i)
+            operands.append(text)
+        elif match.group(2) is not None:
+            hex_digits = re.sub(rb'\s', b'', match.group(2))
+            operands.append(bytes.fromhex((hex_digits + b'0' * (len(hex_digits) % 2)).decode()))
+        elif match.group(3):
+            operands.append('[')
+        elif match.group(4):
+            array = []
+            while operands and operands[-1] != '[':
+                array.append(operands.pop())
+            if operands:
+                operands.pop()
+            operands.append(array[::-1])
+        elif match.group(6):
+            operands.append(float(match.group(6)))
+        elif match.group(7):
+            op = match.group(7)
+            if op in (b'Tm',) and len(operands) >= 6:
+                new_y = operands[-1]
+                if y is not None and abs(new_y - y) > 1.0 and current:
+                    lines.append(''.join(current))
+                    current = []
+                y = new_y
+            elif op in (b'Td', b'TD') and len(operands) >= 2:
+                if operands[-1] != 0 and current:
+                    lines.append(''.join(current))
+                    current = []
+                if y is not None:
+                    y += operands[-1]
+            elif op in (b'T*', b"'", b'"') and current:
+                lines.append(''.join(current))
+                current = []
+            if op in (b'Tj', b"'", b'"') and operands and isinstance(operands[-1], bytes):
+                current.append(operands[-1].decode('cp1252', errors='replace'))
+            elif op == b'TJ' and operands and isinstance(operands[-1], list):
+                current.append(''.join(s.decode('cp1252', errors='replace')
+                                       for s in operands[-1] if isinstance(s, bytes)))
+            elif op == b'BI':
+                end = content.find(b'EI', i)
+                i = len(content) if end == -1 else end + 2
+            operands = []
+    if current:
+        lines.append(''.join(current))
+    return [' '.join(line.split()) for line in lines if line.strip()]
+
+def extract_pdf_text(path):
+    """
+    Text of every page of one PDF.
+
+    Returns:
+        list (one entry per page) of lists of text lines
+    """
+    objects = _read_objects(Path(path).read_bytes())
+    return [page_lines(content) for content in _page_contents(objects)]
+
+#=============================================================================
+# Tokenizing and Problem Headers
+#=============================================================================
+_WORD = re.compile(r'[a-z]+|\d+(?:\.\d+)?')
+_PROBLEM_HEADER = re.compile(r'^([12]\d{3})$')
+_PROBLEM_RANGE = (1001, 2999)
+
+_HYPHENATED = re.compile(r'([a-z])-\n([a-z])')
+
+def _stem(word):
+    """Fold plurals so 'joules' finds 'joule' ('gas', 'process' are kept)."""
+    if len(word) > 3 and word.endswith('ies'):
+        return word[:-3] + 'y'
+    if len(word) > 3 and word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        return word[:-1]
+    return word
+
+def tokenize(text):
+    """
+    Lower-case word and number tokens ('Joule-Thomson' → joule, thomson),
+    with plurals folded and 'op-\nerating' line-end hyphenation rejoined.
+    """
+    text = _HYPHENATED.sub(r'\1\2', text.lower())
+    return [_stem(t) for t in _WORD.findall(text)]
+
+def problem_headers(lines):
+    """Problem numbers that stand alone on a line (how the book sets them)."""
+    found = []
+    for line in lines:
+        match = _PROBLEM_HEADER.match(line.strip())
+        if match and _PROBLEM_RANGE[0] <= int(match.group(1)) <= _PROBLEM_RANGE[1]:
+            found.append(int(match.group(1)))
+    return found
+
+def _split_number(path):
+    match = re.search(r'split_(\d+)', Path(path).name)
+    return int(match.group(1)) if match else 0
+
+def _extract_job(path):
+    """Worker: per-page lines, term counts and problem headers of one PDF."""
+    pages = extract_pdf_text(path)
+    out = []
+    for lines in pages:
+        counts = {}
+        for term in tokenize('\n'.join(lines)):
+            counts[term] = counts.get(term, 0) + 1
+        out.append({'lines': lines, 'terms': counts, 'problems': problem_headers(lines)})
+    return out
+
+#=============================================================================
+# Building the On-Disk Index
+#=============================================================================
+def _sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def build_index(pdf_dir=PDF_DIR, index_dir=INDEX_DIR, jobs=None, force=False):
+    """
+    (Re)build the inverted index for every split PDF, incrementally.
+
+    Text is extracted once per PDF content hash and cached under
+    index_dir/text/<sha256>.json; a manifest of (size, mtime, sha256)
+    avoids rehashing untouched files. The merged index is rewritten only
+    when the set of PDF hashes changes. It consists of
+
+        terms.npy     sorted vocabulary, fixed-width bytes (searchsorted)
+        offsets.npy   postings range of each term
+        postings.npy  page ids (uint32), grouped by term
+        counts.npy    term frequency per posting (uint16)
+        problems.npy  (problem, page id) of every problem header
+        text.npy      page text as UTF-8 bytes, with text_offsets.npy
+        pages.json    page id → (split, page, file)
+
+    all loadable with np.load(mmap_mode='r').
+
+    Parameters:
+        pdf_dir: directory holding the *split_N.pdf files
+        index_dir: output directory
+        jobs: worker processes for text extraction
+        force: ignore caches and re-extract everything
+
+    Returns:
+        dict with extracted (files whose text was extracted), reused,
+        rebuilt (whether the merged index was rewritten), n_pages, n_terms
+    """
+    pdf_dir, index_dir = Path(pdf_dir), Path(index_dir)
+    text_dir = index_dir / 'text'
+    text_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = index_dir / 'manifest.json'
+    manifest = {}
+    if manifest_path.exists() and not force:
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        if manifest.get('version') != INDEXER_VERSION:
+            manifest = {}
+    old_files = manifest.get('files', {})
+
+    files, todo = {}, []
+    for path in sorted(pdf_dir.glob(PDF_GLOB), key=_split_number):
+        stat = path.stat()
+        prior = old_files.get(path.name)
+        if prior and prior['size'] == stat.st_size and prior['mtime_ns'] == stat.st_mtime_ns:
+            sha = prior['sha256']
+        else:
+            sha = _sha256_file(path)
+        files[path.name] = {'sha256': sha, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                            'split': _split_number(path)}
+        if force or not (text_dir / f'{sha}.json').exists() or not old_files:
+            todo.append(path)
+
+    if todo:
+        workers = min(jobs or os.cpu_count() or 1, len(todo))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                extracted = list(pool.map(_extract_job, todo))
+        else:
+            extracted = [_extract_job(p) for p in todo]
+        for path, pages in zip(todo, extracted):
+            (text_dir / f"{files[path.name]['sha256']}.json").write_text(
+                json.dumps(pages), encoding='utf-8')
+
+    fingerprint = hashlib.sha256(json.dumps(
+        [(name, f['sha256']) for name, f in files.items()]).encode()).hexdigest()
+    rebuilt = force or manifest.get('fingerprint') != fingerprint or \
+        not (index_dir / 'postings.npy').exists()
+    if rebuilt:
+        _write_index(files, text_dir, index_dir)
+    # drop cached text of PDFs that are gone or changed
+    live = {f['sha256'] for f in files.values()}
+    for cached in text_dir.glob('*.json'):
+        if cached.stem not in live:
+            cached.unlink()
+    new_manifest = {'version': INDEXER_VERSION, 'fingerprint': fingerprint, 'files': files}
+    if new_manifest != manifest:
+        manifest_path.write_text(json.dumps(new_manifest, indent=1) + '\n', encoding='utf-8')
+    pages_meta = json.loads((index_dir / 'pages.json').read_text(encoding='utf-8'))
+    return {'extracted': [p.name for p in todo], 'reused': len(files) - len(todo),
+            'rebuilt': rebuilt, 'n_pages': len(pages_meta),
+            'n_terms': int(np.load(index_dir / 'terms.npy', mmap_mode='r').shape[0])}
+
+def _write_index(files, text_dir, index_dir):
+    """Merge the per-PDF caches into the memory-mappable arrays."""
+    pages_meta, postings, problems, texts = [], {}, [], []
+    for name, info in files.items():
+        pages = json.loads((text_dir / f"{info['sha256']}.json").read_text(encoding='utf-8'))
+        for page_number, page in enumerate(pages, start=1):
+            page_id = len(pages_meta)
+            pages_meta.append([info['split'], page_number, name])
+            for term, count in page['terms'].items():
+                postings.setdefault(term[:_TERM_WIDTH], []).append((page_id, count))
+            problems += [(p, page_id) for p in page['problems']]
+            texts.append('\n'.join(page['lines']).encode('utf-8'))
+
+    terms = sorted(postings)
+    offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(postings[t]) for t in terms])
+    flat = [entry for t in terms for entry in postings[t]]
+    page_ids = np.array([p for p, _ in flat], dtype=np.uint32)
+    counts = np.minimum(np.array([c for _, c in flat], dtype=np.int64), 65535).astype(np.uint16)
+    text_offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+    text_offsets[1:] = np.cumsum([len(t) for t in texts])
+    problem_array = np.array(sorted(problems) or np.empty((0, 2)), dtype=np.int64).reshape(-1, 2)
+
+    arrays = {'terms': np.array(terms, dtype=f'S{_TERM_WIDTH}'), 'offsets': offsets,
+              'postings': page_ids, 'counts': counts, 'problems': problem_array,
+              'text': np.frombuffer(b''.join(texts), dtype=np.uint8),
+              'text_offsets': text_offsets}
+    for key, array in arrays.items():
+        tmp = index_dir / f'{key}.tmp.npy'
+        np.save(tmp, array)
+        os.replace(tmp, index_dir / f'{key}.npy')
+    (index_dir / 'pages.json').write_text(json.dumps(pages_meta), encoding='utf-8')
+
+#=============================================================================
+# Querying
+#=============================================================================
+_open_indexes = {}
+
+def open_index(index_dir=INDEX_DIR):
+    """Memory-map an index (cached per directory and pages.json mtime)."""
+    index_dir = Path(index_dir)
+    stamp = (index_dir / 'pages.json').stat().st_mtime_ns
+    cached = _open_indexes.get(index_dir)
+    if cached is not None and cached['stamp'] == stamp:
+        return cached
+    index = {key: np.load(index_dir / f'{key}.npy', mmap_mode='r')
+             for key in ('terms', 'offsets', 'postings', 'counts', 'problems',
+                         'text', 'text_offsets')}
+    index['pages'] = json.loads((index_dir / 'pages.json').read_text(encoding='utf-8'))
+    index['stamp'] = stamp
+    _open_indexes[index_dir] = index
+    return index
+
+def _page_text(index, page_id):
+    start, end = index['text_offsets'][page_id], index['text_offsets'][page_id + 1]
+    return bytes(index['text'][start:end]).decode('utf-8')
+
+def _postings(index, term):
+    key = term[:_TERM_WIDTH].encode()
+    i = int(np.searchsorted(index['terms'], key))
+    if i == index['terms'].shape[0] or index['terms'][i] != key:
+        return np.empty(0, dtype=np.uint32), np.empty(0, dtype=np.uint16)
+    start, end = index['offsets'][i], index['offsets'][i + 1]
+    return index['postings'][start:end], index['counts'][start:end]
+
+def find_problem(number, index_dir=INDEX_DIR):
+    """
+    Where a problem starts and the pages it spans.
+
+    Returns:
+        list of dicts with split, page, file and pages (page ids up to
+        the next problem header), one per occurrence of the header
+    """
+    index = open_index(index_dir)
+    problems = index['problems']
+    lo = int(np.searchsorted(problems[:, 0], number, side='left'))
+    hi = int(np.searchsorted(problems[:, 0], number, side='right'))
+    starts = sorted(set(problems[:, 1]))
+    hits = []
+    for page_id in problems[lo:hi, 1]:
+        page_id = int(page_id)
+        later = [s for s in starts if s > page_id]
+        last = (later[0] if later else len(index['pages']) - 1)
+        split, page, name = index['pages'][page_id]
+        hits.append({'split': split, 'page': page, 'file': name,
+                     'pages': [tuple(index['pages'][p][:2]) for p in range(page_id, last + 1)]})
+    return hits
+
+def search(query, index_dir=INDEX_DIR, limit=10):
+    """
+    Query the index.
+
+    "problem 1039" (or a bare 4-digit problem number) looks up problem
+    headers; anything else is a keyword search ranked by
+    Σ log(1 + tf)·idf over the query terms. Pages holding every term come
+    first; if there are none, pages holding any term are ranked instead.
+
+    Returns:
+        list of dicts with split, page, file, score and snippet (the
+        first matching line)
+    """
+    index = open_index(index_dir)
+    match = re.fullmatch(r'\s*(?:problem\s+)?([12]\d{3})\s*', query, re.I)
+    if match:
+        hits = find_problem(int(match.group(1)), index_dir)
+        if hits:
+            for hit in hits:
+                hit['score'] = math.inf
+                hit['snippet'] = f"Problem {match.group(1)}"
+            return hits[:limit]
+
+    terms = [t for t in dict.fromkeys(tokenize(query)) if t != 'problem'] or tokenize(query)
+    if not terms:
+        return []
+    n_pages = len(index['pages'])
+    scores, matched = {}, {}
+    for term in terms:
+        pages, counts = _postings(index, term)
+        if pages.size == 0:
+            continue
+        idf = math.log(1 + n_pages / pages.size)
+        for page_id, score in zip(pages.tolist(), (np.log1p(counts) * idf).tolist()):
+            scores[page_id] = scores.get(page_id, 0.0) + score
+            matched[page_id] = matched.get(page_id, 0) + 1
+    ranked = sorted(scores.items(), key=lambda item: (-matched[item[0]], -item[1]))
+    if ranked and matched[ranked[0][0]] == len(terms):
+        ranked = [item for item in ranked if matched[item[0]] == len(terms)]
+    ranked = ranked[:limit]
+    hits = []
+    for page_id, score in ranked:
+        split, page, name = index['pages'][page_id]
+        lines = _page_text(index, page_id).split('\n')
+        snippet = max(lines, key=lambda l: len(set(tokenize(l)) & set(terms)))
+        hits.append({'split': split, 'page': page, 'file': name, 'score': score,
+                     'snippet': snippet[:100]})
+    return hits
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    import time
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('query', nargs='*', help='search terms, or "problem NNNN"')
+    parser.add_argument('--pdfs', default=PDF_DIR, help='directory with the split PDFs')
+    parser.add_argument('--index', default=INDEX_DIR, help='index directory')
+    parser.add_argument('--jobs', type=int, default=None, help='extraction workers')
+    parser.add_argument('--force', action='store_true', help='re-extract every PDF')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Split-PDF Full-Text Index")
+    print("=" * 60)
+    start = time.perf_counter()
+    report = build_index(args.pdfs, args.index, args.jobs, args.force)
+    elapsed = time.perf_counter() - start
+    print(f"  {len(report['extracted'])} PDFs extracted, {report['reused']} reused, index "
+          f"{'rebuilt' if report['rebuilt'] else 'unchanged'}: {report['n_pages']} pages, "
+          f"{report['n_terms']} terms in {elapsed:.2f} s")
+    queries = [' '.join(args.query)] if args.query else \
+        ['problem 1039', 'Joule-Thomson inversion', 'Carnot refrigerator', 'Fermi energy']
+    for query in queries:
+        start = time.perf_counter()
+        hits = search(query, args.index, limit=3)
+        elapsed = time.perf_counter() - start
+        print(f"  '{query}' ({elapsed*1000:.1f} ms):")
+        for hit in hits:
+            print(f"    split_{hit['split']}.pdf p.{hit['page']}: {hit['snippet']}")
+        if not hits:
+            print("    no matches")
+    print()
@@ -0,0 +1,183 @@
+"""
+Integrated Clausius-Clapeyron Vapor-Pressure Curves
+Extends the Clausius-Clapeyron slope of Chapter 3 - Python Computational Solutions
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+
+from chapter3_functions import R, clausius_clapeyron
+
+# Water liquid-vapour coexistence (reference point: normal boiling point)
+water_vaporization = {
+    'L0': 40.7e3,      # J/mol - latent heat at T0
+    'T0': 373.15,      # K
+    'p0': 101325.0,    # Pa
+    'dCp': -41.7,      # J/(mol·K) - Cp(vapour) - Cp(liquid)
+    'v_liquid': 18e-6  # m³/mol
+}
+
+CORRECTION_STEP = 0.1   # K - grid step for integrating the liquid-volume correction
+
+#=============================================================================
+# Vapor-Pressure Curve p_sat(T)
+#=============================================================================
+def latent_heat(T, L0, T0, dCp=0.0):
+    """
+    Latent heat from Kirchhoff's law, L(T) = L0 + ΔCp (T - T0).
+
+    Parameters:
+        T: temperature (K)
+        L0: latent heat at T0 (J/mol)
+        T0: reference temperature (K)
+        dCp: heat capacity difference between the phases (J/(mol·K))
+
+    Returns:
+        L: latent heat (J/mol)
+    """
+    return L0 + dCp * (np.asarray(T) - T0)
+
+def _ln_p_ideal(T, L0, T0, p0, dCp):
+    """Closed-form ln p_sat(T) for an ideal vapour and a negligible liquid volume."""
+    return np.log(p0) + (L0 - dCp * T0) / R * (1/T0 - 1/T) + dCp / R * np.log(T / T0)
+
+def _liquid_volume_correction(T, L0, T0, p0, dCp, v_liquid, iterations):
+    """
+    ln p - ln p_ideal at T, integrated outward from T0 on a grid of
+    fixed step anchored at T0, so the value at a temperature does not
+    depend on the other temperatures of the batch.
+    """
+    k = np.arange(np.floor((min(T.min(), T0) - T0) / CORRECTION_STEP),
+                  np.ceil((max(T.max(), T0) - T0) / CORRECTION_STEP) + 1)
+    grid = T0 + k * CORRECTION_STEP
+    i0 = int(np.flatnonzero(k == 0)[0])
+    ln_p_ideal = _ln_p_ideal(grid, L0, T0, p0, dCp)
+    slope = latent_heat(grid, L0, T0, dCp) / (R * grid**2)
+    correction = np.zeros_like(grid)
+    for _ in range(iterations):
+        q = np.exp(ln_p_ideal + correction) * v_liquid / (R * grid)
+        f = slope * q / (1 - q)
+        F = np.concatenate(([0.0], np.cumsum(0.5 * (f[1:] + f[:-1]) * CORRECTION_STEP)))
+        correction = F - F[i0]
+    return np.interp(T, grid, correction)
+
+def vapor_pressure_curve(T, L0, T0, p0, dCp=0.0, v_liquid=0.0, iterations=3):
+    """
+    Calculate the coexistence pressure p_sat(T) from the integrated
+    Clausius-Clapeyron equation.
+
+    With an ideal vapour and L(T) = L0 + ΔCp (T - T0) the equation
+    integrates in closed form:
+        ln(p/p0) = (L0 - ΔCp T0)/R (1/T0 - 1/T) + (ΔCp/R) ln(T/T0)
+    A finite liquid volume multiplies the slope by 1/(1 - p v_l/RT). That
+    small correction is integrated numerically from T0 on an internal
+    grid of step CORRECTION_STEP and resolved by a few vectorized
+    fixed-point sweeps; scalars and arrays get the same values.
+
+    Parameters:
+        T: temperatures (K), scalar or array
+        L0: latent heat at T0 (J/mol)
+        T0, p0: a known point on the curve (K, Pa)
+        dCp: heat capacity difference vapour - liquid (J/(mol·K))
+        v_liquid: molar volume of the condensed phase (m³/mol)
+        iterations: fixed-point sweeps for the liquid-volume correction
+
+    Returns:
+        p: saturation pressure (Pa), same shape as T
+    """
+    T = np.asarray(T, dtype=np.float64)
+    ln_p = _ln_p_ideal(T, L0, T0, p0, dCp)
+    if v_liquid and T.size:
+        ln_p = ln_p + _liquid_volume_correction(T.ravel(), L0, T0, p0, dCp, v_liquid,
+                                                iterations).reshape(T.shape)
+    return np.exp(ln_p)
+
+def phase_boundary_table(T_min, T_max, n, L0, T0, p0, dCp=0.0, v_liquid=0.0):
+    """
+    Tabulate a coexistence curve and its local Clausius-Clapeyron slope.
+
+    Parameters:
+        T_min, T_max: temperature range (K)
+        n: number of grid points
+        L0, T0, p0, dCp, v_liquid: as in vapor_pressure_curve
+
+    Returns:
+        dict with T (K), p (Pa), L (J/mol), delta_V (m³/mol) and dpdT (Pa/K)
+    """
+    T = np.linspace(T_min, T_max, n)
+    p = vapor_pressure_curve(T, L0, T0, p0, dCp, v_liquid)
+    L = latent_heat(T, L0, T0, dCp)
+    delta_V = R * T / p - v_liquid
+    return {
+        'T': T, 'p': p, 'L': L,
+        'delta_V': delta_V,
+        'dpdT': clausius_clapeyron(L, T, delta_V)
+    }
+
+#=============================================================================
+# Inverse Lookup T_sat(p)
+#=============================================================================
+@lru_cache(maxsize=32)
+def _saturation_inverse(L0, T0, p0, dCp, v_liquid, T_min, T_max, n):
+    """
+    Build (once per curve) a monotone interpolant of 1/T against ln p.
+
+    ln p is close to linear in 1/T, so a PCHIP interpolant on a modest
+    grid reproduces the curve to well below 1 mK while preserving
+    monotonicity.
+    """
+    T = np.linspace(T_min, T_max, n)
+    p = vapor_pressure_curve(T, L0, T0, p0, dCp, v_liquid)
+    return PchipInterpolator(np.log(p), 1.0 / T, extrapolate=True)
+
+def saturation_temperature(p, L0, T0, p0, dCp=0.0, v_liquid=0.0,
+                           T_range=None, n=2048):
+    """
+    Calculate the coexistence temperature T_sat(p).
+
+    The interpolant for a given curve is built on first use and cached,
+    so repeated calls from an inner loop cost one interpolation.
+
+    Parameters:
+        p: pressure (Pa), scalar or array
+        L0, T0, p0, dCp, v_liquid: as in vapor_pressure_curve
+        T_range: (T_min, T_max) in K covered by the interpolant
+            (default: 0.5 T0 to 1.5 T0)
+        n: grid size of the interpolant
+
+    Returns:
+        T_sat: saturation temperature (K)
+    """
+    T_min, T_max = T_range if T_range is not None else (0.5 * T0, 1.5 * T0)
+    inverse = _saturation_inverse(float(L0), float(T0), float(p0), float(dCp),
+                                  float(v_liquid), float(T_min), float(T_max), int(n))
+    return 1.0 / inverse(np.log(p))
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    import time
+
+    print("=" * 60)
+    print("Integrated Clausius-Clapeyron: Water Vapor-Pressure Curve")
+    print("=" * 60)
+    table = phase_boundary_table(273.15, 473.15, 200_001, **water_vaporization)
+    for T_C in (25, 50, 100, 150, 200):
+        k = np.argmin(np.abs(table['T'] - (T_C + 273.15)))
+        print(f"  T = {T_C:3d}°C: p_sat = {table['p'][k]/1000:9.2f} kPa, "
+              f"dp/dT = {table['dpdT'][k]/1000:.3f} kPa/K")
+
+    p_query = np.array([2.339e3, 101325.0, 1.0e6])
+    T_sat = saturation_temperature(p_query, **water_vaporization)
+    for p_i, T_i in zip(p_query, T_sat):
+        print(f"  T_sat({p_i/1000:.1f} kPa) = {T_i - 273.15:.2f}°C")
+
+    start = time.perf_counter()
+    for p_i in np.linspace(5e3, 5e5, 10_000):
+        saturation_temperature(p_i, **water_vaporization)
+    elapsed = time.perf_counter() - start
+    print(f"  10,000 scalar T_sat lookups: {elapsed*1000:.0f} ms (cached interpolant)")
+    print()
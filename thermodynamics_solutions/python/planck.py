@@ -0,0 +1,325 @@
+"""
+Planck-Spectrum Band Integrals for Radiation Problems
+In-band fluxes, spectral emissivity and shields for Problems 1024, 1027, 1030 - Python Computational Solutions
+"""
+
+from math import factorial
+
+import numpy as np
+
+from chapter1_first_law import sigma, k_B, problem_1024, problem_1027, problem_1030
+
+# Physical Constants
+h_P = 6.626e-34    # J·s - Planck constant
+c_light = 2.998e8  # m/s
+c2 = h_P * c_light / k_B  # m·K - second radiation constant
+
+#=============================================================================
+# Incomplete Planck Integral
+#=============================================================================
+# With x = c2/(λT), the fraction of blackbody emission at wavelengths
+# below λ is
+#   F(x) = (15/π⁴) ∫_x^∞ t³/(eᵗ - 1) dt
+#        = (15/π⁴) Σ_n e^{-nx} (x³/n + 3x²/n² + 6x/n³ + 6/n⁴)     (large x)
+#   1 - F(x) = (15/π⁴) Σ_k B_k x^{k+3} / (k! (k+3))                (small x)
+# Both series are summed with fixed term counts, so one call costs a few
+# dozen array operations regardless of the number of points.
+_X_SWITCH = 2.0
+_N_EXP_TERMS = 20   # e^{-20·2} ≈ 4e-18
+_BERNOULLI = {0: 1.0, 1: -1/2, 2: 1/6, 4: -1/30, 6: 1/42, 8: -1/30, 10: 5/66,
+              12: -691/2730, 14: 7/6, 16: -3617/510, 18: 43867/798,
+              20: -174611/330}
+# Small-x coefficients of x³ × polynomial in x, highest power first
+_SMALL_X_POLY = np.zeros(max(_BERNOULLI) + 1)
+for _k, _B in _BERNOULLI.items():
+    _SMALL_X_POLY[-1 - _k] = _B / (factorial(_k) * (_k + 3))
+_NORM = 15 / np.pi**4
+
+def planck_fractions(x):
+    """
+    Blackbody fraction F(x) below x = c2/(λT) and its complement 1 - F,
+    each computed without cancellation.
+
+    Parameters:
+        x: reduced frequency c2/(λT) = hν/kT, array
+
+    Returns:
+        F: fraction of the emission at x' > x (wavelengths below λ)
+        Q: its complement 1 - F, i.e. (15/π⁴) ∫_0^x x'³/(e^x' - 1) dx'
+    """
+    x = np.asarray(x, dtype=np.float64)
+    F = np.empty(x.shape)
+    Q = np.empty(x.shape)
+    large = x >= _X_SWITCH
+    # Large x: exponential series, with e^{-nx} built by repeated products
+    xl = x[large]
+    e = np.exp(-xl)
+    xl = np.where(np.isfinite(xl), xl, 0.0)  # λ = 0 (e = 0) contributes nothing
+    e_n = e.copy()
+    tail = np.zeros_like(xl)
+    for n in range(1, _N_EXP_TERMS + 1):
+        tail += e_n * (((xl / n + 3 / n**2) * xl + 6 / n**3) * xl + 6 / n**4)
+        e_n *= e
+    F[large] = _NORM * tail
+    Q[large] = 1.0 - F[large]
+    # Small x: Bernoulli series for the complement
+    small = ~large
+    xs = x[small]
+    Q[small] = _NORM * xs**3 * np.polyval(_SMALL_X_POLY, xs)
+    F[small] = 1.0 - Q[small]
+    return F, Q
+
+def _reduced(lam, T):
+    """x = c2/(λT), with λ = 0 → ∞ and λ = ∞ → 0."""
+    lam = np.asarray(lam, dtype=np.float64)
+    T = np.asarray(T, dtype=np.float64)
+    with np.errstate(divide='ignore'):
+        return c2 / (lam * T)
+
+def blackbody_fraction(lam, T):
+    """
+    Fraction of blackbody emission at wavelengths below λ.
+
+    Parameters:
+        lam: wavelength (m), may be 0 or np.inf
+        T: temperature (K), broadcastable with lam
+
+    Returns:
+        F: fraction in [0, 1]
+    """
+    return planck_fractions(_reduced(lam, T))[0]
+
+def band_fraction(lam1, lam2, T):
+    """
+    Fraction of blackbody emission between wavelengths λ1 < λ2.
+
+    Bands lying wholly at long wavelengths are differenced through the
+    complement 1 - F, so narrow bands in either tail keep full relative
+    accuracy.
+
+    Parameters:
+        lam1, lam2: band edges (m), broadcastable arrays
+        T: temperature (K), broadcastable with the edges
+
+    Returns:
+        fraction in [0, 1]
+    """
+    x1 = _reduced(lam1, T)  # short-wavelength edge, larger x
+    x2 = _reduced(lam2, T)
+    F1, Q1 = planck_fractions(x1)
+    F2, Q2 = planck_fractions(x2)
+    return np.where(x1 >= _X_SWITCH, F2 - F1, Q1 - Q2)
+
+def band_emissive_power(lam1, lam2, T):
+    """Blackbody emissive power between λ1 and λ2, σT⁴ × band fraction (W/m²)."""
+    T = np.asarray(T, dtype=np.float64)
+    return sigma * T**4 * band_fraction(lam1, lam2, T)
+
+def band_matrix(edges, T):
+    """
+    Blackbody fractions of a set of contiguous bands for many temperatures.
+
+    Parameters:
+        edges: band edges (m), increasing, shape (K+1,); use 0 and np.inf
+            for open-ended outer bands
+        T: temperatures (K), any shape
+
+    Returns:
+        fractions of shape T.shape + (K,)
+    """
+    edges = np.asarray(edges, dtype=np.float64)
+    T = np.asarray(T, dtype=np.float64)[..., None]
+    return band_fraction(edges[:-1], edges[1:], T)
+
+#=============================================================================
+# Spectral Emissivity
+#=============================================================================
+def emissivity_bands(edges=None, eps=1.0):
+    """
+    Piecewise-constant spectral emissivity ε(λ).
+
+    Parameters:
+        edges: interior band edges (m), increasing, shape (K-1,);
+            None for a grey surface
+        eps: emissivity in each of the K bands (a scalar when grey)
+
+    Returns:
+        dict with edges (shape (K+1,), from 0 to np.inf) and eps (K,)
+    """
+    inner = np.asarray([] if edges is None else edges, dtype=np.float64)
+    eps = np.atleast_1d(np.asarray(eps, dtype=np.float64))
+    if eps.size != inner.size + 1:
+        raise ValueError("need one emissivity per band (len(edges) + 1)")
+    return {'edges': np.concatenate(([0.0], inner, [np.inf])), 'eps': eps}
+
+def tabulated_emissivity(lam, eps):
+    """
+    Emissivity bands from a measured curve ε(λ_i), with band edges at the
+    midpoints between samples.
+
+    Parameters:
+        lam: sample wavelengths (m), increasing
+        eps: emissivity at each sample
+
+    Returns:
+        dict as from emissivity_bands
+    """
+    lam = np.asarray(lam, dtype=np.float64)
+    return emissivity_bands(0.5 * (lam[1:] + lam[:-1]), eps)
+
+def _common_bands(*surfaces):
+    """Merge band edges of several surfaces; returns edges and per-surface ε."""
+    edges = np.unique(np.concatenate([s['edges'] for s in surfaces]))
+    # Each merged band lies inside the source band containing its left edge
+    eps = [s['eps'][np.searchsorted(s['edges'], edges[:-1], side='right') - 1]
+           for s in surfaces]
+    return edges, eps
+
+def total_emissivity(surface, T):
+    """
+    Total hemispherical emissivity ε(T) = Σ ε_i × band fraction_i(T).
+
+    By Kirchhoff's law this is also the absorptivity for blackbody
+    radiation from a source at temperature T.
+    """
+    return band_matrix(surface['edges'], T) @ surface['eps']
+
+#=============================================================================
+# Radiative Exchange and Shields
+#=============================================================================
+def band_exchange(Ta, Tb, surface_a, surface_b):
+    """
+    Net flux between large parallel plates with spectral emissivities,
+    q = Σ_i [E_i(Ta) - E_i(Tb)] / (1/ε_a,i + 1/ε_b,i - 1)  (W/m²).
+
+    Parameters:
+        Ta, Tb: plate temperatures (K), broadcastable arrays
+        surface_a, surface_b: dicts from emissivity_bands
+
+    Returns:
+        q: net flux from a to b (W/m²)
+    """
+    edges, (eps_a, eps_b) = _common_bands(surface_a, surface_b)
+    Ta = np.asarray(Ta, dtype=np.float64)
+    Tb = np.asarray(Tb, dtype=np.float64)
+    conductance = 1 / (1 / eps_a + 1 / eps_b - 1)
+    Ea = sigma * Ta[..., None]**4 * band_matrix(edges, Ta)
+    Eb = sigma * Tb[..., None]**4 * band_matrix(edges, Tb)
+    return (Ea - Eb) @ conductance
+
+def shield_exchange(T1, T2, shield, walls=None, tol=1e-10, max_iter=200):
+    """
+    Radiation shield between two walls (Problem 1024 with spectral data).
+
+    The shield temperature T3 balances q(T2 → T3) = q(T3 → T1); both
+    sides are monotone in T3, so batched bisection on [T1, T2] converges
+    for every entry. A grey shield of emissivity 1 - R between black walls
+    reproduces problem_1024.
+
+    Parameters:
+        T1: cold wall temperature (K), array
+        T2: hot wall temperature (K), broadcastable with T1
+        shield: dict from emissivity_bands (both faces)
+        walls: dict from emissivity_bands for both walls (default black)
+        tol: relative tolerance on T3
+        max_iter: bisection iteration cap
+
+    Returns:
+        dict with J (flux without shield), J_star (with shield),
+        T3 and ratio, as in problem_1024
+    """
+    walls = emissivity_bands() if walls is None else walls
+    T1, T2 = np.broadcast_arrays(np.asarray(T1, dtype=np.float64),
+                                 np.asarray(T2, dtype=np.float64))
+    lo, hi = T1.copy(), T2.copy()
+    for _ in range(max_iter):
+        T3 = 0.5 * (lo + hi)
+        excess = band_exchange(T2, T3, walls, shield) - band_exchange(T3, T1, shield, walls)
+        lo = np.where(excess > 0, T3, lo)
+        hi = np.where(excess > 0, hi, T3)
+        if np.all(hi - lo <= tol * hi):
+            break
+    T3 = 0.5 * (lo + hi)
+    J = band_exchange(T2, T1, walls, walls)
+    J_star = band_exchange(T3, T1, shield, walls)
+    return {'J': J, 'J_star': J_star, 'T3': T3, 'ratio': J_star / J}
+
+def equilibrium_temperature(J_incident, T_source, surface, geometry=4.0,
+                            tol=1e-10, max_iter=200):
+    """
+    Radiative equilibrium temperature of a body lit by a distant source.
+
+    Solves α(T_source) J = geometry × ε(T) σT⁴ by batched bisection, where
+    α and ε follow from the same spectral emissivity evaluated at the
+    source and body temperatures. For a black or grey body this is
+    Problem 1030's (J/(4σ))^(1/4).
+
+    Parameters:
+        J_incident: incident flux (W/m²), array
+        T_source: blackbody temperature of the source (K)
+        surface: dict from emissivity_bands
+        geometry: emitting area / absorbing cross-section (4 for a
+            rotating sphere)
+
+    Returns:
+        T: equilibrium temperature (K)
+    """
+    J_incident = np.asarray(J_incident, dtype=np.float64)
+    absorbed = total_emissivity(surface, T_source) * J_incident
+    lo = np.zeros(np.broadcast(absorbed, J_incident).shape)
+    # ε ≥ min band emissivity, so this bounds T from above
+    hi = (absorbed / (geometry * sigma * surface['eps'].min())) ** 0.25 + lo
+    for _ in range(max_iter):
+        T = 0.5 * (lo + hi)
+        emitted = geometry * total_emissivity(surface, T) * sigma * T**4
+        lo = np.where(emitted < absorbed, T, lo)
+        hi = np.where(emitted < absorbed, hi, T)
+        if np.all(hi - lo <= tol * hi):
+            break
+    return 0.5 * (lo + hi)
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    import time
+
+    print("=" * 60)
+    print("Planck Band Integrals: In-Band Radiometry")
+    print("=" * 60)
+    T_sun = problem_1027()
+    bands = {'UV (< 0.4 μm)': (0.0, 0.4e-6), 'visible': (0.4e-6, 0.7e-6),
+             'near IR (0.7-3 μm)': (0.7e-6, 3e-6), 'MWIR (3-5 μm)': (3e-6, 5e-6)}
+    print(f"Sun at {T_sun:.0f} K (Problem 1027), solar constant 1000 W/m²:")
+    for name, (l1, l2) in bands.items():
+        f = band_fraction(l1, l2, T_sun)
+        print(f"  {name:20s}: {f*100:6.2f}% → {f*1000:7.2f} W/m²")
+
+    T_grid = np.linspace(200, 6000, 1_000_000)
+    start = time.perf_counter()
+    visible = band_fraction(0.4e-6, 0.7e-6, T_grid)
+    elapsed = time.perf_counter() - start
+    print(f"  Visible fraction at {T_grid.size:,} temperatures in {elapsed*1000:.0f} ms "
+          f"(peak {visible.max()*100:.1f}% at {T_grid[visible.argmax()]:.0f} K)")
+    edges = np.concatenate(([0.0], np.geomspace(0.1e-6, 100e-6, 65), [np.inf]))
+    fractions = band_matrix(edges, T_grid[::1000])
+    print(f"  Band matrix for {fractions.shape[0]} T × {fractions.shape[1]} bands "
+          f"sums to 1 within {np.abs(fractions.sum(-1) - 1).max():.1e}")
+
+    r = problem_1024(4.2, 300, 0.95)
+    grey = shield_exchange(4.2, 300, emissivity_bands(eps=0.05))
+    print(f"Problem 1024 grey shield: T3 = {r['T3']:.1f} K vs {grey['T3']:.1f} K, "
+          f"ratio {r['ratio']:.4f} vs {grey['ratio']:.4f}")
+    # Metal film: emissivity rising toward short wavelengths
+    metal = tabulated_emissivity([1e-6, 3e-6, 10e-6, 30e-6, 100e-6],
+                                 [0.30, 0.10, 0.04, 0.02, 0.015])
+    nongrey = shield_exchange(4.2, 300, metal)
+    print(f"Non-grey metal shield: T3 = {nongrey['T3']:.1f} K, "
+          f"ratio = {nongrey['ratio']:.4f}")
+
+    T_N, J_N = problem_1030()
+    selective = emissivity_bands([3e-6], [0.9, 0.1])  # dark in visible, shiny in IR
+    T_sel = equilibrium_temperature(J_N, 6000, selective)
+    print(f"Neptune (Problem 1030): black body {T_N:.1f} K, "
+          f"selective surface {T_sel:.1f} K")
+    print()
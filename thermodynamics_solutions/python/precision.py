@@ -0,0 +1,175 @@
+"""
+Floating-Point Precision Policy for the Chapter Functions
+float64, float32 and mixed evaluation, set globally or per call - Python Computational Solutions
+"""
+
+import contextvars
+import functools
+import inspect
+import numbers
+from contextlib import contextmanager
+
+import numpy as np
+
+# Policies map to (storage dtype, dtype of cancellation-prone steps):
+#   'float64'  everything in double precision
+#   'float32'  everything in single precision; formulas that would cancel
+#              are written in forms that stay accurate (a⁴ - b⁴ factored,
+#              ln(T2/T1) as log1p of the Celsius difference, ...)
+#   'mixed'    float32 inputs and results, with those steps widened to
+#              float64 and rounded once
+# With no policy (the default) arguments are used exactly as passed.
+# Python-float constants such as R or sigma are "weak" scalars under
+# NumPy 2 promotion (NEP 50), so they never upcast float32 arrays. NumPy
+# 1.x would promote np.float32 * float to float64: NumPy >= 2 is required.
+POLICIES = {
+    'float64': (np.float64, np.float64),
+    'float32': (np.float32, np.float32),
+    'mixed': (np.float32, np.float64),
+}
+
+_global = None
+_BUFFERS = ('out', 'work')
+_active = contextvars.ContextVar('precision', default=None)
+
+#=============================================================================
+# Policy Selection
+#=============================================================================
+def _check(policy):
+    if policy is not None and policy not in POLICIES:
+        raise ValueError(f"unknown precision policy {policy!r}; use one of {sorted(POLICIES)}")
+    return policy
+
+def set_precision(policy):
+    """Set the process-wide policy ('float64', 'float32', 'mixed' or None)."""
+    global _global
+    _global = _check(policy)
+
+def get_precision():
+    """Policy in force: the innermost use_precision/per-call one, else the global one."""
+    return _active.get() or _global
+
+@contextmanager
+def use_precision(policy):
+    """Apply a policy inside a with-block (nests, and is local to the thread/task)."""
+    token = _active.set(_check(policy))
+    try:
+        yield
+    finally:
+        _active.reset(token)
+
+def working_dtype():
+    """Storage dtype of the active policy (None if no policy is set)."""
+    policy = get_precision()
+    return None if policy is None else POLICIES[policy][0]
+
+#=============================================================================
+# Casting and Cancellation-Safe Kernels
+#=============================================================================
+def _cast(value, dtype):
+    """Convert float and integer data (recursively through dicts/tuples) to dtype."""
+    if value is None or isinstance(value, (bool, np.bool_, str)):
+        return value
+    if isinstance(value, dict):
+        return {k: _cast(v, dtype) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_cast(v, dtype) for v in value)
+    if isinstance(value, np.ndarray):
+        return value.astype(dtype, copy=False) if value.dtype.kind in 'iuf' else value
+    if isinstance(value, (numbers.Real, np.number)):
+        return dtype(value)
+    return value
+
+def wide(x):
+    """x in the dtype the active policy uses for cancellation-prone steps."""
+    policy = get_precision()
+    return x if policy is None else _cast(x, POLICIES[policy][1])
+
+def narrow(x):
+    """x in the storage dtype of the active policy."""
+    policy = get_precision()
+    return x if policy is None else _cast(x, POLICIES[policy][0])
+
+def diff_pow4(a, b):
+    """a⁴ - b⁴ without cancellation, as (a - b)(a + b)(a² + b²)."""
+    a, b = wide(a), wide(b)
+    return narrow((a - b) * (a + b) * (a*a + b*b))
+
+#=============================================================================
+# Function Decorator
+#=============================================================================
+def precision_policy(func):
+    """
+    Give func a precision= keyword and apply the active policy to it.
+
+    Under a policy every numeric argument, defaults included, is cast to
+    the storage dtype before the call, and numeric results are returned
+    in that dtype. Output and scratch buffers (out=, work=) are the
+    caller's and are used as given. Without a policy the call goes
+    straight through.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, precision=None, **kwargs):
+        policy = _check(precision) or get_precision()
+        if policy is None:
+            return func(*args, **kwargs)
+        dtype = POLICIES[policy][0]
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        for name, value in bound.arguments.items():
+            if name not in _BUFFERS:
+                bound.arguments[name] = _cast(value, dtype)
+        token = _active.set(policy)
+        try:
+            result = func(*bound.args, **bound.kwargs)
+        finally:
+            _active.reset(token)
+        return result if bound.arguments.get('out') is not None else _cast(result, dtype)
+    return wrapper
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    import time
+
+    from chapter1_first_law import problem_1024
+    from chapter2_entropy import problem_1039, problem_1046
+
+    print("=" * 60)
+    print("Precision Policy: float64, float32 and mixed Evaluation")
+    print("=" * 60)
+    T0 = np.random.default_rng(1).uniform(230.0, 300.0, 20_000_000)
+    for policy in ('float64', 'float32'):
+        x = T0.astype(POLICIES[policy][0])
+        start = time.perf_counter()
+        Te = problem_1039(x, 1000.0, 50.0, precision=policy)
+        elapsed = time.perf_counter() - start
+        print(f"  problem_1039 on 2e7 points, {policy}: {elapsed:.3f} s, "
+              f"{x.nbytes/1e6:.0f} MB in, result {Te.dtype}")
+
+    # inputs exactly representable in float32, so only the formula's error shows
+    T1, T2 = 77.0, 77.0 + 2.0**-10
+    exact = 5.67e-8 * (T2 - T1) * (T2 + T1) * (T2**2 + T1**2)
+    naive = 5.67e-8 * (np.float32(T2)**4 - np.float32(T1)**4)
+    print(f"  problem_1024, T1 = {T1} K, T2 = {T2} K: J = {exact:.7e} W/m²")
+    print(f"    naive float32 T2⁴ - T1⁴: {naive:.7e} (rel. error {abs(naive/exact - 1):.1e})")
+    for policy in ('float32', 'mixed'):
+        J = problem_1024(T1, T2, 0.95, precision=policy)['J']
+        print(f"    {policy:7s} policy:         {J:.7e} (rel. error {abs(J/exact - 1):.1e})")
+
+    T1, T2 = np.float32(293.15), np.float32(293.25)
+    exact = 4180 * (np.log(np.float64(T2) / np.float64(T1)) - (np.float64(T2) - T1) / T2)
+    naive = 4180 * (np.log(T2 / T1) - (T2 - T1) / T2)
+    print(f"  problem_1046, 20.0 → 20.1 °C: ΔS_universe = {exact:.5e} J/K")
+    print(f"    naive float32 sum:       {naive:.5e} (rel. error {abs(naive/exact - 1):.1e})")
+    with use_precision('float32'):
+        r = problem_1046(1, T1 - 273.15, T2 - 273.15)
+    print(f"    float32 policy:          {r['delta_S_total']:.5e} "
+          f"(rel. error {abs(r['delta_S_total']/exact - 1):.1e})")
+    r = problem_1046(1, T1 - 273.15, T2 - 273.15, precision='mixed')
+    print(f"    mixed policy:            {r['delta_S_total']:.5e} "
+          f"(rel. error {abs(r['delta_S_total']/exact - 1):.1e})")
+    print()
@@ -0,0 +1,371 @@
+"""
+Lazy Dependency Graph for Chained Problems
+Named quantities, incremental recomputation and an evicting result cache - Python Computational Solutions
+"""
+
+import hashlib
+import inspect
+
+import numpy as np
+
+from chapter1_first_law import problem_1027, sigma
+from chapter2_entropy import problem_1039, problem_1040
+from chapter3_functions import scale_height
+from result_store import result_columns
+
+# A node is a function whose parameters are read from named quantities and
+# whose results are published as named quantities. Every quantity carries
+# a token: inputs hash their value when set, node outputs hash the node
+# name with the tokens of its inputs. A node's cache key is its token, so
+# after an input changes exactly the nodes downstream of it miss the cache;
+# everything else, including earlier what-if values that are still cached,
+# is reused. Evaluation is lazy: only nodes a requested quantity depends on
+# are visited, and a node whose key is cached never fetches its inputs.
+_CACHE_BYTES = 2**28
+
+#=============================================================================
+# Problem Links
+#=============================================================================
+def kelvin(T_C):
+    """Celsius to kelvin."""
+    return T_C + 273.15
+
+def heat_pump_power(T0, T2, COP, alpha):
+    """
+    Power a heat pump needs to hold a building at its setpoint (Problems 1039/1040).
+
+    In equilibrium the pump delivers the heat the building loses,
+    Q = α(T2 - T0). The COP is the one at the setpoint T2 (as from
+    problem_1040), so the building settles at T2 by construction.
+
+    Parameters:
+        T0: outside temperature (K)
+        T2: inside setpoint (K)
+        COP: heat delivered per unit work at the setpoint
+        alpha: heat loss coefficient (W/K)
+
+    Returns:
+        dict with Q, heat delivered (W), and W_hold, power consumed (W)
+    """
+    Q = alpha * (T2 - T0)
+    return {'Q': Q, 'W_hold': Q / COP}
+
+def neptune_temperature(T_sun, r_sun=7e8, r_SN=4.5e12):
+    """
+    Neptune's black-body temperature from the sun's (Problem 1030 fed by 1027).
+
+    Parameters:
+        T_sun: solar surface temperature (K)
+        r_sun: radius of sun (m)
+        r_SN: sun-Neptune distance (m)
+
+    Returns:
+        T_neptune: equilibrium temperature (K)
+        J_neptune: solar flux at Neptune (W/m²)
+    """
+    J_neptune = sigma * T_sun**4 * (r_sun / r_SN)**2
+    T_neptune = (J_neptune / (4 * sigma)) ** 0.25
+    return T_neptune, J_neptune
+
+def isothermal_pressure(z, p0, H):
+    """Pressure p0·exp(-z/H) of an isothermal atmosphere with scale height H (Pa)."""
+    return p0 * np.exp(-z / H)
+
+#=============================================================================
+# Graph Construction
+#=============================================================================
+def node(func, outputs, inputs=None, fixed=None):
+    """
+    A graph node.
+
+    Parameters:
+        func: problem function
+        outputs: quantity names for the results: a list (tuple results in
+                 order, or keys of a dict result) or a dict mapping result
+                 names to quantity names
+        inputs: dict parameter → quantity for parameters whose quantity
+                has another name (by default a parameter reads the
+                quantity of the same name)
+        fixed: dict of constant keyword arguments
+
+    Returns:
+        dict describing the node
+    """
+    if not isinstance(outputs, dict):
+        outputs = {name: name for name in outputs}
+    return {'func': func, 'outputs': outputs, 'inputs': dict(inputs or {}),
+            'fixed': dict(fixed or {})}
+
+def _token(value):
+    """Content hash of an input value."""
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(value, np.ndarray):
+        value = np.ascontiguousarray(value)
+        h.update(f"{value.dtype.str}{value.shape}".encode())
+        h.update(value.data if value.dtype.kind != 'O' else repr(value.tolist()).encode())
+    else:
+        h.update(f"{type(value).__name__}:{value!r}".encode())
+    return h.hexdigest()
+
+def build_graph(nodes, inputs, max_bytes=_CACHE_BYTES):
+    """
+    Wire nodes together through their named quantities.
+
+    A parameter is connected to the quantity it names (after renaming)
+    if some node produces it or it is an input; otherwise it takes a
+    fixed value or the function's default.
+
+    Parameters:
+        nodes: dict of node name → node()
+        inputs: dict of input quantity → initial value
+        max_bytes: cache budget for node results; least recently used
+                   entries are evicted beyond it
+
+    Returns:
+        graph dict (pass to set_inputs and evaluate)
+    """
+    producer = {}
+    for name, spec in nodes.items():
+        for quantity in spec['outputs'].values():
+            if quantity in producer or quantity in inputs:
+                raise ValueError(f"quantity {quantity!r} is defined twice")
+            producer[quantity] = name
+
+    wired = {}
+    for name, spec in nodes.items():
+        edges = {}
+        for param in inspect.signature(spec['func']).parameters.values():
+            quantity = spec['inputs'].get(param.name, param.name)
+            if param.name in spec['fixed']:
+                continue
+            if quantity in producer or quantity in inputs:
+                edges[param.name] = quantity
+            elif param.default is inspect.Parameter.empty:
+                raise ValueError(f"node {name!r}: nothing provides {quantity!r}")
+        wired[name] = {**spec, 'inputs': edges,
+                       'fixed_token': _token(repr(sorted(spec['fixed'].items())))}
+
+    graph = {'nodes': wired, 'producer': producer, 'inputs': set(inputs), 'values': {}, 'tokens': {},
+             'cache': {}, 'cache_bytes': 0, 'max_bytes': max_bytes,
+             'stats': {'computed': 0, 'hits': 0, 'evicted': 0}, 'last_computed': []}
+    _check_acyclic(graph)
+    set_inputs(graph, **inputs)
+    return graph
+
+def _check_acyclic(graph):
+    state = {}
+
+    def visit(name, path):
+        if state.get(name) == 'done':
+            return
+        if state.get(name) == 'open':
+            raise ValueError(f"cycle through nodes {' → '.join(path + [name])}")
+        state[name] = 'open'
+        for quantity in graph['nodes'][name]['inputs'].values():
+            if quantity in graph['producer']:
+                visit(graph['producer'][quantity], path + [name])
+        state[name] = 'done'
+
+    for name in graph['nodes']:
+        visit(name, [])
+
+def set_inputs(graph, **values):
+    """
+    Change input quantities; nodes downstream of them become stale.
+
+    Nothing is recomputed here: the next evaluate() of a quantity
+    depending on a changed input recomputes just the affected nodes.
+    Arrays are hashed when set, so pass an array again after modifying
+    it in place.
+    """
+    for quantity, value in values.items():
+        if quantity in graph['producer']:
+            raise ValueError(f"{quantity!r} is computed by node {graph['producer'][quantity]!r}")
+        if quantity not in graph['inputs']:
+            raise ValueError(f"{quantity!r} is not an input of this graph")
+        graph['values'][quantity] = value
+        graph['tokens'][quantity] = _token(value)
+
+#=============================================================================
+# Lazy Evaluation
+#=============================================================================
+def _node_key(graph, name, keys):
+    """Token of a node: its name and fixed arguments with its inputs' tokens."""
+    if name not in keys:
+        spec = graph['nodes'][name]
+        parts = [name, spec['fixed_token']]
+        for param, quantity in sorted(spec['inputs'].items()):
+            if quantity in graph['tokens']:
+                parts.append(graph['tokens'][quantity])
+            else:
+                parts.append(_node_key(graph, graph['producer'][quantity], keys))
+        keys[name] = hashlib.blake2b('|'.join(parts).encode(), digest_size=16).hexdigest()
+    return keys[name]
+
+def _nbytes(values):
+    return sum(v.nbytes for v in values.values() if isinstance(v, np.ndarray))
+
+def _store(graph, key, values):
+    """Cache a node's results, evicting the least recently used beyond the budget."""
+    cache = graph['cache']
+    size = _nbytes(values)
+    cache[key] = (values, size)
+    graph['cache_bytes'] += size
+    while graph['cache_bytes'] > graph['max_bytes'] and len(cache) > 1:
+        graph['cache_bytes'] -= cache.pop(next(iter(cache)))[1]
+        graph['stats']['evicted'] += 1
+
+def _outputs(graph, name, run):
+    """A node's results: from the call, from the cache, or computed."""
+    if name in run['held']:
+        return run['held'][name]
+    key = _node_key(graph, name, run['keys'])
+    cache = graph['cache']
+    if key in cache:
+        cache[key] = cache.pop(key)     # most recently used
+        graph['stats']['hits'] += 1
+        values = cache[key][0]
+    else:
+        spec = graph['nodes'][name]
+        args = {param: _value(graph, quantity, run) for param, quantity in spec['inputs'].items()}
+        columns = result_columns(spec['func'](**args, **spec['fixed']), list(spec['outputs']))
+        values = {}
+        for result_name, quantity in spec['outputs'].items():
+            value = columns[result_name]
+            if isinstance(value, np.ndarray):
+                value.setflags(write=False)   # shared with later hits
+            values[quantity] = value
+        _store(graph, key, values)
+        graph['stats']['computed'] += 1
+        run['computed'].append(name)
+    run['held'][name] = values
+    return values
+
+def _value(graph, quantity, run):
+    if quantity in graph['values']:
+        return graph['values'][quantity]
+    return _outputs(graph, graph['producer'][quantity], run)[quantity]
+
+def evaluate(graph, *quantities):
+    """
+    Values of the requested quantities, computing only what is stale.
+
+    Nodes the requested quantities do not depend on are not visited, and
+    cached nodes are not recomputed; graph['last_computed'] lists the
+    nodes this call ran. Returned arrays are read-only views of the cache.
+
+    Returns:
+        dict of quantity → value
+    """
+    for quantity in quantities:
+        if quantity not in graph['values'] and quantity not in graph['producer']:
+            raise KeyError(f"unknown quantity {quantity!r}")
+    run = {'keys': {}, 'held': {}, 'computed': []}
+    result = {quantity: _value(graph, quantity, run) for quantity in quantities}
+    graph['last_computed'] = run['computed']
+    return result
+
+def stale(graph, *quantities):
+    """Nodes that evaluating the quantities (all by default) would recompute."""
+    keys = {}
+    names = set()
+
+    def visit(quantity):
+        name = graph['producer'].get(quantity)
+        if name is None or name in names:
+            return
+        if _node_key(graph, name, keys) in graph['cache']:
+            return
+        names.add(name)
+        for upstream in graph['nodes'][name]['inputs'].values():
+            visit(upstream)
+
+    for quantity in quantities or graph['producer']:
+        visit(quantity)
+    return sorted(names)
+
+def clear_cache(graph):
+    """Drop every cached node result."""
+    graph['cache'].clear()
+    graph['cache_bytes'] = 0
+
+#=============================================================================
+# Example Graphs
+#=============================================================================
+def heat_pump_graph(T1_C=2.0, T2_C=27.0, W=1000.0, alpha=500.0, max_bytes=_CACHE_BYTES):
+    """
+    Problem 1040's COP feeding the power that holds the setpoint, next to
+    Problem 1039's building temperature for a fixed pump power W.
+    """
+    return build_graph({
+        'outside': node(kelvin, ['T0'], inputs={'T_C': 'T1_C'}),
+        'inside': node(kelvin, ['T2'], inputs={'T_C': 'T2_C'}),
+        'cop': node(problem_1040, ['COP']),
+        'ideal': node(problem_1039, ['Te_ideal']),
+        'pump': node(heat_pump_power, ['Q', 'W_hold']),
+    }, {'T1_C': T1_C, 'T2_C': T2_C, 'W': W, 'alpha': alpha}, max_bytes)
+
+def solar_graph(J_earth=0.1e4, r_sun=7e8, r_SE=1.5e11, r_SN=4.5e12, max_bytes=_CACHE_BYTES):
+    """Problem 1027's solar temperature feeding Problem 1030's Neptune estimate."""
+    return build_graph({
+        'sun': node(problem_1027, ['T_sun']),
+        'neptune': node(neptune_temperature, ['T_neptune', 'J_neptune']),
+    }, {'J_earth': J_earth, 'r_sun': r_sun, 'r_SE': r_SE, 'r_SN': r_SN}, max_bytes)
+
+def atmosphere_graph(z, T=288.0, mu=0.029, p0=101325.0, max_bytes=_CACHE_BYTES):
+    """scale_height feeding the isothermal pressure profile."""
+    return build_graph({
+        'scale': node(scale_height, ['H']),
+        'profile': node(isothermal_pressure, ['p']),
+    }, {'z': z, 'T': T, 'mu': mu, 'p0': p0}, max_bytes)
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    import time
+
+    print("=" * 60)
+    print("Lazy Problem Graph: Recompute Only What Changed")
+    print("=" * 60)
+    g = heat_pump_graph()
+    r = evaluate(g, 'COP', 'W_hold', 'Te_ideal')
+    print(f"  Heat pump, 2°C outside, 27°C setpoint: COP = {r['COP']:.1f}, "
+          f"holding power {r['W_hold']:.0f} W (1 kW ideal pump: {r['Te_ideal'] - 273.15:.1f}°C)")
+    for change in [{'W': 1500.0}, {'T2_C': 21.0}, {'W': 1000.0, 'T2_C': 27.0}, {'T1_C': -10.0}]:
+        set_inputs(g, **change)
+        print(f"    set {change}: stale {stale(g, 'W_hold', 'Te_ideal')}")
+        r = evaluate(g, 'W_hold', 'Te_ideal')
+        print(f"      recomputed {g['last_computed']}, holding power {r['W_hold']:.0f} W, "
+              f"ideal pump {r['Te_ideal'] - 273.15:.1f}°C")
+
+    g = solar_graph()
+    r = evaluate(g, 'T_sun', 'T_neptune')
+    print(f"  Sun {r['T_sun']:.0f} K → Neptune {r['T_neptune']:.0f} K; ", end='')
+    set_inputs(g, r_SN=4.5e12 * 30.1 / 30.0)
+    r = evaluate(g, 'T_neptune')
+    print(f"moving Neptune recomputes {g['last_computed']} → {r['T_neptune']:.1f} K")
+
+    n = 2_000_000
+    T = np.linspace(200.0, 320.0, 2000)[:, None]
+    g = atmosphere_graph(np.linspace(0.0, 30e3, n // 2000), T=T, max_bytes=40_000_000)
+    start = time.perf_counter()
+    evaluate(g, 'p')
+    t_all = time.perf_counter() - start
+    set_inputs(g, p0=90_000.0)
+    start = time.perf_counter()
+    evaluate(g, 'p')
+    t_one = time.perf_counter() - start
+    set_inputs(g, p0=101325.0)
+    start = time.perf_counter()
+    evaluate(g, 'p')
+    t_back = time.perf_counter() - start
+    print(f"  Atmosphere, {n:.0e} points: full {t_all*1e3:.1f} ms; p0 changed "
+          f"{t_one*1e3:.1f} ms ({g['stats']['computed']} node runs so far); "
+          f"p0 back to 101325 Pa {t_back*1e3:.2f} ms (cached)")
+    set_inputs(g, mu=0.028)
+    evaluate(g, 'p')
+    print(f"  Cache: {g['cache_bytes']/1e6:.0f} of {g['max_bytes']/1e6:.0f} MB, "
+          f"{len(g['cache'])} entries, {g['stats']['evicted']} evicted, "
+          f"{g['stats']['hits']} hits")
+    print()
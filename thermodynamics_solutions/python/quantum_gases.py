@@ -0,0 +1,361 @@
+"""
+Fermi-Dirac and Bose-Einstein Integrals for Ideal Quantum Gases
+Cached Chebyshev/series approximations, inverses and degenerate-gas EOS - Python Computational Solutions
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from scipy.integrate import quad
+from scipy.special import expit, gamma, zeta
+
+from chapter1_first_law import k_B
+from planck import h_P
+
+# Physical Constants
+m_e = 9.109e-31    # kg - electron mass
+m_He4 = 6.646e-27  # kg - helium-4 atom mass
+
+#=============================================================================
+# Complete Fermi-Dirac Integral F_j(η)
+#=============================================================================
+# F_j(η) = 1/Γ(j+1) ∫_0^∞ t^j / (e^{t-η} + 1) dt = -Li_{j+1}(-e^η), j > -1.
+# Three regions, each built once per order and cached:
+#   η < -2:        alternating series in x = e^η (Horner polynomial)
+#   -2 ≤ η < 30:   piecewise Chebyshev expansions, width-4 pieces
+#   η ≥ 30:        Sommerfeld asymptotic series (e^{-η} terms < 1e-13)
+_ETA_LOW = -2.0
+_ETA_HIGH = 30.0
+_PIECE_WIDTH = 4.0
+_CHEB_DEGREE = 36
+_SERIES_TERMS = 24   # e^{-2·24} ≈ 1e-21
+
+def _fd_quad(j, eta):
+    """F_j(η) by adaptive quadrature in u = √t (table construction only)."""
+    def integrand(u):
+        return 2 * u**(2 * j + 1) * expit(eta - u * u)
+    a = np.sqrt(max(eta, 0.0))
+    b = np.sqrt(max(eta, 0.0) + 60.0)
+    head = quad(integrand, 0.0, a, epsabs=0, epsrel=1e-13, limit=200)[0] if a > 0 else 0.0
+    tail = quad(integrand, a, b, epsabs=0, epsrel=1e-13, limit=200)[0]
+    return (head + tail) / gamma(j + 1)
+
+@lru_cache(maxsize=16)
+def fermi_dirac_table(j):
+    """
+    Build (once per order) the approximations used by fermi_dirac.
+
+    Parameters:
+        j: order, j > -1 (e.g. -0.5, 0.5, 1.5)
+
+    Returns:
+        dict with series coefficients, piece edges and Chebyshev
+        coefficients (one row per piece), and Sommerfeld coefficients
+    """
+    k = np.arange(1, _SERIES_TERMS + 1)
+    series = (-1.0)**(k + 1) / k**(j + 1)
+    edges = np.arange(_ETA_LOW, _ETA_HIGH + _PIECE_WIDTH / 2, _PIECE_WIDTH)
+    nodes = np.cos(np.pi * (np.arange(_CHEB_DEGREE + 1) + 0.5) / (_CHEB_DEGREE + 1))
+    cheb = np.empty((edges.size - 1, _CHEB_DEGREE + 1))
+    for p, (lo, hi) in enumerate(zip(edges[:-1], edges[1:])):
+        eta = 0.5 * (lo + hi) + 0.5 * (hi - lo) * nodes
+        values = [_fd_quad(j, e) for e in eta]
+        cheb[p] = np.polynomial.chebyshev.chebfit(nodes, values, _CHEB_DEGREE)
+    # Sommerfeld: F_j = η^{j+1}/Γ(j+2) [1 + Σ_k a_k η^{-2k}],
+    # a_k = 2(1 - 2^{1-2k}) ζ(2k) (j+1) j ... (j+2-2k)
+    somm = []
+    falling = 1.0
+    for m in range(1, 13):
+        falling *= (j + 1 - (2 * m - 2)) * (j + 1 - (2 * m - 1))
+        somm.append(2 * (1 - 2.0**(1 - 2 * m)) * zeta(2 * m) * falling)
+    for arr in (series, edges, cheb):
+        arr.setflags(write=False)
+    return {'j': j, 'series': series, 'edges': edges, 'cheb': cheb,
+            'sommerfeld': np.array(somm), 'norm': 1 / gamma(j + 2)}
+
+def fermi_dirac(j, eta):
+    """
+    Complete Fermi-Dirac integral F_j(η), normalized so F_j → e^η as
+    η → -∞ and F_j → η^{j+1}/Γ(j+2) as η → +∞.
+
+    Parameters:
+        j: order, j > -1
+        eta: reduced chemical potential μ/kT, array
+
+    Returns:
+        F_j(η)
+    """
+    table = fermi_dirac_table(j)
+    eta = np.asarray(eta, dtype=np.float64)
+    out = np.empty(eta.shape)
+    low = eta < _ETA_LOW
+    high = eta >= _ETA_HIGH
+    x = np.exp(eta[low])
+    out[low] = x * np.polyval(table['series'][::-1], x)
+
+    mid = ~(low | high)
+    eta_mid = eta[mid]
+    piece = np.minimum(((eta_mid - _ETA_LOW) // _PIECE_WIDTH).astype(np.intp),
+                       table['cheb'].shape[0] - 1)
+    values = np.empty(eta_mid.shape)
+    for p in np.unique(piece):
+        sel = piece == p
+        lo = table['edges'][p]
+        t = 2 * (eta_mid[sel] - lo) / _PIECE_WIDTH - 1
+        values[sel] = np.polynomial.chebyshev.chebval(t, table['cheb'][p])
+    out[mid] = values
+
+    eta_high = eta[high]
+    inv2 = eta_high**-2.0
+    out[high] = (table['norm'] * eta_high**(j + 1)
+                 * (1 + inv2 * np.polyval(table['sommerfeld'][::-1], inv2)))
+    return out
+
+@lru_cache(maxsize=16)
+def _fd_inverse_table(j):
+    """Monotone grid of (ln F_j, η) used to start the Newton inversion."""
+    eta = np.linspace(-40.0, 400.0, 4401)
+    return np.log(fermi_dirac(j, eta)), eta
+
+def inverse_fermi_dirac(j, F, newton=3):
+    """
+    Solve F_j(η) = F for η at array speed.
+
+    A cached (ln F, η) table gives the start; Newton steps use
+    dF_j/dη = F_{j-1}(η), which needs j > 0 (for j = 1/2 the derivative
+    order is -1/2). Values beyond the table use the nondegenerate or
+    fully degenerate limits as starting points. j = 0 is solved in
+    closed form, F_0 = ln(1 + e^η).
+
+    Parameters:
+        j: order, j ≥ 0 (typically 1/2)
+        F: target values (> 0), array
+        newton: Newton iterations
+
+    Returns:
+        eta
+    """
+    if j < 0:
+        raise ValueError(f"inverse_fermi_dirac needs j ≥ 0, got {j}")
+    F = np.asarray(F, dtype=np.float64)
+    if j == 0:
+        # η = ln(e^F - 1), written to stay accurate for small and large F
+        return F + np.log(-np.expm1(-F))
+    ln_F, eta_grid = _fd_inverse_table(j)
+    ln_target = np.log(F)
+    eta = np.interp(ln_target, ln_F, eta_grid)
+    eta = np.where(ln_target < ln_F[0], ln_target, eta)
+    degenerate = (F * gamma(j + 2))**(1 / (j + 1))
+    eta = np.where(ln_target > ln_F[-1], degenerate, eta)
+    for _ in range(newton):
+        # Newton in ln F: converges from the table start for all η
+        eta = eta - (np.log(fermi_dirac(j, eta)) - ln_target) * \
+            fermi_dirac(j, eta) / fermi_dirac(j - 1, eta)
+    return eta
+
+#=============================================================================
+# Bose-Einstein Integral g_s(z) = Li_s(z)
+#=============================================================================
+# With z = e^{-α}, α ≥ 0:
+#   α ≥ 2:  power series Σ z^k / k^s (z ≤ e^{-2})
+#   α < 2:  Robinson expansion Γ(1-s) α^{s-1} + Σ_k ζ(s-k) (-α)^k / k!
+#           (converges for α < 2π; non-integer s)
+_ALPHA_SPLIT = 2.0
+_ROBINSON_TERMS = 40   # (2/2π)^40 ≈ 1e-20
+
+@lru_cache(maxsize=16)
+def bose_einstein_table(s):
+    """
+    Cached coefficients for g_s (non-integer s, e.g. 0.5, 1.5, 2.5).
+
+    Returns:
+        dict with power-series and Robinson coefficients
+    """
+    if float(s).is_integer():
+        raise ValueError("bose_einstein supports non-integer orders only")
+    k = np.arange(1, _SERIES_TERMS + 1)
+    kk = np.arange(_ROBINSON_TERMS)
+    factorial = np.cumprod(np.concatenate(([1.0], np.arange(1, _ROBINSON_TERMS))))
+    robinson = zeta(s - kk) * (-1.0)**kk / factorial
+    return {'s': s, 'series': 1 / k**s, 'robinson': robinson,
+            'singular': gamma(1 - s)}
+
+def bose_einstein(s, alpha):
+    """
+    Bose-Einstein integral g_s(z) = Li_s(z) at z = e^{-α}.
+
+    Parameters:
+        s: order (non-integer; 3/2 for density, 5/2 for pressure)
+        alpha: -ln z = -μ/kT ≥ 0, array
+
+    Returns:
+        g_s(e^{-α}); for s > 1, g_s(1) = ζ(s)
+    """
+    table = bose_einstein_table(s)
+    alpha = np.asarray(alpha, dtype=np.float64)
+    out = np.empty(alpha.shape)
+    far = alpha >= _ALPHA_SPLIT
+    z = np.exp(-alpha[far])
+    out[far] = z * np.polyval(table['series'][::-1], z)
+    a = alpha[~far]
+    with np.errstate(divide='ignore'):
+        singular = np.where(a > 0, table['singular'] * a**(s - 1),
+                            0.0 if s > 1 else np.inf)
+    out[~far] = singular + np.polyval(table['robinson'][::-1], a)
+    return out
+
+def bose_fugacity_series(s, z):
+    """g_s(z) for fugacity z in [0, 1] (convenience wrapper)."""
+    with np.errstate(divide='ignore'):
+        return bose_einstein(s, -np.log(np.asarray(z, dtype=np.float64)))
+
+@lru_cache(maxsize=16)
+def _be_inverse_table(s):
+    """Monotone grid of (g_s, √α) used to start the Newton inversion."""
+    w = np.linspace(0.0, np.sqrt(40.0), 4001)
+    return bose_einstein(s, w**2), w
+
+def inverse_bose_einstein(s, g, newton=3):
+    """
+    Solve g_s(e^{-α}) = g for α ≥ 0, e.g. fugacity from density with
+    s = 3/2. Targets at or above ζ(s) (condensed phase) return α = 0.
+
+    For s ≤ 2 Newton runs in w = √α, where g_s is smooth at the
+    condensation point; for s > 2 the slope dg_s/dα = -g_{s-1} stays
+    finite at α = 0 and Newton runs in α itself.
+
+    Parameters:
+        s: order > 1
+        g: target values (> 0), array
+        newton: Newton iterations
+
+    Returns:
+        alpha
+    """
+    g = np.asarray(g, dtype=np.float64)
+    g_grid, w_grid = _be_inverse_table(s)
+    # g decreases with w; interpolate on the reversed grid
+    w = np.interp(g, g_grid[::-1], w_grid[::-1])
+    small = g < g_grid[-1]
+    w = np.where(small, np.sqrt(np.maximum(-np.log(np.where(small, g, 1.0)), 0.0)), w)
+    condensed = g >= g_grid[0]
+    if s > 2:
+        # in w the slope -2w g_{s-1} vanishes at w = 0 and Newton stalls
+        a = w * w
+        for _ in range(newton):
+            step = (bose_einstein(s, a) - g) / -bose_einstein(s - 1, a)
+            a = np.where(condensed, 0.0, np.maximum(a - step, 0.25 * a))
+        return a
+    for _ in range(newton):
+        w = np.maximum(w, 1e-300)
+        a = w * w
+        # dg/dw = -2w g_{s-1}(α)
+        step = (bose_einstein(s, a) - g) / (-2 * w * bose_einstein(s - 1, a))
+        w = np.where(condensed, 0.0, np.maximum(w - step, 0.5 * w))
+    return np.where(condensed, 0.0, w * w)
+
+#=============================================================================
+# Ideal Quantum Gases
+#=============================================================================
+def thermal_wavelength(T, m):
+    """Thermal de Broglie wavelength λ = h/√(2π m kT) (m)."""
+    return h_P / np.sqrt(2 * np.pi * m * k_B * np.asarray(T, dtype=np.float64))
+
+def fermi_energy(n, m=m_e, g=2):
+    """Fermi energy ε_F = ħ²/2m (6π² n/g)^{2/3} (J)."""
+    hbar = h_P / (2 * np.pi)
+    return hbar**2 / (2 * m) * (6 * np.pi**2 * np.asarray(n, dtype=np.float64) / g)**(2 / 3)
+
+def fermi_gas(n, T, m=m_e, g=2):
+    """
+    Equation of state of an ideal Fermi gas over (n, T) arrays.
+
+    Solves n λ³/g = F_{1/2}(η) for the chemical potential.
+
+    Parameters:
+        n: number density (1/m³)
+        T: temperature (K), broadcastable with n
+        m: particle mass (kg)
+        g: spin degeneracy
+
+    Returns:
+        dict with mu (J), eta = μ/kT, pressure (Pa), energy density
+        u = 3P/2 (J/m³) and T/T_F
+    """
+    n, T = np.broadcast_arrays(np.asarray(n, dtype=np.float64),
+                               np.asarray(T, dtype=np.float64))
+    lam = thermal_wavelength(T, m)
+    eta = inverse_fermi_dirac(0.5, n * lam**3 / g)
+    kT = k_B * T
+    P = g * kT / lam**3 * fermi_dirac(1.5, eta)
+    return {'mu': eta * kT, 'eta': eta, 'pressure': P, 'energy_density': 1.5 * P,
+            'T_over_TF': kT / fermi_energy(n, m, g)}
+
+def bose_condensation_temperature(n, m=m_He4, g=1):
+    """T_c = (2πħ²/mk) (n/(g ζ(3/2)))^{2/3} (K)."""
+    hbar = h_P / (2 * np.pi)
+    return (2 * np.pi * hbar**2 / (m * k_B)
+            * (np.asarray(n, dtype=np.float64) / (g * zeta(1.5)))**(2 / 3))
+
+def bose_gas(n, T, m=m_He4, g=1):
+    """
+    Equation of state of an ideal Bose gas over (n, T) arrays.
+
+    Above T_c the fugacity solves n λ³/g = g_{3/2}(z); below it z = 1
+    and the excess density sits in the condensate.
+
+    Returns:
+        dict with fugacity z, mu (J), condensate_fraction, pressure (Pa)
+        and energy density u = 3P/2 (J/m³)
+    """
+    n, T = np.broadcast_arrays(np.asarray(n, dtype=np.float64),
+                               np.asarray(T, dtype=np.float64))
+    lam = thermal_wavelength(T, m)
+    alpha = inverse_bose_einstein(1.5, n * lam**3 / g)
+    kT = k_B * T
+    excited = np.minimum(g / lam**3 * bose_einstein(1.5, alpha), n)
+    P = g * kT / lam**3 * bose_einstein(2.5, alpha)
+    return {'z': np.exp(-alpha), 'mu': -alpha * kT,
+            'condensate_fraction': 1 - excited / n,
+            'pressure': P, 'energy_density': 1.5 * P}
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    import time
+
+    print("=" * 60)
+    print("Quantum Statistics: Fermi-Dirac and Bose-Einstein Integrals")
+    print("=" * 60)
+    start = time.perf_counter()
+    for j in (-0.5, 0.5, 1.5):
+        fermi_dirac_table(j)
+    print(f"  Chebyshev tables for F_-1/2, F_1/2, F_3/2 built in "
+          f"{time.perf_counter() - start:.2f} s (cached)")
+    eta = np.array([-10.0, 0.0, 5.0, 50.0])
+    for j in (0.5, 1.5):
+        values = ", ".join(f"{v:.10g}" for v in fermi_dirac(j, eta))
+        print(f"  F_{j}(η = -10, 0, 5, 50) = {values}")
+    print(f"  g_3/2(1) = {bose_einstein(1.5, 0.0):.12f} (ζ(3/2) = {zeta(1.5):.12f})")
+
+    n_Cu = 8.47e28  # conduction electrons in copper (1/m³)
+    E_F = fermi_energy(n_Cu)
+    print(f"  Copper: ε_F = {E_F/1.602e-19:.2f} eV, T_F = {E_F/k_B:.3g} K")
+
+    n_grid = np.geomspace(1e20, 1e32, 1000)
+    T_grid = np.geomspace(1.0, 1e7, 1000)
+    start = time.perf_counter()
+    eos = fermi_gas(n_grid[:, None], T_grid[None, :])
+    elapsed = time.perf_counter() - start
+    lam = thermal_wavelength(T_grid[None, :], m_e)
+    error = np.abs(fermi_dirac(0.5, eos['eta']) * 2 / lam**3 / n_grid[:, None] - 1).max()
+    print(f"  Electron-gas μ on a 1000 × 1000 (n, T) grid in {elapsed:.2f} s, "
+          f"max density residual {error:.1e}")
+
+    n_He = 2.2e28  # liquid-helium density (1/m³)
+    Tc = bose_condensation_temperature(n_He)
+    r = bose_gas(n_He, np.array([0.5, 1.0, 2.0, Tc, 4.0]))
+    print(f"  Ideal Bose gas at liquid-He density: T_c = {Tc:.2f} K; condensate fractions "
+          + ", ".join(f"{f:.3f}" for f in r['condensate_fraction']))
+    print()
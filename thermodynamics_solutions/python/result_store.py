@@ -0,0 +1,316 @@
+"""
+Columnar Result Store for Parameter Sweeps
+Chunked .npy columns, JSON manifest, checkpoint/resume and memory-mapped reads - Python Computational Solutions
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+# Store layout:
+#   manifest.json         grid hash, chunk size, job, column schema, finished chunks
+#   params/<name>.npy     the flattened parameter grid, one file per parameter
+#   columns/<name>.npy    one preallocated file per result column, rows in
+#                         grid order; chunk k fills rows k*chunk:(k+1)*chunk
+# A chunk is recorded in the manifest only after its rows are flushed, so
+# an interrupted sweep loses at most the chunk in flight.
+FORMAT_VERSION = 1
+_MANIFEST = 'manifest.json'
+
+#=============================================================================
+# Parameter Grids
+#=============================================================================
+def param_grid(**axes):
+    """
+    Flattened Cartesian product of parameter axes (last axis fastest).
+
+    Parameters:
+        axes: name=1-D array of values
+
+    Returns:
+        dict of equal-length 1-D arrays, one row per grid point
+    """
+    names = list(axes)
+    mesh = np.meshgrid(*(np.asarray(axes[k]).ravel() for k in names), indexing='ij')
+    return {k: m.ravel() for k, m in zip(names, mesh)}
+
+def _grid_hash(params):
+    h = hashlib.blake2b(digest_size=16)
+    for name in sorted(params):
+        a = np.ascontiguousarray(params[name])
+        h.update(f"{name}:{a.dtype.str}:{a.shape}".encode())
+        h.update(a.tobytes())
+    return h.hexdigest()
+
+#=============================================================================
+# Manifest
+#=============================================================================
+def read_manifest(path):
+    """Manifest dict of the store at path."""
+    with open(os.path.join(path, _MANIFEST)) as f:
+        return json.load(f)
+
+def _write_manifest(path, manifest):
+    """Atomic replace, so a pre-empted job never leaves a torn manifest."""
+    target = os.path.join(path, _MANIFEST)
+    tmp = target + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=1)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, target)
+
+def create_store(path, params, chunk_size=4096, overwrite=False, job=None):
+    """
+    Create (or reopen) a store for a sweep over params.
+
+    Reopening with the same grid, chunk size and job keeps the finished
+    chunks; anything else raises ValueError unless overwrite=True.
+
+    Parameters:
+        path: store directory
+        params: dict of equal-length 1-D parameter arrays (see param_grid)
+        chunk_size: grid points evaluated and checkpointed together
+        overwrite: discard an existing store holding a different sweep
+        job: JSON-serializable description of what fills the columns
+             (function, fixed arguments, outputs), kept in the manifest
+
+    Returns:
+        manifest dict
+    """
+    params = {k: np.asarray(v).ravel() for k, v in params.items()}
+    sizes = {v.size for v in params.values()}
+    if len(sizes) != 1:
+        raise ValueError("parameter arrays must have equal length")
+    n_rows = sizes.pop()
+    grid_hash = _grid_hash(params)
+    job = json.loads(json.dumps(job))   # as it reads back from the manifest
+
+    if os.path.exists(os.path.join(path, _MANIFEST)):
+        manifest = read_manifest(path)
+        if (manifest['grid_hash'] == grid_hash and manifest['chunk_size'] == chunk_size
+                and manifest.get('job') == job):
+            return manifest
+        if not overwrite:
+            raise ValueError(f"{path} holds a different sweep "
+                             f"(grid {manifest['grid_hash']}, job {manifest.get('job')}); "
+                             f"pass overwrite=True")
+        for sub in ('params', 'columns'):
+            for name in manifest[sub]:
+                try:
+                    os.remove(os.path.join(path, sub, name + '.npy'))
+                except FileNotFoundError:
+                    pass
+
+    os.makedirs(os.path.join(path, 'params'), exist_ok=True)
+    os.makedirs(os.path.join(path, 'columns'), exist_ok=True)
+    for name, values in params.items():
+        np.save(os.path.join(path, 'params', name + '.npy'), values)
+    manifest = {
+        'version': FORMAT_VERSION, 'grid_hash': grid_hash,
+        'n_rows': n_rows, 'chunk_size': chunk_size,
+        'n_chunks': -(-n_rows // chunk_size), 'job': job,
+        'params': {k: v.dtype.str for k, v in params.items()},
+        'columns': {}, 'done': []
+    }
+    _write_manifest(path, manifest)
+    return manifest
+
+#=============================================================================
+# Checkpointed Sweeps
+#=============================================================================
+def result_columns(result, outputs=None):
+    """Name a function's results: dicts pass through, tuples take outputs."""
+    if isinstance(result, dict):
+        return result
+    if not isinstance(result, tuple):
+        result = (result,)
+    if outputs is None or len(outputs) != len(result):
+        raise ValueError("tuple results need one name per element in outputs")
+    return dict(zip(outputs, result))
+
+def _open_columns(path, manifest, columns):
+    """Memory-map the result columns, creating them from the first chunk."""
+    maps = {}
+    for name, values in columns.items():
+        file = os.path.join(path, 'columns', name + '.npy')
+        if name in manifest['columns'] and os.path.exists(file):
+            maps[name] = np.load(file, mmap_mode='r+')
+        else:
+            values = np.asarray(values)
+            maps[name] = np.lib.format.open_memmap(
+                file, mode='w+', dtype=values.dtype, shape=(manifest['n_rows'],) + values.shape[1:])
+            manifest['columns'][name] = {'dtype': values.dtype.str,
+                                         'shape': list(values.shape[1:])}
+    return maps
+
+def write_chunk(path, manifest, k, columns, maps=None):
+    """
+    Store the result columns of chunk k and record it as finished.
+
+    Parameters:
+        path: store directory
+        manifest: dict from create_store (updated in place)
+        k: chunk index
+        columns: dict of arrays over the chunk's grid points
+        maps: column memmaps returned by the previous call, if any
+
+    Returns:
+        column memmaps, to pass to the next call
+    """
+    lo = k * manifest['chunk_size']
+    hi = min(lo + manifest['chunk_size'], manifest['n_rows'])
+    columns = {name: np.asarray(v) for name, v in columns.items()
+               if name not in manifest['params']}
+    if maps is None or columns.keys() - maps.keys():
+        maps = _open_columns(path, manifest, columns)
+    for name, values in columns.items():
+        maps[name][lo:hi] = np.broadcast_to(values, (hi - lo,) + values.shape[1:])
+    for mm in maps.values():
+        mm.flush()
+    manifest['done'] = sorted(set(manifest['done']) | {k})
+    _write_manifest(path, manifest)
+    return maps
+
+def run_sweep(path, func, params, chunk_size=4096, outputs=None,
+              overwrite=False, max_chunks=None, progress=None):
+    """
+    Evaluate func over a parameter grid, chunk by chunk, into a store.
+
+    func is called with one keyword array per parameter (a slice of the
+    grid) and must return arrays whose leading axis runs over those
+    grid points: a dict of columns, or a tuple named by outputs. Size-1
+    leading axes are broadcast, and results named like a parameter
+    (echoed inputs) are not stored again. Rerunning after an
+    interruption skips the chunks already in the manifest.
+
+    Parameters:
+        path: store directory
+        func: vectorized function of the parameters
+        params: dict of equal-length 1-D parameter arrays (see param_grid)
+        chunk_size: grid points per checkpoint
+        outputs: column names for tuple results
+        overwrite: replace a store holding a different grid
+        max_chunks: stop after this many new chunks (time-boxed jobs)
+        progress: optional callback(done_chunks, n_chunks)
+
+    Returns:
+        dict with 'done' (chunks finished), 'n_chunks' and 'complete'
+    """
+    manifest = create_store(path, params, chunk_size, overwrite)
+    params = {k: np.load(os.path.join(path, 'params', k + '.npy'), mmap_mode='r')
+              for k in manifest['params']}
+    done = set(manifest['done'])
+    pending = [k for k in range(manifest['n_chunks']) if k not in done]
+    if max_chunks is not None:
+        pending = pending[:max_chunks]
+
+    maps = None
+    for k in pending:
+        lo = k * chunk_size
+        hi = min(lo + chunk_size, manifest['n_rows'])
+        result = func(**{name: np.asarray(v[lo:hi]) for name, v in params.items()})
+        maps = write_chunk(path, manifest, k, result_columns(result, outputs), maps)
+        if progress is not None:
+            progress(len(manifest['done']), manifest['n_chunks'])
+
+    return {'done': len(manifest['done']), 'n_chunks': manifest['n_chunks'],
+            'complete': len(manifest['done']) == manifest['n_chunks']}
+
+#=============================================================================
+# Memory-Mapped Reads
+#=============================================================================
+def open_store(path, partial=False):
+    """
+    Read-only views of a store's parameter and result columns.
+
+    Columns are np.memmap views of the files: nothing is read until it
+    is indexed, and slicing does not copy.
+
+    Parameters:
+        path: store directory
+        partial: allow an unfinished sweep (rows of unfinished chunks
+                 are zero; see row_mask)
+
+    Returns:
+        dict of column name → read-only memmap, parameters first
+    """
+    manifest = read_manifest(path)
+    if not partial and len(manifest['done']) != manifest['n_chunks']:
+        raise ValueError(f"{path}: {len(manifest['done'])}/{manifest['n_chunks']} "
+                         f"chunks finished; resume with run_sweep or pass partial=True")
+    store = {}
+    for sub in ('params', 'columns'):
+        for name in manifest[sub]:
+            store[name] = np.load(os.path.join(path, sub, name + '.npy'), mmap_mode='r')
+    return store
+
+def row_mask(path):
+    """Boolean mask of grid rows whose chunk has finished."""
+    manifest = read_manifest(path)
+    mask = np.zeros(manifest['n_chunks'], dtype=bool)
+    mask[manifest['done']] = True
+    return np.repeat(mask, manifest['chunk_size'])[:manifest['n_rows']]
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    from chapter3_functions import adiabatic_atmosphere
+    from solenoid_transient import solenoid_design
+
+    print("=" * 60)
+    print("Columnar Result Store: Checkpointed Sweeps")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Adiabatic atmospheres: a 0-15 km profile per (T0, mu, gamma)
+        z = np.linspace(0.0, 15e3, 31)
+
+        def atmosphere(T0, mu, gamma):
+            p, T, dTdz = adiabatic_atmosphere(z, 101325.0, T0[:, None], mu[:, None],
+                                              gamma[:, None])
+            return {'p': p, 'T': T, 'dTdz': dTdz[:, 0]}
+
+        grid = param_grid(T0=np.linspace(250.0, 320.0, 71),
+                          mu=np.linspace(0.002, 0.030, 29),
+                          gamma=np.linspace(1.1, 1.67, 20))
+        path = os.path.join(tmp, 'atmosphere')
+        start = time.perf_counter()
+        status = run_sweep(path, atmosphere, grid, chunk_size=2048, max_chunks=10)
+        print(f"  Pre-empted after {status['done']}/{status['n_chunks']} chunks "
+              f"({row_mask(path).sum()} of {grid['T0'].size} profiles)")
+        status = run_sweep(path, atmosphere, grid, chunk_size=2048)
+        elapsed = time.perf_counter() - start
+        store = open_store(path)
+        size = sum(c.nbytes for c in store.values()) / 1e6
+        print(f"  Resumed to {status['done']}/{status['n_chunks']} chunks, "
+              f"{size:.0f} MB on disk in {elapsed:.2f} s")
+        i = np.flatnonzero((store['T0'] == 288.0) & np.isclose(store['mu'], 0.029)
+                           & np.isclose(store['gamma'], 1.4))[0]
+        print(f"  Earth (T0 = 288 K, γ = 1.4): p(10 km) = {store['p'][i, 20]:.0f} Pa, "
+              f"dT/dz = {store['dTdz'][i]*1000:.2f} K/km")
+        print(f"  Columns are memmaps: {type(store['p']).__name__}, "
+              f"slice shares memory: {np.shares_memory(store['p'][i], store['p'])}")
+        del store
+
+        # Problem 1022 coils over geometry (vectorized in solenoid_design)
+        coils = param_grid(B=np.linspace(0.05, 0.5, 46), N=np.arange(50, 401, 10),
+                           length=np.linspace(1.0, 8.0, 29), diameter=np.linspace(1.0, 5.0, 41))
+        path = os.path.join(tmp, 'coils')
+        run_sweep(path, lambda **kw: {k: v for k, v in solenoid_design(**kw).items()
+                                      if k in ('I', 'R', 'P', 'L', 'tau', 'p_mag')},
+                  coils, chunk_size=65536)
+        store = open_store(path)
+        ref = np.flatnonzero(np.isclose(store['B'], 0.25) & (store['N'] == 100)
+                             & (store['length'] == 4.0) & (store['diameter'] == 3.0))[0]
+        print(f"  {store['P'].size} coil geometries; Problem 1022 coil: "
+              f"I = {store['I'][ref]:.0f} A, P = {store['P'][ref]/1e3:.1f} kW, "
+              f"τ = {store['tau'][ref]:.2f} s")
+        del store
+    print()
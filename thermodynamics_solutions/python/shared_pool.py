@@ -0,0 +1,244 @@
+"""
+Shared-Memory Execution Backend for Batched Evaluations
+Zero-copy inputs and in-place outputs for process pools - Python Computational Solutions
+"""
+
+import atexit
+import contextlib
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from result_store import result_columns
+
+# Arrays handed to workers travel as descriptors (segment name, offset,
+# shape, strides, dtype); only those and the fixed scalar arguments are
+# pickled. A segment is unlinked as soon as the last array viewing it is
+# freed; the mapping itself is closed on the next call, once numpy has
+# released its buffer.
+_BLOCKS_PER_WORKER = 4
+
+#=============================================================================
+# Segment Lifecycle
+#=============================================================================
+_segments = {}    # name → (SharedMemory, base address, size) of live segments
+_closing = []     # unlinked segments whose mappings are still exported
+
+def _release(name):
+    shm = _segments.pop(name)[0]
+    with contextlib.suppress(FileNotFoundError):
+        shm.unlink()
+    _closing.append(shm)
+
+def _reap():
+    for shm in _closing[:]:
+        try:
+            shm.close()
+        except BufferError:
+            continue
+        _closing.remove(shm)
+
+@atexit.register
+def _unlink_all():
+    for name in list(_segments):
+        _release(name)
+
+def shared_empty(shape, dtype=np.float64):
+    """
+    Uninitialized array in a new shared-memory segment.
+
+    Inputs allocated this way are passed to shared_map without a copy.
+    The segment is removed when the array (and every view of it) is freed.
+    """
+    _reap()
+    dtype = np.dtype(dtype)
+    shape = tuple(np.atleast_1d(shape).astype(int)) if np.ndim(shape) else (int(shape),)
+    size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+    shm = SharedMemory(create=True, size=size)
+    arr = np.ndarray(shape, dtype, buffer=shm.buf)
+    _segments[shm.name] = (shm, arr.ctypes.data, size)
+    weakref.finalize(arr, _release, shm.name)
+    return arr
+
+def as_shared(a):
+    """a itself if it lives in a shared segment, else a shared copy of it."""
+    a = np.asarray(a)
+    if _describe(a) is not None:
+        return a
+    out = shared_empty(a.shape, a.dtype)
+    out[...] = a
+    return out
+
+def _describe(a):
+    """Descriptor of an array inside one of this process's segments, or None."""
+    addr = a.__array_interface__['data'][0]
+    for name, (_, base, size) in _segments.items():
+        if base <= addr < base + size:
+            return (name, addr - base, a.shape, a.strides, a.dtype.str)
+    return None
+
+@contextlib.contextmanager
+def _attached(descriptors):
+    """Worker side: map the segments and yield the arrays they describe."""
+    segments = {}
+    arrays = {}
+    try:
+        for key, (name, offset, shape, strides, dtype) in descriptors.items():
+            if name not in segments:
+                segments[name] = SharedMemory(name=name)
+            arrays[key] = np.ndarray(shape, dtype, buffer=segments[name].buf,
+                                     offset=offset, strides=strides)
+        yield arrays
+    finally:
+        arrays.clear()
+        for shm in segments.values():
+            # a traceback may still hold views; the mapping then closes with it
+            with contextlib.suppress(BufferError):
+                shm.close()
+
+#=============================================================================
+# Worker Pool
+#=============================================================================
+def shared_pool(workers=None):
+    """
+    Process pool for shared_map; reuse one across calls to skip start-up.
+
+    Parameters:
+        workers: processes (default os.cpu_count())
+    """
+    # Workers must report their attachments to the parent's tracker;
+    # a tracker of their own would unlink our segments when they exit.
+    resource_tracker.ensure_running()
+    return ProcessPoolExecutor(workers)
+
+def _run_block(func, fixed, inputs, outputs, lo, hi):
+    """Worker: evaluate rows lo:hi and write the results in place."""
+    with _attached({**inputs, **outputs}) as arrays:
+        result = func(**{k: arrays[k][lo:hi] for k in inputs}, **fixed)
+        columns = result_columns(result, list(outputs))
+        for name in outputs:
+            out = arrays[name][lo:hi]
+            out[...] = np.broadcast_to(columns[name], out.shape)
+        del result, columns, out
+
+#=============================================================================
+# Batched Evaluation
+#=============================================================================
+def shared_map(func, inputs, fixed=None, outputs=None, workers=None, block=None, pool=None):
+    """
+    Evaluate a vectorized function over row blocks in worker processes.
+
+    Array inputs and outputs live in shared-memory segments and are
+    sliced along their first axis; only segment descriptors cross the
+    process boundary. Inputs from shared_empty/as_shared are not copied
+    at all; other inputs are copied into a segment once.
+
+    Parameters:
+        func: module-level function, vectorized over the inputs
+        inputs: dict of keyword → array, all with the same first dimension
+        fixed: dict of scalar (or small) keyword arguments, pickled as is
+        outputs: names for tuple results, as in result_store.run_sweep
+        workers: processes when no pool is given
+        block: rows per task (default: 4 tasks per worker)
+        pool: executor from shared_pool, reused across calls
+
+    Returns:
+        the result in func's own form (array, tuple or dict), with every
+        array backed by shared memory
+    """
+    fixed = fixed or {}
+    inputs = {k: as_shared(v) for k, v in inputs.items()}
+    n_rows = {v.shape[0] for v in inputs.values()}
+    if len(n_rows) != 1:
+        raise ValueError("inputs must share their first dimension")
+    n = n_rows.pop()
+
+    # one-row probe in this process fixes the output names, dtypes and shapes
+    probe = func(**{k: np.asarray(v[:1]) for k, v in inputs.items()}, **fixed)
+    if outputs is None and not isinstance(probe, (dict, tuple)):
+        outputs = ['result']
+    columns = result_columns(probe, outputs)
+    if not isinstance(probe, dict):
+        outputs = list(columns)
+    results = {}
+    for name, value in columns.items():
+        value = np.asarray(value)
+        results[name] = shared_empty((n,) + value.shape[1:], value.dtype)
+
+    own_pool = pool is None
+    with contextlib.ExitStack() as stack:
+        if own_pool:
+            pool = stack.enter_context(shared_pool(workers))
+        n_workers = pool._max_workers
+        block = block or max(-(-n // (n_workers * _BLOCKS_PER_WORKER)), 1)
+        in_desc = {k: _describe(v) for k, v in inputs.items()}
+        out_desc = {k: _describe(v) for k, v in results.items()}
+        futures = [pool.submit(_run_block, func, fixed, in_desc, out_desc, lo, min(lo + block, n))
+                   for lo in range(0, n, block)]
+        for f in futures:
+            f.result()
+
+    if isinstance(probe, dict):
+        return results
+    if isinstance(probe, tuple):
+        return tuple(results[k] for k in outputs)
+    return results[outputs[0]]
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    import pickle
+    import time
+
+    from chapter3_functions import adiabatic_atmosphere, isothermal_atmosphere
+
+    print("=" * 60)
+    print("Shared-Memory Backend: Descriptors Instead of Pickled Arrays")
+    print("=" * 60)
+    n = 20_000_000
+    z = shared_empty(n)
+    z[:] = np.linspace(0.0, 30e3, n)
+    fixed = {'p0': 101325.0, 'T0': 288.0, 'mu': 0.029}
+
+    start = time.perf_counter()
+    direct = isothermal_atmosphere(z, **fixed)
+    t_direct = time.perf_counter() - start
+
+    with shared_pool() as pool:
+        blocks = np.array_split(np.asarray(z), 4 * pool._max_workers)
+        pool.submit(abs, 0).result()   # start the workers before timing
+        start = time.perf_counter()
+        pickled = np.concatenate(list(pool.map(isothermal_atmosphere, blocks,
+                                               *([v] * len(blocks) for v in fixed.values()))))
+        t_pickle = time.perf_counter() - start
+        moved = 2 * sum(len(pickle.dumps(b, protocol=5)) for b in blocks)
+
+        start = time.perf_counter()
+        p = shared_map(isothermal_atmosphere, {'z': z}, fixed, pool=pool)
+        t_shared = time.perf_counter() - start
+
+        print(f"  isothermal_atmosphere, {n:.0e} heights:")
+        print(f"    single process:       {t_direct:.2f} s")
+        print(f"    pickled blocks:       {t_pickle:.2f} s ({moved/1e6:.0f} MB serialized)")
+        print(f"    shared-memory blocks: {t_shared:.2f} s "
+              f"(identical: {np.array_equal(p, direct) and np.array_equal(pickled, direct)})")
+        del pickled, direct
+
+        T0 = as_shared(np.linspace(250.0, 320.0, n))
+        start = time.perf_counter()
+        pa, Ta, dTdz = shared_map(adiabatic_atmosphere, {'z': z, 'T0': T0},
+                                  {'p0': 101325.0, 'mu': 0.029, 'gamma': 1.4},
+                                  outputs=['p', 'T', 'dTdz'], pool=pool)
+        elapsed = time.perf_counter() - start
+        ref = adiabatic_atmosphere(z[-1], 101325.0, T0[-1], 0.029, 1.4)
+        print(f"  adiabatic_atmosphere over (z, T0) rows in {elapsed:.2f} s; last row "
+              f"p = {pa[-1]:.1f} Pa, T = {Ta[-1]:.2f} K (direct: {ref[0]:.1f} Pa, {ref[1]:.2f} K)")
+        names = list(_segments)
+        del p, pa, Ta, dTdz, T0
+    print(f"  Segments alive after the results are dropped: {len(_segments)} "
+          f"(of {len(names)}: only z remains)")
+    print()
@@ -0,0 +1,265 @@
+"""
+Debye and Einstein Heat-Capacity Models for Solids
+Cryogenic Cv(T), U(T), S(T) and batched entropy changes for Problems 1006, 1044, 1046 - Python Computational Solutions
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from chapter1_first_law import problem_1006
+from chapter2_entropy import R, problem_1044, problem_1046
+from planck import planck_fractions
+
+# Debye temperatures (K)
+theta_debye = {
+    'Pb': 105.0, 'Ag': 225.0, 'Au': 165.0, 'Cu': 343.0,
+    'Al': 428.0, 'Fe': 470.0, 'Si': 645.0, 'C (diamond)': 2230.0,
+}
+# Electronic heat-capacity coefficients γ (J/(mol·K²))
+gamma_electronic = {
+    'Pb': 2.98e-3, 'Ag': 0.646e-3, 'Au': 0.729e-3, 'Cu': 0.695e-3,
+    'Al': 1.35e-3, 'Fe': 4.98e-3,
+}
+
+#=============================================================================
+# Debye Function
+#=============================================================================
+def debye_function(y):
+    """
+    Debye function D3(y) = (3/y³) ∫_0^y x³/(eˣ - 1) dx.
+
+    The integral is the incomplete Planck integral, so it is evaluated
+    from the fixed-term series of planck.planck_fractions: no quadrature,
+    full precision for y from 0 to ∞.
+
+    Parameters:
+        y: Θ_D/T, array
+
+    Returns:
+        D3(y), with D3(0) = 1 and D3 → π⁴/(5y³) as y → ∞
+    """
+    y = np.asarray(y, dtype=np.float64)
+    _, Q = planck_fractions(y)
+    ys = np.where(y > 0, y, 1.0)
+    # Q = (15/π⁴) ∫_0^y ..., and Q ≈ (15/π⁴) y³/3 as y → 0
+    return np.where(y > 0, Q * (np.pi**4 / 5) / ys**3, 1.0)
+
+def _log1m_exp(y):
+    """ln(1 - e⁻ʸ) for y > 0, accurate at both small and large y."""
+    return np.where(y < np.log(2), np.log(-np.expm1(-y)), np.log1p(-np.exp(-y)))
+
+#=============================================================================
+# Models: dicts of vectorized molar Cv(T), U(T), S(T)
+#=============================================================================
+def debye_model(theta_D, zero_point=False):
+    """
+    Debye solid, per mole of atoms.
+
+        Cv = 3R [4 D3(y) - 3y/(eʸ - 1)]
+        U  = 3RT D3(y)  (+ 9RΘ_D/8 with zero_point)
+        S  = 3R [4/3 D3(y) - ln(1 - e⁻ʸ)],   y = Θ_D/T
+
+    Parameters:
+        theta_D: Debye temperature (K)
+        zero_point: include the zero-point energy in U
+
+    Returns:
+        dict with functions Cv, U, S of T (SI molar units) and theta_D
+    """
+    U0 = 9 * R * theta_D / 8 if zero_point else 0.0
+
+    def Cv(T):
+        y = theta_D / np.asarray(T, dtype=np.float64)
+        return 3 * R * (4 * debye_function(y) - 3 * y / np.expm1(y))
+
+    def U(T):
+        T = np.asarray(T, dtype=np.float64)
+        return 3 * R * T * debye_function(theta_D / T) + U0
+
+    def S(T):
+        y = theta_D / np.asarray(T, dtype=np.float64)
+        return 3 * R * (4 / 3 * debye_function(y) - _log1m_exp(y))
+
+    return {'Cv': Cv, 'U': U, 'S': S, 'theta_D': theta_D}
+
+def einstein_model(theta_E, zero_point=False):
+    """
+    Einstein solid (3 oscillators per atom at frequency kΘ_E/ħ), per mole.
+
+        Cv = 3R y² eʸ/(eʸ - 1)²,   U = 3RΘ_E/(eʸ - 1),
+        S  = 3R [y/(eʸ - 1) - ln(1 - e⁻ʸ)],   y = Θ_E/T
+
+    Parameters:
+        theta_E: Einstein temperature (K)
+        zero_point: include the zero-point energy 3RΘ_E/2 in U
+
+    Returns:
+        dict with functions Cv, U, S of T and theta_E
+    """
+    U0 = 1.5 * R * theta_E if zero_point else 0.0
+
+    def Cv(T):
+        y = theta_E / np.asarray(T, dtype=np.float64)
+        # y² eʸ/(eʸ-1)² = y² e⁻ʸ/(1-e⁻ʸ)², overflow-free
+        return 3 * R * y**2 * np.exp(-y) / np.expm1(-y)**2
+
+    def U(T):
+        y = theta_E / np.asarray(T, dtype=np.float64)
+        return 3 * R * theta_E / np.expm1(y) + U0
+
+    def S(T):
+        y = theta_E / np.asarray(T, dtype=np.float64)
+        return 3 * R * (y / np.expm1(y) - _log1m_exp(y))
+
+    return {'Cv': Cv, 'U': U, 'S': S, 'theta_E': theta_E}
+
+def electronic_model(gamma_e):
+    """Conduction electrons of a metal: Cv = S = γT, U = γT²/2 (per mole)."""
+    def Cv(T):
+        return gamma_e * np.asarray(T, dtype=np.float64)
+
+    def U(T):
+        return 0.5 * gamma_e * np.asarray(T, dtype=np.float64)**2
+
+    return {'Cv': Cv, 'U': U, 'S': Cv, 'gamma_e': gamma_e}
+
+def constant_model(Cv_molar):
+    """Temperature-independent Cv (Dulong-Petit is constant_model(3R))."""
+    def Cv(T):
+        return np.full(np.shape(T), Cv_molar, dtype=np.float64)
+
+    def U(T):
+        return Cv_molar * np.asarray(T, dtype=np.float64)
+
+    def S(T):
+        return Cv_molar * np.log(np.asarray(T, dtype=np.float64))
+
+    return {'Cv': Cv, 'U': U, 'S': S}
+
+def combine_models(*models):
+    """Sum of independent contributions, e.g. Debye lattice + electrons."""
+    def total(key):
+        return lambda T: sum(m[key](T) for m in models)
+    return {key: total(key) for key in ('Cv', 'U', 'S')}
+
+def metal_model(element):
+    """Debye lattice plus electronic term for a tabulated element."""
+    parts = [debye_model(theta_debye[element])]
+    if element in gamma_electronic:
+        parts.append(electronic_model(gamma_electronic[element]))
+    return combine_models(*parts)
+
+#=============================================================================
+# Batched Entropy and Heat over Temperature Intervals
+#=============================================================================
+@lru_cache(maxsize=8)
+def _gauss_legendre(order):
+    """Cached Gauss-Legendre nodes and weights on [-1, 1]."""
+    return np.polynomial.legendre.leggauss(order)
+
+def entropy_change(model, T1, T2, n=1.0, order=24):
+    """
+    ΔS = n ∫ Cv dT/T over a batch of intervals [T1, T2].
+
+    Models from this module carry closed-form S(T), so ΔS = S(T2) - S(T1)
+    is exact. A model that only supplies Cv (any vectorized callable
+    under 'Cv') is integrated with a fixed Gauss-Legendre rule in ln T,
+    all intervals at once.
+
+    Parameters:
+        model: dict with 'Cv' and optionally 'S', or a Cv(T) callable
+        T1, T2: interval end temperatures (K), broadcastable arrays
+        n: moles
+        order: quadrature order for Cv-only models
+
+    Returns:
+        delta_S: entropy change (J/K)
+    """
+    T1 = np.asarray(T1, dtype=np.float64)
+    T2 = np.asarray(T2, dtype=np.float64)
+    if isinstance(model, dict) and 'S' in model:
+        return n * (model['S'](T2) - model['S'](T1))
+    Cv = model['Cv'] if isinstance(model, dict) else model
+    nodes, weights = _gauss_legendre(order)
+    a, b = np.log(T1)[..., None], np.log(T2)[..., None]
+    ln_T = 0.5 * (a + b) + 0.5 * (b - a) * nodes
+    return n * 0.5 * (b - a)[..., 0] * (Cv(np.exp(ln_T)) @ weights)
+
+def heat_absorbed(model, T1, T2, n=1.0, order=24):
+    """
+    Q = n ∫ Cv dT at constant volume over a batch of intervals (J).
+
+    Exact through U(T) when the model provides it, otherwise a fixed
+    Gauss-Legendre rule in T.
+    """
+    T1 = np.asarray(T1, dtype=np.float64)
+    T2 = np.asarray(T2, dtype=np.float64)
+    if isinstance(model, dict) and 'U' in model:
+        return n * (model['U'](T2) - model['U'](T1))
+    Cv = model['Cv'] if isinstance(model, dict) else model
+    nodes, weights = _gauss_legendre(order)
+    a, b = T1[..., None], T2[..., None]
+    T = 0.5 * (a + b) + 0.5 * (b - a) * nodes
+    return n * 0.5 * (b - a)[..., 0] * (Cv(T) @ weights)
+
+def reservoir_heating(model, T1, T2, n=1.0):
+    """
+    Body heated from T1 by a reservoir at T2 (Problem 1046 with Cv(T)).
+
+    Parameters:
+        model: heat-capacity model
+        T1: initial body temperatures (K), array
+        T2: reservoir (and final) temperatures (K), broadcastable
+        n: moles
+
+    Returns:
+        dict with delta_S_body, delta_S_reservoir, delta_S_total and Q
+    """
+    T2 = np.asarray(T2, dtype=np.float64)
+    Q = heat_absorbed(model, T1, T2, n)
+    dS_body = entropy_change(model, T1, T2, n)
+    dS_res = -Q / T2
+    return {'delta_S_body': dS_body, 'delta_S_reservoir': dS_res,
+            'delta_S_total': dS_body + dS_res, 'Q': Q}
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    import time
+
+    print("=" * 60)
+    print("Debye and Einstein Solids: Cryogenic Heat Capacities")
+    print("=" * 60)
+    Cu = debye_model(theta_debye['Cu'])
+    Cu_E = einstein_model(np.sqrt(0.6) * theta_debye['Cu'])  # same mean-square frequency
+    n_penny = 32 / 64
+    print(f"Copper penny (Problem 1006): Dulong-Petit {problem_1006(32, 64):.2f} J/K")
+    for T in (4.2, 20.0, 77.0, 300.0):
+        print(f"  T = {T:5.1f} K: Debye {n_penny*Cu['Cv'](T):.3e} J/K, "
+              f"Einstein {n_penny*Cu_E['Cv'](T):.3e} J/K, "
+              f"Debye + electrons {n_penny*metal_model('Cu')['Cv'](T):.3e} J/K")
+
+    Ag = metal_model('Ag')
+    dS = entropy_change(Ag, 273.15, 303.15) / 4.184
+    print(f"Silver 0°C → 30°C (Problem 1044): Cv = 5.85 cal/mol·K gives "
+          f"{problem_1044(0, 30, 5.85):.3f} cal/K, Debye {dS:.3f} cal/K")
+    dS_lo = entropy_change(Ag, 4.2, 77.0)
+    dS_quad = entropy_change(Ag['Cv'], 4.2, 77.0)
+    print(f"Silver 4.2 K → 77 K: ΔS = {dS_lo:.4f} J/(mol·K) "
+          f"(Cv-only quadrature: {dS_quad:.4f}); Dulong-Petit: "
+          f"{3*R*np.log(77/4.2):.2f}")
+
+    r = problem_1046(1, 0, 100)
+    print(f"Problem 1046 (water, constant C): ΔS_universe = {r['delta_S_total']:.1f} J/K")
+    Al = metal_model('Al')
+    T_start = np.geomspace(1.0, 290.0, 1_000_000)
+    start = time.perf_counter()
+    ledger = reservoir_heating(Al, T_start, 300.0, n=1000 / 26.98)
+    elapsed = time.perf_counter() - start
+    print(f"1 kg Al dropped into a 300 K bath from 10⁶ start temperatures in "
+          f"{elapsed*1000:.0f} ms; ΔS_universe from {T_start[0]:.0f} K: "
+          f"{ledger['delta_S_total'][0]:.1f} J/K, min over batch "
+          f"{ledger['delta_S_total'].min():.2e} J/K (≥ 0)")
+    print()
@@ -0,0 +1,435 @@
+"""
+Steam Property Tables - Memory-Mapped Storage and Interpolation
+Real-fluid turbine work on top of Problem 1031 - Python Computational Solutions
+"""
+
+import numpy as np
+
+from chapter2_entropy import problem_1031
+
+# Physical Constants
+R_w = 461.5        # J/(kg·K) - specific gas constant of water vapour
+T_ref = 273.16     # K - triple point (h = s = 0 for saturated liquid)
+p_ref = 611.657    # Pa - triple point pressure
+cp_liquid = 4186.0  # J/(kg·K)
+cp_vapour = 1996.0  # J/(kg·K) - low-pressure vapour
+L_ref = 2.501e6    # J/kg - latent heat at the triple point
+v_liquid = 1.0e-3  # m³/kg
+
+# Binary layout: 8-byte magic, three int64 sizes, then float64 arrays
+_MAGIC = b"STEAMTB1"
+_HEADER_BYTES = 32
+_SUPERHEATED_KEYS = ('h', 's', 'v')
+_SATURATED_KEYS = ('T_sat', 'p_sat', 'hf', 'hg', 'sf', 'sg', 'vf', 'vg')
+
+#=============================================================================
+# Table File Format
+#=============================================================================
+def write_steam_table(path, T, p, h, s, v, saturated):
+    """
+    Write saturated and superheated tables to a compact binary file.
+
+    Parameters:
+        path: output file path
+        T: temperature grid (K), strictly increasing, shape (n_T,)
+        p: pressure grid (Pa), strictly increasing, shape (n_p,)
+        h, s, v: enthalpy (J/kg), entropy (J/(kg·K)) and specific
+            volume (m³/kg) on the grid, shape (n_T, n_p)
+        saturated: dict of 1-D arrays keyed by T_sat, p_sat, hf, hg,
+            sf, sg, vf, vg, ordered by increasing T_sat
+    """
+    T = np.ascontiguousarray(T, dtype=np.float64)
+    p = np.ascontiguousarray(p, dtype=np.float64)
+    n_T, n_p = T.size, p.size
+    n_sat = np.asarray(saturated['T_sat']).size
+    with open(path, 'wb') as f:
+        f.write(_MAGIC)
+        f.write(np.array([n_T, n_p, n_sat], dtype=np.int64).tobytes())
+        f.write(T.tobytes())
+        f.write(p.tobytes())
+        for Z in (h, s, v):
+            Z = np.ascontiguousarray(Z, dtype=np.float64)
+            if Z.shape != (n_T, n_p):
+                raise ValueError(f"table shape {Z.shape} != {(n_T, n_p)}")
+            f.write(Z.tobytes())
+        for key in _SATURATED_KEYS:
+            col = np.ascontiguousarray(saturated[key], dtype=np.float64)
+            if col.shape != (n_sat,):
+                raise ValueError(f"saturated column '{key}' has shape {col.shape}")
+            f.write(col.tobytes())
+
+def load_steam_table(path):
+    """
+    Memory-map a steam table file and build its (T, p) index.
+
+    Nothing is copied: every array in the returned table is a read-only
+    view into the mapped file, so opening a large table is instant and
+    pages are shared between processes reading the same file.
+
+    Parameters:
+        path: file written by write_steam_table
+
+    Returns:
+        table: dict with grids, property arrays and index metadata
+    """
+    with open(path, 'rb') as f:
+        header = f.read(_HEADER_BYTES)
+    if header[:8] != _MAGIC:
+        raise ValueError(f"{path} is not a steam table file")
+    n_T, n_p, n_sat = (int(n) for n in np.frombuffer(header[8:], dtype=np.int64))
+
+    data = np.memmap(path, dtype=np.float64, mode='r', offset=_HEADER_BYTES)
+    table = {'_mmap': data}
+    pos = 0
+
+    def take(n, shape):
+        nonlocal pos
+        view = data[pos:pos + n].reshape(shape)
+        pos += n
+        return view
+
+    table['T'] = take(n_T, (n_T,))
+    table['p'] = take(n_p, (n_p,))
+    for key in _SUPERHEATED_KEYS:
+        table[key] = take(n_T * n_p, (n_T, n_p))
+    for key in _SATURATED_KEYS:
+        table[key] = take(n_sat, (n_sat,))
+
+    # Pressure is interpolated in ln p, where ideal-gas entropy is linear
+    table['ln_p'] = np.log(table['p'])
+    table['ln_p_sat'] = np.log(table['p_sat'])
+    table['index'] = {
+        'T': _build_axis_index(table['T']),
+        'ln_p': _build_axis_index(table['ln_p']),
+    }
+    table['rows'] = _build_saturation_rows(table)
+    return table
+
+#=============================================================================
+# (T, p) Index and Vectorized Bilinear Interpolation
+#=============================================================================
+def _build_axis_index(grid):
+    """Record whether a grid axis is uniform so lookups can skip searching."""
+    step = np.diff(grid)
+    uniform = bool(np.allclose(step, step[0], rtol=1e-9, atol=0.0))
+    return {'x0': float(grid[0]), 'dx': float(step[0]), 'uniform': uniform,
+            'n': grid.size}
+
+def _build_saturation_rows(table):
+    """
+    Where each T row of the grid crosses the saturation line: ln p_sat,
+    the last vapour and first liquid column, and the saturated liquid and
+    vapour properties at that row's temperature.
+    """
+    ln_p_sat = np.interp(table['T'], table['T_sat'], table['ln_p_sat'])
+    rows = {
+        'ln_p_sat': ln_p_sat,
+        'last_vapour': np.searchsorted(table['ln_p'], ln_p_sat, side='left') - 1,
+        'first_liquid': np.searchsorted(table['ln_p'], ln_p_sat, side='right'),
+    }
+    for key in _SUPERHEATED_KEYS:
+        for phase in 'fg':
+            rows[key + phase] = np.interp(table['T'], table['T_sat'],
+                                          table[key + phase])
+    return rows
+
+def _locate(grid, index, x):
+    """
+    Find cell index i and fractional position w of x within a grid axis.
+
+    Uniform axes use direct arithmetic; others fall back to a binary
+    search. Callers reject points outside the grid first (_check_range);
+    the clipping here only absorbs rounding at the edges.
+    """
+    n = index['n']
+    if index['uniform']:
+        u = (x - index['x0']) / index['dx']
+        i = np.clip(np.floor(u).astype(np.intp), 0, n - 2)
+        w = u - i
+    else:
+        i = np.clip(np.searchsorted(grid, x, side='right') - 1, 0, n - 2)
+        w = (x - grid[i]) / (grid[i + 1] - grid[i])
+    return i, np.clip(w, 0.0, 1.0)
+
+def _check_range(name, x, lo, hi, unit):
+    """Raise for state points outside the table instead of clamping them."""
+    outside = (x < lo) | (x > hi)
+    if np.any(outside):
+        bad = np.asarray(x)[outside].flat[0]
+        raise ValueError(f"{name} = {bad:g} {unit} is outside the table range "
+                         f"[{lo:g}, {hi:g}] {unit}")
+
+def _phase_row(table, key, k, x, j, liquid):
+    """
+    Value of one property along grid row k at ln p = x (in column cell j),
+    using only nodes of the point's own phase and the saturated state at
+    T_k as the end of that phase's side of the row.
+
+    Liquid nodes lie above ln p_sat(T_k), vapour nodes below it. Where a
+    cell straddles the saturation line the last same-phase segment is
+    extended instead, so liquid and vapour values are never blended.
+    """
+    ln_p, Z, rows = table['ln_p'], table[key], table['rows']
+    n = ln_p.size
+    x_sat = rows['ln_p_sat'][k]
+    Z_sat = np.where(liquid, rows[key + 'f'][k], rows[key + 'g'][k])
+    first, last = rows['first_liquid'][k], rows['last_vapour'][k]
+    inside = np.where(liquid, j >= first, j + 1 <= last)
+    # same-phase node nearest the saturation line
+    m = np.where(liquid, np.maximum(j + 1, first), np.minimum(j, last))
+    has_node = (m >= 0) & (m <= n - 1)
+    m = np.clip(m, 0, n - 1)
+
+    xa, xb = ln_p[j], ln_p[j + 1]
+    plain = Z[k, j] + (x - xa) / (xb - xa) * (Z[k, j + 1] - Z[k, j])
+    xm = ln_p[m]
+    on_line = xm == x_sat
+    dx = np.where(on_line, 1.0, xm - x_sat)
+    edge = np.where(has_node & ~on_line,
+                    Z_sat + (x - x_sat) / dx * (Z[k, m] - Z_sat), Z_sat)
+    return np.where(inside, plain, edge)
+
+def steam_properties(table, T, p, keys=('h', 's')):
+    """
+    Interpolate single-phase properties at a batch of state points.
+
+    Each point is liquid above p_sat(T) and vapour below it. Cells that
+    straddle the saturation line are interpolated from the nodes of the
+    point's own phase and the saturated liquid or vapour state, never
+    from a blend of both phases.
+
+    Parameters:
+        table: table from load_steam_table
+        T: temperature (K), scalar or array
+        p: pressure (Pa), broadcastable with T
+        keys: properties to return, any of 'h', 's', 'v'
+
+    Returns:
+        dict mapping each key to an array of interpolated values
+
+    Raises:
+        ValueError: for state points outside the table's T or p range
+    """
+    T, p = np.broadcast_arrays(np.asarray(T, dtype=np.float64),
+                               np.asarray(p, dtype=np.float64))
+    _check_range('T', T, table['T'][0], table['T'][-1], 'K')
+    _check_range('p', p, table['p'][0], table['p'][-1], 'Pa')
+    x = np.log(p)
+    i, wT = _locate(table['T'], table['index']['T'], T)
+    j, _ = _locate(table['ln_p'], table['index']['ln_p'], x)
+    liquid = x > np.interp(T, table['T_sat'], table['ln_p_sat'])
+
+    out = {}
+    for key in keys:
+        lower = _phase_row(table, key, i, x, j, liquid)
+        upper = _phase_row(table, key, i + 1, x, j, liquid)
+        out[key] = (1 - wT) * lower + wT * upper
+    return out
+
+def saturation_properties(table, p, keys=('T_sat', 'hf', 'hg', 'sf', 'sg')):
+    """
+    Interpolate the saturated table at a batch of pressures.
+
+    Parameters:
+        table: table from load_steam_table
+        p: saturation pressure (Pa), scalar or array
+        keys: saturated columns to return
+
+    Returns:
+        dict mapping each key to an array of values at p
+    """
+    p = np.asarray(p, dtype=np.float64)
+    _check_range('p', p, table['p_sat'][0], table['p_sat'][-1], 'Pa')
+    ln_p = np.log(p)
+    return {key: np.interp(ln_p, table['ln_p_sat'], table[key]) for key in keys}
+
+def _isentropic_state(table, p, s_target):
+    """
+    Invert s(T, p) = s_target along T at fixed p, consistent with the
+    bilinear interpolant.
+
+    Along a fixed-p line the interpolant is piecewise linear in T, so a
+    batched bisection over grid rows followed by an exact linear solve in
+    the bracketing cell replaces any per-point iteration. The state is
+    superheated, so rows are read on the vapour side of the saturation
+    line and the search starts at the row holding T_sat(p).
+
+    Returns:
+        T: temperature (K)
+        h: enthalpy (J/kg)
+    """
+    T_grid = table['T']
+    _check_range('p', p, table['p'][0], table['p'][-1], 'Pa')
+    x = np.log(p)
+    j, _ = _locate(table['ln_p'], table['index']['ln_p'], x)
+
+    def row(key, k):
+        return _phase_row(table, key, k, x, j, False)
+
+    T_sat = np.interp(x, table['ln_p_sat'], table['T_sat'])
+    lo, _ = _locate(T_grid, table['index']['T'], T_sat)
+    hi = np.full(p.shape, T_grid.size - 1, dtype=np.intp)
+    for _ in range(int(np.ceil(np.log2(T_grid.size)))):
+        mid = (lo + hi) // 2
+        below = row('s', mid) <= s_target
+        split = hi - lo > 1
+        lo = np.where(split & below, mid, lo)
+        hi = np.where(split & ~below, mid, hi)
+
+    s_lo, s_hi = row('s', lo), row('s', hi)
+    frac = np.clip((s_target - s_lo) / (s_hi - s_lo), 0.0, 1.0)
+    T = T_grid[lo] + frac * (T_grid[hi] - T_grid[lo])
+    h = row('h', lo) + frac * (row('h', hi) - row('h', lo))
+    return T, h
+
+#=============================================================================
+# Problem 1031 Extension: Turbine with Isentropic Efficiency
+#=============================================================================
+def turbine_work(table, T_in_C, p_in, p_out, eta_s=0.85):
+    """
+    Calculate real turbine work from steam tables, compared with the
+    Carnot bound of Problem 1031.
+
+    Parameters:
+        table: table from load_steam_table
+        T_in_C: intake temperature (Celsius)
+        p_in: intake pressure (Pa)
+        p_out: exhaust pressure (Pa)
+        eta_s: isentropic efficiency of the turbine
+
+    Returns:
+        dict with per-kg enthalpies (J/kg), exhaust quality x_s (NaN
+        when the isentropic exhaust is superheated), turbine work W,
+        heat input Q_in, and the Carnot W_max / efficiency between the
+        intake and exhaust saturation temperatures
+    """
+    T_in = np.asarray(T_in_C, dtype=np.float64) + 273.15
+    T_in, p_in, p_out, eta_s = np.broadcast_arrays(
+        T_in, np.asarray(p_in, dtype=np.float64),
+        np.asarray(p_out, dtype=np.float64), np.asarray(eta_s, dtype=np.float64))
+
+    inlet = steam_properties(table, T_in, p_in)
+    sat = saturation_properties(table, p_out)
+    h_in, s_in = inlet['h'], inlet['s']
+
+    # Isentropic exhaust: wet mixture below s_g, superheated above it
+    wet = s_in <= sat['sg']
+    x_s = (s_in - sat['sf']) / (sat['sg'] - sat['sf'])
+    h_wet = sat['hf'] + x_s * (sat['hg'] - sat['hf'])
+    h_out_s = np.where(wet, h_wet, np.nan)
+    dry = ~wet
+    if np.any(dry):
+        h_out_s[dry] = _isentropic_state(table, p_out[dry], s_in[dry])[1]
+
+    W = eta_s * (h_in - h_out_s)
+    h_out = h_in - W
+
+    # Heat input of the matching Rankine cycle: condensate to intake state
+    Q_in = h_in - sat['hf']
+    T_exhaust_C = sat['T_sat'] - 273.15
+    W_max, efficiency = problem_1031(T_in - 273.15, T_exhaust_C, Q_in)
+
+    return {
+        'h_in': h_in, 's_in': s_in,
+        'h_out_s': h_out_s, 'h_out': h_out,
+        'x_s': np.where(wet, x_s, np.nan),
+        'W': W, 'Q_in': Q_in,
+        'efficiency': W / Q_in,
+        'W_max': W_max, 'efficiency_carnot': efficiency,
+        'T_exhaust_C': T_exhaust_C
+    }
+
+#=============================================================================
+# Reference Table Generator
+#=============================================================================
+def ideal_steam_table(path, T_range=(275.0, 900.0), p_range=(1e3, 2e7),
+                      n_T=256, n_p=256):
+    """
+    Generate and write a table from an ideal-vapour / incompressible-liquid
+    model of water.
+
+    The vapour is an ideal gas with constant cp, the liquid is
+    incompressible, and the latent heat follows Kirchhoff's law
+    L(T) = L_ref + (cp_vapour - cp_liquid)(T - T_ref). The saturation
+    curve is the matching integrated Clausius-Clapeyron solution, so the
+    table is thermodynamically self-consistent. It is accurate to a few
+    percent well below the critical point; for design work write measured
+    (e.g. IAPWS-IF97) data with write_steam_table instead.
+
+    Parameters:
+        path: output file path
+        T_range: (T_min, T_max) in K
+        p_range: (p_min, p_max) in Pa, gridded logarithmically
+        n_T, n_p: grid sizes
+
+    Returns:
+        table: the freshly written table, memory-mapped
+    """
+    T = np.linspace(*T_range, n_T)
+    p = np.geomspace(*p_range, n_p)
+    dcp = cp_vapour - cp_liquid
+
+    def latent(T):
+        return L_ref + dcp * (T - T_ref)
+
+    def p_saturation(T):
+        ln_ratio = ((L_ref - dcp * T_ref) / R_w * (1/T_ref - 1/T)
+                    + dcp / R_w * np.log(T / T_ref))
+        return p_ref * np.exp(ln_ratio)
+
+    hf = cp_liquid * (T - T_ref)
+    sf = cp_liquid * np.log(T / T_ref)
+    hg = hf + latent(T)
+    sg = sf + latent(T) / T
+    p_sat = p_saturation(T)
+
+    # Vapour entropy referenced to the saturated state at the same T
+    Tg, pg = T[:, None], p[None, :]
+    h_vap = np.broadcast_to(hg[:, None], (n_T, n_p))
+    s_vap = sg[:, None] - R_w * np.log(pg / p_sat[:, None])
+    v_vap = R_w * Tg / pg
+
+    liquid = pg > p_sat[:, None]
+    h = np.where(liquid, hf[:, None], h_vap)
+    s = np.where(liquid, sf[:, None], s_vap)
+    v = np.where(liquid, v_liquid, v_vap)
+
+    saturated = {
+        'T_sat': T, 'p_sat': p_sat,
+        'hf': hf, 'hg': hg, 'sf': sf, 'sg': sg,
+        'vf': np.full(n_T, v_liquid), 'vg': R_w * T / p_sat
+    }
+    write_steam_table(path, T, p, h, s, v, saturated)
+    return load_steam_table(path)
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    print("=" * 60)
+    print("Problem 1031 (extended): Steam Turbine from Property Tables")
+    print("=" * 60)
+    path = os.path.join(tempfile.gettempdir(), 'ideal_steam.tbl')
+    table = ideal_steam_table(path)
+    print(f"Table file: {path} ({os.path.getsize(path)/1e6:.1f} MB, memory-mapped)")
+
+    r = turbine_work(table, 400, 4e6, 476e3, eta_s=0.85)
+    print(f"Intake: 400°C, 4 MPa → exhaust {r['T_exhaust_C']:.0f}°C saturation")
+    print(f"Isentropic exhaust quality: x = {r['x_s']:.3f}")
+    print(f"Turbine work (η_s = 0.85): W = {r['W']/1000:.1f} kJ/kg")
+    print(f"Cycle efficiency: {r['efficiency']*100:.1f}% "
+          f"(Carnot bound {r['efficiency_carnot']*100:.1f}%)")
+
+    n = 1_000_000
+    rng = np.random.default_rng(0)
+    T_batch = rng.uniform(300, 500, n)
+    p_batch = rng.uniform(2e6, 8e6, n)
+    start = time.perf_counter()
+    batch = turbine_work(table, T_batch, p_batch, 476e3)
+    elapsed = time.perf_counter() - start
+    print(f"{n:,} operating points evaluated in {elapsed:.2f} s")
+    print()
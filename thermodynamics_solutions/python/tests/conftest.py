@@ -0,0 +1,16 @@
+"""Shared fixtures: the solution scripts live one directory up."""
+
+import importlib
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CHAPTERS = ('chapter1_first_law', 'chapter2_entropy', 'chapter3_functions')
+
+@pytest.fixture(scope='session')
+def chapters():
+    """Chapter modules by name."""
+    return {name: importlib.import_module(name) for name in CHAPTERS}
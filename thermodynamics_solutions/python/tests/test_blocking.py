@@ -0,0 +1,106 @@
+"""Blocked evaluation, out= buffers and fused workspaces give the unblocked results."""
+
+import numpy as np
+import pytest
+
+from blocking import BLOCK, blockwise, workspace
+
+rng = np.random.default_rng(48)
+N = 3 * BLOCK + 123
+
+#=============================================================================
+# Fused Kernels
+#=============================================================================
+def test_heat_pump_fused_matches_formula(chapters):
+    f = chapters['chapter2_entropy'].problem_1039
+    T0, W, alpha = rng.uniform(230, 300, N), rng.uniform(100, 5000, N), rng.uniform(10, 200, N)
+    for args in [(T0, 1000.0, 50.0), (T0, W, alpha), (T0[:, None], W[:50], 50.0)]:
+        a, b, c = args
+        direct = a + (b/(2*c)) * (1 + np.sqrt(1 + 4*c*a/b))
+        assert np.array_equal(f(*args), direct)
+    out, work = np.empty(N), np.empty(BLOCK)
+    assert f(T0, W, alpha, out=out, work=work) is out
+    assert np.array_equal(out, T0 + (W/(2*alpha)) * (1 + np.sqrt(1 + 4*alpha*T0/W)))
+    with pytest.raises(ValueError):
+        f(T0, 1000.0, 50.0, work=np.empty(10))
+
+def test_heat_pump_workspace_spans_long_rows(chapters):
+    f = chapters['chapter2_entropy'].problem_1039
+    T0, W = np.full((3, 2 * BLOCK + 7), 273.0), np.full((3, 2 * BLOCK + 7), 50.0)
+    work = workspace(T0.shape)
+    assert work.size == T0.shape[1]
+    assert np.array_equal(f(T0, 1000.0, W, work=work), f(T0, 1000.0, W))
+    with pytest.raises(ValueError):
+        f(T0, 1000.0, W, work=np.empty(BLOCK))
+
+def test_heat_pump_scalar_and_float32(chapters):
+    f = chapters['chapter2_entropy'].problem_1039
+    assert f(273, 1000, 50) == 273 + 10.0 * (1 + np.sqrt(1 + 4*50*273/1000))
+    T0 = rng.uniform(230, 300, N).astype(np.float32)
+    out = np.empty(N, np.float32)
+    assert f(T0, 1000.0, 50.0, out=out, precision='float32') is out
+
+def test_adiabatic_grid_into_buffers(chapters):
+    f = chapters['chapter3_functions'].adiabatic_atmosphere
+    z = np.linspace(0.0, 15e3, 300)
+    T0 = np.linspace(250.0, 320.0, 400)[:, None]
+    p, T = np.empty((400, 300)), np.empty((400, 300))
+    rp, rT, dTdz = f(z, 101325.0, T0, 0.029, 1.4, out=(p, T))
+    assert rp is p and rT is T
+    T_ref = T0 + dTdz * z
+    assert np.array_equal(T, T_ref)
+    assert np.array_equal(p, 101325.0 * (T_ref / T0) ** (1.4 / (1.4 - 1)))
+
+#=============================================================================
+# Generic Blocked Evaluation
+#=============================================================================
+def test_blocked_results_are_unchanged(chapters):
+    ch2, ch3 = chapters['chapter2_entropy'], chapters['chapter3_functions']
+    T1, T2 = rng.uniform(300, 500, N), rng.uniform(100, 290, N)
+    dS, Tf = ch2.problem_1060(T1, T2, 1.0, 12.47)
+    out = (np.empty(N), np.empty(N))
+    assert ch2.problem_1060(T1, T2, 1.0, 12.47, out=out)[0] is out[0]
+    assert np.array_equal(out[0], dS) and np.array_equal(out[1], Tf)
+    whole = ch2.problem_1060.__wrapped__.__wrapped__(T1, T2, 1.0, 12.47)
+    assert np.array_equal(dS, whole[0]) and np.array_equal(Tf, whole[1])
+
+    z = rng.uniform(0, 3e4, N)
+    assert np.array_equal(ch3.isothermal_atmosphere(z, 101325.0, 288.0, 0.029),
+                          101325.0 * np.exp(-z / (ch3.R * 288.0 / (0.029 * ch3.g))))
+
+def test_dict_results_keep_scalar_leaves(chapters):
+    f = chapters['chapter2_entropy'].problem_1046
+    T1 = rng.uniform(0, 50, N)
+    r = f(1.0, T1, 80.0)
+    whole = f.__wrapped__.__wrapped__(1.0, T1, 80.0)
+    assert r.keys() == whole.keys()
+    for k in r:
+        assert np.array_equal(r[k], whole[k])
+
+def test_mixed_rank_broadcasts_match_the_unblocked_function(chapters):
+    f = chapters['chapter1_first_law'].problem_1017
+    mass = rng.uniform(100, 2000, 128)
+    for rows in (1024, 1000):                  # 1000: the last block is partial
+        T1 = rng.uniform(-50, 50, (rows, 1))
+        r = f(mass, T1, 100)
+        whole = f.__wrapped__.__wrapped__(mass, T1, 100)
+        assert r.keys() == whole.keys()
+        for k in r:
+            assert np.shape(r[k]) == np.shape(whole[k]), k
+            assert np.array_equal(r[k], whole[k]), k
+
+def test_blockwise_signature_and_small_inputs():
+    calls = []
+
+    @blockwise
+    def double(x, k=2):
+        calls.append(np.shape(x))
+        return k * x
+
+    assert 'out' in str(double.__signature__)
+    assert double(3.0) == 6.0
+    x = np.arange(2.5 * BLOCK)
+    assert np.array_equal(double(x), 2 * x)
+    assert calls[1:] == [(BLOCK,), (BLOCK,), (BLOCK // 2,)]
+    out = np.empty(10)
+    assert double(np.ones(10), out=out) is out and np.all(out == 2)
@@ -0,0 +1,66 @@
+"""Distributed sweeps survive killed workers, retry failing chunks and merge exactly."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from distributed_sweep import coordinate, start_local_workers
+from result_store import open_store, param_grid, read_manifest
+
+HEAT_PUMP = 'chapter2_entropy.problem_1039'
+ATMOSPHERE = 'chapter3_functions.adiabatic_atmosphere'
+
+def _finish(procs):
+    for p in procs:
+        assert p.wait(timeout=60) == 0
+
+def test_killed_worker_lease_expires_and_result_is_exact(tmp_path):
+    from chapter2_entropy import problem_1039
+    grid = param_grid(T0=np.linspace(230.0, 300.0, 15), W=np.linspace(100.0, 5000.0, 12),
+                      alpha=np.linspace(10.0, 200.0, 10))
+    # the first worker exits abruptly holding its first chunk; the rest of
+    # the cluster only joins once it is dead, so the chunk must be requeued
+    crashed = start_local_workers(tmp_path, 1, crash_after={0: 0})[0]
+    healthy = []
+
+    def join_after_crash():
+        crashed.wait(timeout=60)
+        healthy.extend(start_local_workers(tmp_path, 2))
+    thread = threading.Thread(target=join_after_crash)
+    thread.start()
+    report = coordinate(tmp_path, HEAT_PUMP, grid, outputs=['Te'], chunk_size=100,
+                        n_shards=2, lease=1.0, timeout=60)
+    thread.join()
+    _finish(healthy)
+    assert crashed.returncode == 1
+    assert report['complete'] and not report['failed']
+    assert sum(w['chunks'] for w in report['by_worker'].values()) == report['n_chunks']
+    store = open_store(tmp_path)
+    assert np.array_equal(store['Te'], problem_1039(grid['T0'], grid['W'], grid['alpha']))
+
+def test_failing_chunks_are_retried_reported_and_rerun(tmp_path):
+    grid = param_grid(z=np.linspace(0.0, 15e3, 11), T0=np.linspace(250.0, 320.0, 8))
+    fixed = {'p0': 101325.0, 'mu': 0.029, 'gamma': 1.4}
+    procs = start_local_workers(tmp_path, 2)
+    report = coordinate(tmp_path, ATMOSPHERE, grid, fixed={**fixed, 'species': 'no-such-gas'},
+                        outputs=['p', 'T', 'dTdz'], chunk_size=25, n_shards=2,
+                        max_attempts=2, timeout=60)
+    _finish(procs)
+    assert not report['complete']
+    assert sorted(report['failed']) == list(range(report['n_chunks']))
+    assert all("unknown species 'no-such-gas'" in tb for tb in report['failed'].values())
+
+    # the store remembers what it was computing: a different fixed set is refused
+    with pytest.raises(ValueError, match='overwrite=True'):
+        coordinate(tmp_path, ATMOSPHERE, grid, fixed=fixed, outputs=['p', 'T', 'dTdz'],
+                   chunk_size=25, n_shards=2, timeout=0)
+
+    procs = start_local_workers(tmp_path, 2)
+    report = coordinate(tmp_path, ATMOSPHERE, grid, fixed=fixed, outputs=['p', 'T', 'dTdz'],
+                        chunk_size=25, n_shards=2, timeout=60, overwrite=True)
+    _finish(procs)
+    assert report['complete'] and not report['failed']
+    assert read_manifest(tmp_path)['job']['fixed'] == fixed
+    store = open_store(tmp_path)
+    assert np.all(np.diff(store['T'].reshape(11, 8), axis=0) < 0)
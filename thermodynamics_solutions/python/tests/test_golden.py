@@ -0,0 +1,55 @@
+"""Golden values, scalar/batched/blocked agreement and invariants of every chapter function."""
+
+import inspect
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import golden
+
+@pytest.fixture(scope='session')
+def report():
+    """One parallel run of every case; the pass cache is for the CLI only."""
+    return golden.run_golden(cache_path=None)
+
+@pytest.mark.parametrize('case_id', sorted(golden.CASES))
+def test_case(report, case_id):
+    result = report['results'][case_id]
+    assert result['ok'], '\n'.join(result['failures'])
+
+def test_every_function_has_a_case(chapters):
+    covered = {(c['module'], c['function']) for c in golden.CASES.values()}
+    for name, module in chapters.items():
+        for function, obj in vars(module).items():
+            if (inspect.isfunction(obj) and obj.__module__ == name and not function.startswith('_')
+                    and function != 'main' and not function.startswith('plot_')):
+                assert (name, function) in covered, f"{name}.{function} has no golden case"
+
+def test_goldens_cover_the_cases():
+    goldens = json.loads(golden.GOLDEN.read_text(encoding='utf-8'))
+    assert set(goldens) == set(golden.CASES)
+    assert set(golden.INVARIANTS) <= set(golden.CASES)
+
+def test_editing_a_cached_helper_changes_the_key(tmp_path):
+    """nasa_thermo._entropy_table sits behind lru_cache, two calls below problem_1015."""
+    here = Path(golden.__file__).resolve().parent
+    for module in here.glob('*.py'):
+        shutil.copy(module, tmp_path)
+    probe = ("import golden, chapter1_first_law as c; "
+             "print(golden.source_hash(c.problem_1015))")
+
+    def case_hash():
+        return subprocess.run([sys.executable, '-c', probe], cwd=tmp_path, check=True,
+                              capture_output=True, text=True).stdout.strip()
+
+    before = case_hash()
+    helper = tmp_path / 'nasa_thermo.py'
+    source = helper.read_text(encoding='utf-8')
+    assert 's = nasa_entropy(T, name) / R' in source
+    helper.write_text(source.replace('s = nasa_entropy(T, name) / R', 's = 1.01 * nasa_entropy(T, name) / R'),
+                      encoding='utf-8')
+    assert case_hash() != before
@@ -0,0 +1,179 @@
+"""Error bounds of the chapter functions under the float32 and mixed policies."""
+
+import inspect
+
+import numpy as np
+import pytest
+
+from precision import get_precision, set_precision, use_precision
+
+N = 2000
+rng = np.random.default_rng(47)
+
+def U(lo, hi):
+    return rng.uniform(lo, hi, N)
+
+# (module, function, arguments, bound on the relative error). Errors are
+# measured against float64 evaluation of the same float32-rounded inputs,
+# so the bounds cover the formulas, not the rounding of the arguments.
+CASES = [
+    ('chapter1_first_law', 'problem_1003',
+     dict(x=U(1e-3, 5e-3), alpha1=U(1.1e-5, 1.3e-5), alpha2=U(1.8e-5, 2.5e-5),
+          delta_T=U(10, 100)), 4e-7),
+    ('chapter1_first_law', 'problem_1006', dict(mass_g=U(1, 100), atomic_mass=U(20, 200)), 2e-7),
+    ('chapter1_first_law', 'problem_1008', dict(h_i=U(5, 15), h_f=U(1, 4)), 3e-7),
+    ('chapter1_first_law', 'problem_1012', dict(T0=U(200, 400), V0_factor=U(1.5, 3)), 3e-7),
+    ('chapter1_first_law', 'problem_1015',
+     dict(T_initial=U(250, 350), p_ratio=U(1, 20), gamma=U(1.1, 1.67)), 4e-7),
+    ('chapter1_first_law', 'problem_1016',
+     dict(T_i_celsius=U(-50, 50), V_ratio=U(2, 20), gamma=U(1.1, 1.67)), 4e-7),
+    ('chapter1_first_law', 'problem_1017', dict(mass_g=U(100, 2000), T1_C=U(-50, 0), T2_C=U(50, 150)), 3e-7),
+    ('chapter1_first_law', 'problem_1018', {}, 1e-7),
+    ('chapter1_first_law', 'problem_1019',
+     dict(V0=U(1e-3, 2e-2), A=U(1e-4, 1e-3), M=U(0.01, 0.2), p0=U(9e4, 1.1e5),
+          gamma=U(1.1, 1.67)), 4e-7),
+    ('chapter1_first_law', 'problem_1020', dict(T=U(200, 400), M=U(0.002, 0.044), gamma=U(1.1, 1.67)), 3e-7),
+    ('chapter1_first_law', 'problem_1022', {}, 1e-7),
+    ('chapter1_first_law', 'problem_1024',
+     dict(T1=U(4, 77), T2=U(200, 400), R_reflectivity=U(0, 0.99)), 5e-7),
+    ('chapter1_first_law', 'problem_1027',
+     dict(J_earth=U(1e3, 1.5e3), r_sun=U(6e8, 8e8), r_SE=U(1e11, 2e11)), 3e-7),
+    ('chapter1_first_law', 'problem_1030', {}, 1e-7),
+    ('chapter2_entropy', 'problem_1031', dict(T_intake_C=U(100, 600), T_exhaust_C=U(20, 90), Q=U(1, 1e4)), 3e-7),
+    ('chapter2_entropy', 'carnot_efficiency', dict(T_hot=U(400, 1000), T_cold=U(250, 350)), 2e-7),
+    ('chapter2_entropy', 'problem_1035', dict(T1=U(300, 500), T2=U(200, 300), N=U(1, 10), C=U(5, 30)), 4e-7),
+    ('chapter2_entropy', 'problem_1039', dict(T0=U(230, 300), W=U(100, 5000), alpha=U(10, 200)), 3e-7),
+    ('chapter2_entropy', 'problem_1040', dict(T1_C=U(-20, 10), T2_C=U(15, 25)), 2e-7),
+    ('chapter2_entropy', 'problem_1044', dict(T1_C=U(-20, 20), T2_C=U(25, 100), Cv_cal=U(5, 7)), 3e-7),
+    # float32 ΔS_total keeps the cancellation of ln(T2/T1) - ΔT/T2 (mixed widens it)
+    ('chapter2_entropy', 'problem_1046', dict(m_kg=U(0.1, 10), T1_C=U(0, 50), T2_C=U(60, 100)), 1e-5),
+    ('chapter2_entropy', 'problem_1047', {}, 1e-7),
+    ('chapter2_entropy', 'problem_1048', dict(m_kg=U(0.1, 10), T1_C=U(10, 40), T2_C=U(-20, -1)), 3e-7),
+    ('chapter2_entropy', 'problem_1050', {}, 1e-7),
+    ('chapter2_entropy', 'problem_1059', dict(R_ohm=U(10, 1e4), V=U(1, 500), t=U(1, 100), T_C=U(0, 100)), 3e-7),
+    ('chapter2_entropy', 'problem_1060', dict(T1=U(300, 500), T2=U(100, 290), n=U(0.5, 5), Cv=U(10, 30)), 4e-7),
+    ('chapter3_functions', 'isothermal_atmosphere',
+     dict(z=U(0, 3e4), p0=U(9e4, 1.1e5), T0=U(200, 320), mu=U(0.002, 0.044)), 2e-6),
+    ('chapter3_functions', 'adiabatic_atmosphere',
+     dict(z=U(0, 5e3), p0=U(9e4, 1.1e5), T0=U(250, 320), mu=U(0.002, 0.03), gamma=U(1.1, 1.67)), 2e-6),
+    ('chapter3_functions', 'scale_height', dict(T=U(150, 400), mu=U(0.002, 0.044)), 2e-7),
+    ('chapter3_functions', 'clausius_clapeyron', dict(L=U(1e4, 5e4), T=U(250, 400), delta_V=U(1e-3, 5e-2)), 2e-7),
+    ('chapter3_functions', 'joule_thomson_vdw',
+     dict(a=U(0.1, 0.2), b=U(3e-5, 4e-5), Cp=U(20, 40), T=U(150, 450), V=None), 3e-7),
+    ('chapter3_functions', 'chemical_potential_ideal_gas', dict(mu0=U(-2e5, -1e5), T=U(250, 400), p=U(1e3, 1e7)), 3e-7),
+    ('chapter3_functions', 'adiabatic_demagnetization', dict(Ti=U(0.1, 2), Hi=U(1, 10), Hf=U(0.001, 0.5)), 2e-7),
+]
+IDS = [name for _, name, _, _ in CASES]
+
+def leaves(result):
+    """Numeric leaves of a result (array, tuple or nested dict), in order."""
+    if isinstance(result, dict):
+        return [x for v in result.values() for x in leaves(v)]
+    if isinstance(result, tuple):
+        return [x for v in result for x in leaves(v)]
+    return [result]
+
+def rounded(kwargs):
+    return {k: None if v is None else v.astype(np.float32).astype(np.float64) for k, v in kwargs.items()}
+
+#=============================================================================
+# Error Bounds and dtypes
+#=============================================================================
+@pytest.mark.parametrize('policy', ['float32', 'mixed'])
+@pytest.mark.parametrize('module, name, kwargs, rtol', CASES, ids=IDS)
+def test_error_bound(chapters, module, name, kwargs, rtol, policy):
+    func = getattr(chapters[module], name)
+    reference = leaves(func(**rounded(kwargs), precision='float64'))
+    result = leaves(func(**kwargs, precision=policy))
+    assert len(result) == len(reference)
+    for got, want in zip(result, reference):
+        if isinstance(got, (int, np.integer)) and got == want:
+            continue
+        assert np.asarray(got).dtype == np.float32
+        want = np.asarray(want, dtype=np.float64)
+        err = np.abs(np.asarray(got, dtype=np.float64) - want)
+        assert np.all(err <= rtol * np.abs(want) + 1e-37), \
+            f"{name}: max relative error {np.max(err / np.abs(want)):.2e} > {rtol:.0e}"
+
+@pytest.mark.parametrize('module, name, kwargs, rtol', [c for c in CASES if c[2]],
+                         ids=[c[1] for c in CASES if c[2]])
+def test_no_silent_upcast(chapters, module, name, kwargs, rtol):
+    """With float32 arguments the formulas themselves stay in float32."""
+    func = getattr(chapters[module], name)
+    bound = inspect.signature(func.__wrapped__).bind(**kwargs)
+    bound.apply_defaults()
+    args = {k: np.float32(v) if isinstance(v, (int, float)) and not isinstance(v, bool) else
+            v.astype(np.float32) if isinstance(v, np.ndarray) else v
+            for k, v in bound.arguments.items()}
+    with use_precision('float32'):
+        result = func.__wrapped__(**args)
+    for leaf in leaves(result):
+        if isinstance(leaf, np.ndarray):
+            assert leaf.dtype == np.float32, name
+
+#=============================================================================
+# Cancellation
+#=============================================================================
+def test_shield_flux_near_equal_temperatures(chapters):
+    T1 = np.float32(77.0) + np.arange(1, 1000, dtype=np.float32) * np.float32(2.0**-16)
+    T2 = np.full_like(T1, 77.25)
+    exact = 5.67e-8 * (T2.astype(np.float64)**4 - T1.astype(np.float64)**4)
+    for policy in ('float32', 'mixed'):
+        J = chapters['chapter1_first_law'].problem_1024(T1, T2, 0.9, precision=policy)['J']
+        assert np.max(np.abs(J / exact - 1)) < 5e-7
+
+def test_entropy_of_universe_small_heating(chapters):
+    T1_C = np.full(1000, 20.0, dtype=np.float32)
+    T2_C = T1_C + np.geomspace(1e-3, 1.0, 1000).astype(np.float32)
+    T1 = T1_C.astype(np.float64) + 273.15
+    T2 = T2_C.astype(np.float64) + 273.15
+    u = (T2_C.astype(np.float64) - T1_C) / T1
+    exact = 4180 * (np.log1p(u) - (T2 - T1) / T2)
+    f = chapters['chapter2_entropy'].problem_1046
+    mixed = f(1, T1_C, T2_C, precision='mixed')['delta_S_total']
+    single = f(1, T1_C, T2_C, precision='float32')['delta_S_total']
+    assert np.all(mixed > 0) and np.all(single >= 0)
+    assert np.max(np.abs(mixed / exact - 1)) < 1e-6
+    # float32 cancels here; its error stays at the rounding level of ΔS_water
+    assert np.max(np.abs(single - exact) / (4180 * u)) < 1e-6
+
+def test_mixing_entropy_nonnegative(chapters):
+    T1 = np.float32(300.0) + np.arange(1000, dtype=np.float32) * np.float32(1e-4)
+    dS, Tf = chapters['chapter2_entropy'].problem_1060(T1, np.float32(300.0), 1.0, 12.47,
+                                                       precision='float32')
+    assert np.all(dS >= 0) and dS.dtype == np.float32
+
+def test_joule_thomson_near_inversion(chapters):
+    a, b = 0.1408, 3.913e-5
+    T = 2 * a / (8.314 * b) * (1 + np.linspace(-1e-3, 1e-3, 101))
+    T = T[np.abs(T / (2*a/(8.314*b)) - 1) > 1e-5].astype(np.float32)
+    exact = (2*a/(8.314*T.astype(np.float64)) - b) / 29.1
+    f = chapters['chapter3_functions'].joule_thomson_vdw
+    mixed = f(a, b, 29.1, T, None, precision='mixed')
+    assert np.max(np.abs(mixed / exact - 1)) < 1e-2
+
+#=============================================================================
+# Policy Selection
+#=============================================================================
+def test_no_policy_is_passthrough(chapters):
+    f = chapters['chapter2_entropy'].problem_1039
+    assert f(273, 1000, 50) == f.__wrapped__(273, 1000, 50)
+    assert isinstance(f(273.0, 1000.0, 50.0), float)
+
+def test_global_and_per_call_policy(chapters):
+    f = chapters['chapter3_functions'].scale_height
+    try:
+        set_precision('float32')
+        assert f(288.0, 0.029).dtype == np.float32
+        assert f(288.0, 0.029, precision='float64').dtype == np.float64
+        with use_precision('float64'):
+            assert get_precision() == 'float64'
+            assert f(288.0, 0.029).dtype == np.float64
+        assert get_precision() == 'float32'
+    finally:
+        set_precision(None)
+    assert get_precision() is None
+
+def test_unknown_policy(chapters):
+    with pytest.raises(ValueError):
+        chapters['chapter3_functions'].scale_height(288.0, 0.029, precision='float16')
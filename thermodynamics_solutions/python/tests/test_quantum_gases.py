@@ -0,0 +1,85 @@
+"""Fermi-Dirac and Bose-Einstein integrals against quadrature, inverses and gas limits."""
+
+import numpy as np
+import pytest
+from scipy.integrate import quad
+from scipy.special import gamma, zeta
+
+import quantum_gases as qg
+
+def _be_quad(s, alpha):
+    """g_s(e^{-α}) = 1/Γ(s) ∫ t^{s-1}/(e^{t+α} - 1) dt, in u = √t."""
+    def integrand(u):
+        return 2 * u**(2 * s - 1) / np.expm1(u * u + alpha)
+    return quad(integrand, 0.0, np.sqrt(alpha + 60.0), epsabs=0, epsrel=1e-12,
+                limit=200)[0] / gamma(s)
+
+#=============================================================================
+# Fermi-Dirac
+#=============================================================================
+@pytest.mark.parametrize('j', [-0.5, 0.5, 1.5])
+def test_fermi_dirac_matches_quadrature_in_every_region(j):
+    # series, both sides of each region edge, Chebyshev pieces, Sommerfeld
+    eta = np.array([-20.0, -2.0001, -2.0, -1.0, 0.0, 3.7, 10.0, 29.99, 30.0, 45.0, 100.0])
+    reference = np.array([qg._fd_quad(j, e) for e in eta])
+    np.testing.assert_allclose(qg.fermi_dirac(j, eta), reference, rtol=1e-12)
+
+def test_fermi_dirac_order_zero_closed_form():
+    eta = np.linspace(-30.0, 30.0, 601)
+    np.testing.assert_allclose(qg.fermi_dirac(0, eta), np.log1p(np.exp(eta)), rtol=1e-12)
+
+@pytest.mark.parametrize('j', [0, 0.5, 1.5])
+def test_inverse_fermi_dirac_round_trip(j):
+    eta = np.linspace(-30.0, 300.0, 2001)
+    back = qg.inverse_fermi_dirac(j, qg.fermi_dirac(j, eta))
+    np.testing.assert_allclose(back, eta, rtol=1e-12, atol=1e-12)
+
+def test_inverse_fermi_dirac_rejects_negative_order():
+    with pytest.raises(ValueError):
+        qg.inverse_fermi_dirac(-0.5, 1.0)
+
+#=============================================================================
+# Bose-Einstein
+#=============================================================================
+@pytest.mark.parametrize('s', [1.5, 2.5])
+def test_bose_einstein_matches_quadrature(s):
+    alpha = np.array([1e-6, 0.01, 0.5, 1.999, 2.0, 5.0, 20.0])
+    reference = np.array([_be_quad(s, a) for a in alpha])
+    np.testing.assert_allclose(qg.bose_einstein(s, alpha), reference, rtol=1e-10)
+
+def test_bose_einstein_at_condensation_is_zeta():
+    assert qg.bose_einstein(1.5, 0.0) == pytest.approx(zeta(1.5), rel=1e-14)
+    assert qg.bose_einstein(2.5, 0.0) == pytest.approx(zeta(2.5), rel=1e-14)
+
+@pytest.mark.parametrize('s', [1.5, 2.5])
+def test_inverse_bose_einstein_round_trip(s):
+    alpha = np.geomspace(1e-6, 38.0, 1001)
+    back = qg.inverse_bose_einstein(s, qg.bose_einstein(s, alpha))
+    np.testing.assert_allclose(back, alpha, rtol=1e-9)
+
+def test_inverse_bose_einstein_condensed_phase():
+    g = np.array([zeta(1.5), 3.0, 10.0])
+    assert np.array_equal(qg.inverse_bose_einstein(1.5, g), np.zeros(3))
+
+#=============================================================================
+# Ideal Quantum Gases
+#=============================================================================
+def test_cold_fermi_gas_sits_at_the_fermi_energy():
+    n = 8.5e28   # conduction electrons in copper
+    r = qg.fermi_gas(n, 1.0)
+    E_F = qg.fermi_energy(n)
+    assert r['mu'] == pytest.approx(E_F, rel=1e-9)
+    # degenerate pressure P = (2/5) n E_F
+    assert r['pressure'] == pytest.approx(0.4 * n * E_F, rel=1e-9)
+
+def test_hot_fermi_gas_is_classical():
+    r = qg.fermi_gas(1e20, 1e4)
+    assert r['pressure'] == pytest.approx(1e20 * qg.k_B * 1e4, rel=1e-6)
+
+def test_bose_condensate_fraction_below_T_c():
+    n = 2.2e28
+    T_c = qg.bose_condensation_temperature(n)
+    T = T_c * np.array([0.2, 0.5, 0.9, 1.5])
+    fraction = qg.bose_gas(n, T)['condensate_fraction']
+    expected = np.maximum(1 - (T / T_c)**1.5, 0.0)
+    np.testing.assert_allclose(fraction, expected, rtol=1e-9, atol=1e-12)
@@ -0,0 +1,93 @@
+"""Checkpointed sweeps resume after an interruption and give the uninterrupted result."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import result_store
+from result_store import create_store, open_store, param_grid, row_mask, run_sweep
+
+GRID = param_grid(x=np.linspace(0.0, 1.0, 37), y=np.linspace(-2.0, 2.0, 29))
+CHUNK = 100
+N_CHUNKS = -(-GRID['x'].size // CHUNK)
+
+def sweep(x, y):
+    return {'f': np.sin(x) * y, 'g': np.stack([x + y, x * y], axis=-1)}
+
+def _assert_complete(path):
+    store = open_store(path)
+    expected = sweep(GRID['x'], GRID['y'])
+    assert np.array_equal(store['f'], expected['f'])
+    assert np.array_equal(store['g'], expected['g'])
+
+def test_resume_after_an_exception_skips_finished_chunks(tmp_path):
+    calls = []
+
+    def flaky(x, y):
+        calls.append(x.size)
+        if len(calls) == 4:
+            raise RuntimeError('pre-empted')
+        return sweep(x, y)
+
+    with pytest.raises(RuntimeError):
+        run_sweep(tmp_path, flaky, GRID, chunk_size=CHUNK)
+    assert result_store.read_manifest(tmp_path)['done'] == [0, 1, 2]
+    assert row_mask(tmp_path).sum() == 3 * CHUNK
+    with pytest.raises(ValueError, match='3/'):
+        open_store(tmp_path)
+    assert np.array_equal(open_store(tmp_path, partial=True)['f'][:3 * CHUNK],
+                          sweep(GRID['x'], GRID['y'])['f'][:3 * CHUNK])
+
+    calls.clear()
+    status = run_sweep(tmp_path, sweep, GRID, chunk_size=CHUNK)
+    assert status == {'done': N_CHUNKS, 'n_chunks': N_CHUNKS, 'complete': True}
+    _assert_complete(tmp_path)
+
+def test_resume_after_the_process_is_killed(tmp_path):
+    """The sweeping process exits abruptly inside chunk 5, as a pre-empted job would."""
+    here = Path(result_store.__file__).resolve().parent
+    script = (
+        "import os, sys, numpy as np\n"
+        f"sys.path[:0] = [{str(here)!r}, {str(Path(__file__).parent)!r}]\n"
+        "from result_store import run_sweep\n"
+        "from test_result_store import GRID, CHUNK, sweep\n"
+        "def killed(x, y, calls=[]):\n"
+        "    calls.append(1)\n"
+        "    if len(calls) == 6:\n"
+        "        os._exit(9)\n"
+        "    return sweep(x, y)\n"
+        f"run_sweep({str(tmp_path)!r}, killed, GRID, chunk_size=CHUNK)\n")
+    run = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True)
+    assert run.returncode == 9, run.stderr
+    assert result_store.read_manifest(tmp_path)['done'] == [0, 1, 2, 3, 4]
+
+    evaluated = []
+
+    def counting(x, y):
+        evaluated.append(x.size)
+        return sweep(x, y)
+
+    run_sweep(tmp_path, counting, GRID, chunk_size=CHUNK)
+    assert len(evaluated) == N_CHUNKS - 5
+    _assert_complete(tmp_path)
+
+def test_max_chunks_time_boxes_a_run(tmp_path):
+    for done in (4, 8, N_CHUNKS):
+        status = run_sweep(tmp_path, sweep, GRID, chunk_size=CHUNK, max_chunks=4)
+        assert status['done'] == done
+    assert status['complete']
+    _assert_complete(tmp_path)
+
+def test_reopening_a_different_sweep_needs_overwrite(tmp_path):
+    run_sweep(tmp_path, sweep, GRID, chunk_size=CHUNK)
+    other = param_grid(x=np.linspace(0.0, 1.0, 5), y=np.linspace(-2.0, 2.0, 3))
+    with pytest.raises(ValueError, match='overwrite=True'):
+        run_sweep(tmp_path, sweep, other, chunk_size=CHUNK)
+    with pytest.raises(ValueError, match='overwrite=True'):
+        create_store(tmp_path, GRID, CHUNK, job={'func': 'other'})
+    status = run_sweep(tmp_path, sweep, other, chunk_size=CHUNK, overwrite=True)
+    assert status['complete']
+    assert open_store(tmp_path)['f'].size == 15
@@ -0,0 +1,83 @@
+"""shared_map equals a direct call, and its shared-memory segments are released."""
+
+import gc
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+import shared_pool
+from chapter1_first_law import problem_1024
+from chapter3_functions import adiabatic_atmosphere, isothermal_atmosphere
+from shared_pool import as_shared, shared_empty, shared_map
+
+N = 10_007   # not a multiple of the block size
+
+@pytest.fixture(scope='module')
+def pool():
+    with shared_pool.shared_pool(2) as pool:
+        yield pool
+
+def _unlinked(names):
+    gc.collect()
+    for name in names:
+        assert name not in shared_pool._segments
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=name)
+    return True
+
+def test_array_result_equals_direct_call(pool):
+    z = np.linspace(0.0, 30e3, N)
+    fixed = {'p0': 101325.0, 'T0': 288.0, 'mu': 0.029}
+    p = shared_map(isothermal_atmosphere, {'z': z}, fixed, pool=pool)
+    assert np.array_equal(p, isothermal_atmosphere(z, **fixed))
+    assert shared_pool._describe(p) is not None
+
+def test_tuple_and_dict_results_equal_direct_call(pool):
+    z, T0 = np.linspace(0.0, 15e3, N), np.linspace(250.0, 320.0, N)
+    fixed = {'p0': 101325.0, 'mu': 0.029, 'gamma': 1.4}
+    p, T, dTdz = shared_map(adiabatic_atmosphere, {'z': z, 'T0': T0}, fixed,
+                            outputs=['p', 'T', 'dTdz'], pool=pool, block=1000)
+    ref = adiabatic_atmosphere(z, 101325.0, T0, 0.029, 1.4)
+    assert np.array_equal(p, ref[0]) and np.array_equal(T, ref[1])
+    assert np.all(dTdz == ref[2])
+
+    T1, T2 = np.linspace(4.0, 77.0, N), np.linspace(200.0, 400.0, N)
+    shields = shared_map(problem_1024, {'T1': T1, 'T2': T2}, {'R_reflectivity': 0.9},
+                         pool=pool)
+    ref = problem_1024(T1, T2, 0.9)
+    assert shields.keys() == ref.keys()
+    assert all(np.array_equal(shields[k], ref[k]) for k in ref)
+
+def test_rows_with_trailing_axes(pool):
+    z = np.linspace(0.0, 30e3, N * 3).reshape(N, 3)
+    fixed = {'p0': 101325.0, 'T0': 288.0, 'mu': 0.029}
+    p = shared_map(isothermal_atmosphere, {'z': z}, fixed, pool=pool)
+    assert p.shape == (N, 3)
+    assert np.array_equal(p, isothermal_atmosphere(z, **fixed))
+
+def test_shared_inputs_are_not_copied():
+    z = shared_empty(N)
+    assert as_shared(z) is z
+    assert np.shares_memory(as_shared(z[10:]), z)
+    assert shared_pool._describe(as_shared(np.zeros(3))) is not None
+
+def test_segments_are_released_with_their_arrays(pool):
+    before = set(shared_pool._segments)
+    z = shared_empty(N)
+    z[:] = np.linspace(0.0, 30e3, N)
+    p = shared_map(isothermal_atmosphere, {'z': z, 'T0': np.full(N, 288.0)},
+                   {'p0': 101325.0, 'mu': 0.029}, pool=pool)
+    names = [shared_pool._describe(a)[0] for a in (z, p)]
+    # the copy of the T0 input was dropped when shared_map returned
+    gc.collect()
+    assert set(shared_pool._segments) - before == set(names)
+    del z, p
+    assert _unlinked(names)
+    shared_pool._reap()
+    assert not shared_pool._closing
+
+def test_mismatched_rows_raise(pool):
+    with pytest.raises(ValueError):
+        shared_map(isothermal_atmosphere, {'z': np.zeros(4), 'T0': np.zeros(5)},
+                   {'p0': 1.0, 'mu': 0.029}, pool=pool)
@@ -0,0 +1,44 @@
+"""Steam tables interpolate each phase on its own side of the saturation line."""
+
+import numpy as np
+import pytest
+
+import steam_tables
+
+@pytest.fixture(scope='module')
+def table(tmp_path_factory):
+    return steam_tables.ideal_steam_table(str(tmp_path_factory.mktemp('steam') / 'ideal.tbl'))
+
+@pytest.mark.parametrize('p', [1e5, 1e6, 5e6])
+@pytest.mark.parametrize('dT', [0.5, -0.5, 10.0, -10.0])
+def test_states_next_to_saturation_keep_their_phase(table, p, dT):
+    T = steam_tables.saturation_properties(table, p)['T_sat'] + dT
+    phase = 'g' if dT > 0 else 'f'
+    r = steam_tables.steam_properties(table, T, p)
+    # The ideal table's enthalpy does not depend on pressure in either phase
+    assert r['h'] == pytest.approx(np.interp(T, table['T_sat'], table['h' + phase]), rel=1e-9)
+
+def test_superheated_entropy_follows_the_ideal_gas(table):
+    p = np.array([1e5, 1e6, 5e6])
+    T = steam_tables.saturation_properties(table, p)['T_sat'] + 0.5
+    s = steam_tables.steam_properties(table, T, p)['s']
+    p_sat = np.exp(np.interp(T, table['T_sat'], table['ln_p_sat']))
+    s_ideal = np.interp(T, table['T_sat'], table['sg']) - steam_tables.R_w * np.log(p / p_sat)
+    np.testing.assert_allclose(s, s_ideal, rtol=1e-9)
+
+def test_isentropic_exhaust_recovers_the_entropy(table):
+    s_in = steam_tables.steam_properties(table, 700.0, 2e6)['s']
+    p_out = np.array([2e5, 5e5, 1e6])
+    T, h = steam_tables._isentropic_state(table, p_out, np.full(3, s_in))
+    r = steam_tables.steam_properties(table, T, p_out)
+    np.testing.assert_allclose(r['s'], s_in, rtol=1e-6)
+    np.testing.assert_allclose(r['h'], h, rtol=1e-6)
+
+@pytest.mark.parametrize('T, p', [(200.0, 1e5), (1000.0, 1e5), (400.0, 10.0), (400.0, 1e9)])
+def test_out_of_range_state_points_raise(table, T, p):
+    with pytest.raises(ValueError, match='outside the table range'):
+        steam_tables.steam_properties(table, T, p)
+
+def test_out_of_range_saturation_pressure_raises(table):
+    with pytest.raises(ValueError, match='outside the table range'):
+        steam_tables.saturation_properties(table, 1e9)
@@ -0,0 +1,250 @@
+"""
+Van der Waals Liquid-Vapour Coexistence
+Vectorized Maxwell equal-area construction - Python Computational Solutions
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from chapter3_functions import R
+
+# Van der Waals constants for nitrogen
+a_N2 = 0.1408      # Pa·m⁶/mol²
+b_N2 = 3.913e-5    # m³/mol
+
+#=============================================================================
+# Critical Point and Reduced Equation of State
+#=============================================================================
+def vdw_critical_point(a, b):
+    """
+    Critical constants of a Van der Waals gas.
+
+    Parameters:
+        a: attraction constant (Pa·m⁶/mol²)
+        b: excluded volume (m³/mol)
+
+    Returns:
+        T_c (K), p_c (Pa), v_c (m³/mol)
+    """
+    return 8 * a / (27 * R * b), a / (27 * b**2), 3 * b
+
+def vdw_reduced_pressure(T_r, v_r):
+    """Reduced Van der Waals isotherm p_r = 8T_r/(3v_r - 1) - 3/v_r²."""
+    return 8 * T_r / (3 * v_r - 1) - 3 / v_r**2
+
+def _cubic_roots(c2, c1, c0):
+    """
+    Sorted real roots of x³ + c2 x² + c1 x + c0 = 0 for arrays of cubics
+    that all have three real roots (trigonometric form, no iteration).
+    """
+    q = (c2**2 - 3 * c1) / 9
+    r = (2 * c2**3 - 9 * c2 * c1 + 27 * c0) / 54
+    sq = np.sqrt(np.maximum(q, 0.0))
+    cos_arg = np.clip(r / np.maximum(sq**3, np.finfo(float).tiny), -1.0, 1.0)
+    theta = np.arccos(cos_arg)
+    roots = [-2 * sq * np.cos((theta + 2 * np.pi * k) / 3) - c2 / 3 for k in (0, 1, 2)]
+    return np.sort(np.stack(roots), axis=0)
+
+def vdw_spinodals(T_r):
+    """
+    Reduced spinodal volumes, where (∂p/∂v)_T = 0 on a subcritical isotherm.
+
+    Parameters:
+        T_r: reduced temperatures (< 1)
+
+    Returns:
+        v_liquid, v_gas: reduced spinodal volumes
+    """
+    T_r = np.asarray(T_r, dtype=np.float64)
+    # 4T v³ - 9v² + 6v - 1 = 0; the smallest root lies below v = 1/3
+    _, v_l, v_g = _cubic_roots(-9 / (4 * T_r), 6 / (4 * T_r), -1 / (4 * T_r))
+    return v_l, v_g
+
+#=============================================================================
+# Maxwell Equal-Area Construction
+#=============================================================================
+def _isobar_volumes(T_r, p_r):
+    """
+    Liquid and gas roots of p_r = p(T_r, v_r), i.e. of
+    3p v³ - (p + 8T) v² + 9v - 3 = 0.
+
+    The gas root is the dominant trigonometric root. Dividing it out
+    using the low-order coefficients leaves a well-conditioned quadratic
+    for the liquid root, which stays accurate at low T where the roots
+    differ by many orders of magnitude.
+    """
+    v_g = _cubic_roots(-(p_r + 8 * T_r) / (3 * p_r), 3 / p_r, -1 / p_r)[2]
+    # One Newton polish of the gas root on the unnormalized cubic
+    f = ((3 * p_r * v_g - (p_r + 8 * T_r)) * v_g + 9) * v_g - 3
+    df = (9 * p_r * v_g - 2 * (p_r + 8 * T_r)) * v_g + 9
+    v_g = v_g - f / df
+    # Quotient α v² + β v + γ of the cubic by (v - v_g)
+    gamma = 3 / v_g
+    beta = (gamma - 9) / v_g
+    alpha = (beta + p_r + 8 * T_r) / v_g
+    disc = np.sqrt(np.maximum(beta**2 - 4 * alpha * gamma, 0.0))
+    v_l = 2 * gamma / (-beta + disc)
+    return v_l, v_g
+
+def _area_residual(T_r, p_r, v_l, v_g):
+    """∫ p dv - p Δv between the outer roots; zero at coexistence."""
+    integral = (8 * T_r / 3 * np.log((3 * v_g - 1) / (3 * v_l - 1))
+                + 3 / v_g - 3 / v_l)
+    return integral - p_r * (v_g - v_l)
+
+def maxwell_construction(T_r, tol=1e-13, max_iter=60):
+    """
+    Solve the equal-area construction for many reduced temperatures at once.
+
+    For a trial pressure between the spinodal pressures the isobar cuts
+    the isotherm at three volumes (closed-form cubic roots). The area
+    residual g(p) is monotone with exact derivative dg/dp = -(v_g - v_l),
+    so a Newton step in ln p, safeguarded by a shrinking bisection
+    bracket, converges for every temperature in lockstep.
+
+    Parameters:
+        T_r: reduced temperatures, 0 < T_r < 1
+        tol: relative tolerance on the saturation pressure
+        max_iter: iteration cap
+
+    Returns:
+        dict with reduced saturation pressure p_r, coexisting volumes
+        v_liquid / v_gas, and spinodal volumes / pressures
+    """
+    T_r = np.asarray(T_r, dtype=np.float64)
+    shape = T_r.shape
+    T_r = T_r.ravel()
+    if np.any((T_r <= 0) | (T_r >= 1)):
+        raise ValueError("Maxwell construction needs 0 < T_r < 1")
+
+    s_l, s_g = vdw_spinodals(T_r)
+    p_spin_l = vdw_reduced_pressure(T_r, s_l)
+    p_spin_g = vdw_reduced_pressure(T_r, s_g)
+
+    # Iterate on ln p: the bracket can span many decades at low T
+    lo = np.log(np.maximum(p_spin_l, 1e-30 * p_spin_g))
+    hi = np.log(p_spin_g)
+    x = 0.5 * (lo + hi)
+
+    for _ in range(max_iter):
+        p = np.exp(x)
+        v_l, v_g = _isobar_volumes(T_r, p)
+        g = _area_residual(T_r, p, v_l, v_g)
+        # g decreases with p: positive residual means p is too low
+        lo = np.where(g > 0, x, lo)
+        hi = np.where(g > 0, hi, x)
+        x_new = x + g / (p * (v_g - v_l))
+        outside = (x_new <= lo) | (x_new >= hi)
+        x_new = np.where(outside, 0.5 * (lo + hi), x_new)
+        active = np.abs(x_new - x) > tol
+        x = x_new
+        if not np.any(active):
+            break
+
+    p = np.exp(x)
+    v_l, v_g = _isobar_volumes(T_r, p)
+    return {
+        'T_r': T_r.reshape(shape), 'p_r': p.reshape(shape),
+        'v_liquid': v_l.reshape(shape), 'v_gas': v_g.reshape(shape),
+        'v_spinodal_liquid': s_l.reshape(shape), 'v_spinodal_gas': s_g.reshape(shape),
+        'p_spinodal_liquid': p_spin_l.reshape(shape),
+        'p_spinodal_gas': p_spin_g.reshape(shape)
+    }
+
+@lru_cache(maxsize=8)
+def reduced_coexistence_table(n=4096, T_r_min=0.4):
+    """
+    Cached reduced-variable coexistence table shared by every substance.
+
+    The Van der Waals equation has a single reduced form, so one table
+    serves all (a, b); the returned arrays are read-only.
+
+    Parameters:
+        n: number of reduced temperatures
+        T_r_min: lowest reduced temperature
+
+    Returns:
+        dict as returned by maxwell_construction
+    """
+    T_r = np.linspace(T_r_min, 1.0, n + 1)[:-1]
+    table = maxwell_construction(T_r)
+    for column in table.values():
+        column.setflags(write=False)
+    return table
+
+#=============================================================================
+# Substance-Level Phase Diagrams
+#=============================================================================
+def _to_physical(reduced, a, b):
+    """Scale a reduced coexistence result to SI units for constants a, b."""
+    T_c, p_c, v_c = vdw_critical_point(a, b)
+    return {
+        'T': reduced['T_r'] * T_c,
+        'p_sat': reduced['p_r'] * p_c,
+        'v_liquid': reduced['v_liquid'] * v_c,
+        'v_gas': reduced['v_gas'] * v_c,
+        'v_spinodal_liquid': reduced['v_spinodal_liquid'] * v_c,
+        'v_spinodal_gas': reduced['v_spinodal_gas'] * v_c,
+        'p_spinodal_liquid': reduced['p_spinodal_liquid'] * p_c,
+        'p_spinodal_gas': reduced['p_spinodal_gas'] * p_c,
+        'T_c': T_c, 'p_c': p_c, 'v_c': v_c
+    }
+
+def vdw_coexistence(T, a, b):
+    """
+    Coexistence properties of a Van der Waals fluid at given temperatures.
+
+    Parameters:
+        T: temperatures (K), below the critical temperature
+        a, b: Van der Waals constants
+
+    Returns:
+        dict with saturation pressure (Pa), coexisting and spinodal molar
+        volumes (m³/mol), spinodal pressures and the critical constants
+    """
+    T_c, _, _ = vdw_critical_point(a, b)
+    return _to_physical(maxwell_construction(np.asarray(T) / T_c), a, b)
+
+def vdw_phase_diagram(a, b, n=4096, T_r_min=0.4):
+    """
+    Full coexistence curve and spinodals for one substance, scaled from
+    the cached reduced table (no solve after the first call).
+
+    Parameters:
+        a, b: Van der Waals constants
+        n, T_r_min: resolution of the shared reduced table
+
+    Returns:
+        dict as returned by vdw_coexistence
+    """
+    return _to_physical(reduced_coexistence_table(n, T_r_min), a, b)
+
+#=============================================================================
+# Main Execution
+#=============================================================================
+if __name__ == "__main__":
+    import time
+
+    print("=" * 60)
+    print("Van der Waals Coexistence: Nitrogen")
+    print("=" * 60)
+    T_c, p_c, v_c = vdw_critical_point(a_N2, b_N2)
+    print(f"Critical point: T_c = {T_c:.1f} K, p_c = {p_c/1e6:.2f} MPa, "
+          f"v_c = {v_c*1e6:.1f} cm³/mol")
+
+    r = vdw_coexistence(77.35, a_N2, b_N2)
+    print(f"At 77.35 K: p_sat = {r['p_sat']/1000:.1f} kPa, "
+          f"v_l = {r['v_liquid']*1e6:.1f} cm³/mol, v_g = {r['v_gas']*1e3:.2f} L/mol")
+
+    start = time.perf_counter()
+    reduced_coexistence_table()
+    elapsed = time.perf_counter() - start
+    print(f"Reduced table (4096 temperatures) solved in {elapsed*1000:.1f} ms")
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        vdw_phase_diagram(a_N2 * np.random.uniform(0.5, 2), b_N2)
+    elapsed = time.perf_counter() - start
+    print(f"1000 substance phase diagrams from the cached table: {elapsed*1000:.1f} ms")
+    print()